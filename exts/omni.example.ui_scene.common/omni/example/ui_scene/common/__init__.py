@@ -0,0 +1,89 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+import importlib
+
+# Kit looks for the IExt in the attributes of the module, so it's not lazy
+from .extension import CommonExtension
+
+# Name -> the module that defines it. The modules are imported on the first
+# use of the name, so enabling the extension doesn't import USD, and every
+# sample only imports what it uses.
+_MODULES = {
+    "get_authored_extent": "bounds",
+    "compute_authored_world_range": "bounds",
+    "compute_world_range": "bounds",
+    "DEFAULT_PURPOSES": "bounds",
+    "GestureEvent": "gesture_recorder",
+    "GestureRecording": "gesture_recorder",
+    "GestureReplayer": "gesture_recorder",
+    "ReplayReport": "gesture_recorder",
+    "record_gesture": "gesture_recorder",
+    "start_gesture_recording": "gesture_recorder",
+    "stop_gesture_recording": "gesture_recorder",
+    "GestureLatency": "gesture_latency",
+    "begin_gesture_event": "gesture_latency",
+    "get_correlation_id": "gesture_latency",
+    "get_gesture_latency": "gesture_latency",
+    "gesture_stage": "gesture_latency",
+    "mark_gesture_stage": "gesture_latency",
+    "resume_gesture_event": "gesture_latency",
+    "CallStats": "instrumentation",
+    "Instrumentation": "instrumentation",
+    "get_instrumentation": "instrumentation",
+    "instrumented": "instrumentation",
+    "span": "instrumentation",
+    "trace_args": "instrumentation",
+    "trace_item": "instrumentation",
+    "PrototypeBoundCache": "instancing",
+    "get_prototype": "instancing",
+    "is_prototype_path": "instancing",
+    "range_corners": "instancing",
+    "transform_ranges": "instancing",
+    "ChangeSet": "notice_hub",
+    "NoticeHub": "notice_hub",
+    "PathSet": "notice_hub",
+    "SubscriberStats": "notice_hub",
+    "get_notice_hub": "notice_hub",
+    "PointInstancerBounds": "point_instancer",
+    "format_instance_path": "point_instancer",
+    "parse_instance_path": "point_instancer",
+    "quaternions_to_matrices": "point_instancer",
+    "PrimHandle": "prim_handle",
+    "is_resynced": "prim_handle",
+    "resolve_resynced_path": "prim_handle",
+    "ProfilerCapture": "profiler",
+    "get_profiler_capture": "profiler",
+    "start_profiler_capture": "profiler",
+    "stop_profiler_capture": "profiler",
+    "SceneQuery": "scene_query",
+    "get_scene_query": "scene_query",
+    "SceneNode": "scene_snapshot",
+    "SceneRecorder": "scene_snapshot",
+    "SceneSnapshot": "scene_snapshot",
+    "snapshot_build": "scene_snapshot",
+    "SelectionSnapshot": "selection",
+    "SelectionAdapter": "selection_adapter",
+    "SelectionDelta": "selection_adapter",
+    "get_selection_adapter": "selection_adapter",
+    "SelectionTrigger": "selection_trigger",
+    "ViewportTracker": "viewport_tracker",
+}
+
+__all__ = ["CommonExtension"]
+__all__ += list(_MODULES)
+
+
+def __getattr__(name: str):
+    module_name = _MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # The next time it's a regular attribute
+    globals()[name] = value
+    return value
@@ -0,0 +1,131 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+__all__ = ["get_authored_extent", "compute_authored_world_range", "compute_world_range", "DEFAULT_PURPOSES"]
+
+from typing import Optional, Sequence
+import math
+
+from pxr import Gf
+from pxr import Usd
+from pxr import UsdGeom
+
+# The purposes the samples are interested in
+DEFAULT_PURPOSES = (UsdGeom.Tokens.default_,)
+
+
+def _is_valid_extent(extent) -> bool:
+    """True if the extent is a pair of finite points and min <= max"""
+    if extent is None or len(extent) < 2:
+        return False
+    bbox_min, bbox_max = extent[0], extent[1]
+    for i in range(3):
+        if not math.isfinite(bbox_min[i]) or not math.isfinite(bbox_max[i]) or bbox_min[i] > bbox_max[i]:
+            return False
+    return True
+
+
+def _get_extents_hint(prim: Usd.Prim, time: Usd.TimeCode, purposes: Sequence[str]) -> Optional[Gf.Range3d]:
+    """The union of the extentsHint of the requested purposes"""
+    attr = UsdGeom.ModelAPI(prim).GetExtentsHintAttr()
+    if not attr or not attr.HasAuthoredValue():
+        return None
+
+    extents_hint = attr.Get(time)
+    if not extents_hint:
+        return None
+
+    # extentsHint has a pair of points for each purpose in this order. The
+    # trailing purposes with no geometry can be omitted.
+    range = None
+    for i, purpose in enumerate(UsdGeom.Imageable.GetOrderedPurposeTokens()):
+        if purpose not in purposes:
+            continue
+        extent = extents_hint[i * 2:i * 2 + 2]
+        if not _is_valid_extent(extent):
+            continue
+        purpose_range = Gf.Range3d(Gf.Vec3d(extent[0]), Gf.Vec3d(extent[1]))
+        range = purpose_range if range is None else range.UnionWith(purpose_range)
+
+    return range
+
+
+def _get_extent(prim: Usd.Prim, time: Usd.TimeCode) -> Optional[Gf.Range3d]:
+    """The authored extent of a Boundable"""
+    if not prim.IsA(UsdGeom.Boundable):
+        return None
+
+    attr = UsdGeom.Boundable(prim).GetExtentAttr()
+    if not attr or not attr.HasAuthoredValue():
+        return None
+
+    extent = attr.Get(time)
+    if not _is_valid_extent(extent):
+        return None
+
+    return Gf.Range3d(Gf.Vec3d(extent[0]), Gf.Vec3d(extent[1]))
+
+
+def get_authored_extent(
+    prim: Usd.Prim, time: Usd.TimeCode, purposes: Sequence[str] = DEFAULT_PURPOSES
+) -> Optional[Gf.Range3d]:
+    """
+    Returns the bound of the prim in its local space when it's authored,
+    otherwise None. It never traverses the children.
+
+    `extentsHint` is preferred because it covers the whole subtree of the
+    model, and `extent` of a Boundable is the fallback.
+    """
+    range = _get_extents_hint(prim, time, purposes)
+    if range is not None:
+        return range
+
+    return _get_extent(prim, time)
+
+
+def compute_authored_world_range(
+    prim: Usd.Prim,
+    time: Usd.TimeCode,
+    xform_cache: Optional[UsdGeom.XformCache] = None,
+    purposes: Sequence[str] = DEFAULT_PURPOSES,
+) -> Optional[Gf.Range3d]:
+    """
+    Returns the world axis-aligned bound of the prim from its authored extent,
+    or None when it's not authored. It doesn't load payloads.
+    """
+    local_range = get_authored_extent(prim, time, purposes)
+    if local_range is None:
+        return None
+
+    if xform_cache:
+        world_xform = xform_cache.GetLocalToWorldTransform(prim)
+    else:
+        world_xform = UsdGeom.Imageable(prim).ComputeLocalToWorldTransform(time)
+
+    return Gf.BBox3d(local_range, world_xform).ComputeAlignedRange()
+
+
+def compute_world_range(
+    prim: Usd.Prim,
+    time: Usd.TimeCode,
+    bbox_cache: Optional[UsdGeom.BBoxCache] = None,
+    purposes: Sequence[str] = DEFAULT_PURPOSES,
+) -> Gf.Range3d:
+    """
+    Returns the world axis-aligned bound of the prim. The authored extent is
+    used when it's present and valid, and the full traversal of the subtree
+    only when it's absent.
+    """
+    range = compute_authored_world_range(prim, time, purposes=purposes)
+    if range is not None:
+        return range
+
+    if not bbox_cache:
+        bbox_cache = UsdGeom.BBoxCache(time, includedPurposes=list(purposes))
+
+    return bbox_cache.ComputeWorldBound(prim).ComputeAlignedRange()
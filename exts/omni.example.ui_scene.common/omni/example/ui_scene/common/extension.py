@@ -0,0 +1,33 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+__all__ = ["CommonExtension"]
+
+import sys
+
+import omni.ext
+
+# The modules with the shared objects, in the order they are destroyed. The
+# adapters and the queries are destroyed before the hubs they subscribe to.
+_SHARED_MODULES = ["selection_adapter", "scene_query", "notice_hub", "gesture_latency", "instrumentation"]
+
+
+class CommonExtension(omni.ext.IExt):
+    """Destroys the objects shared by the samples when the extension is shutting down"""
+
+    def on_startup(self, ext_id: str) -> None:
+        pass
+
+    def on_shutdown(self) -> None:
+        """Called when the extension is shutting down."""
+        # Only the modules that were used, so USD is not imported here
+        package = __name__.rpartition(".")[0]
+        for module_name in _SHARED_MODULES:
+            module = sys.modules.get(f"{package}.{module_name}")
+            if module is not None:
+                module._shutdown()
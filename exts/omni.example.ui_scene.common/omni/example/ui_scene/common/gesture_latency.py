@@ -0,0 +1,308 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+__all__ = [
+    "GestureLatency",
+    "begin_gesture_event",
+    "get_correlation_id",
+    "get_gesture_latency",
+    "gesture_stage",
+    "mark_gesture_stage",
+    "resume_gesture_event",
+]
+
+from collections import deque
+from typing import Callable, Dict, Iterable, Optional
+import functools
+import math
+import time
+
+import carb
+import carb.settings
+
+from .instrumentation import trace_args
+from .profiler import count_gesture_event
+
+SETTING_ENABLED = "/exts/omni.example.ui_scene.common/instrumentation/gesture_latency"
+
+# The stages in the order they happen
+INPUT = "input"
+WRITE = "write"
+NOTICE = "notice"
+MODEL_UPDATED = "model_updated"
+REDRAW = "redraw"
+FRAME = "frame"
+STAGES = (INPUT, WRITE, NOTICE, MODEL_UPDATED, REDRAW, FRAME)
+
+# `mark_gesture_stage` and the gestures only check this flag when it's off
+_enabled = False
+
+
+class _Event:
+    __slots__ = ("id", "gesture_type", "stamps", "frames")
+
+    def __init__(self, correlation_id: int, gesture_type: str, start: float):
+        self.id = correlation_id
+        self.gesture_type = gesture_type
+        self.stamps: Dict[str, float] = {INPUT: start}
+        # The frames since the input
+        self.frames = 0
+
+
+class GestureLatency:
+    """
+    Follows every input event of the gestures to the frame that shows it.
+
+    `begin_gesture_event` gives the input event a correlation ID, and the
+    following stages are stamped with it:
+
+    - write: the model starts writing to USD
+    - notice: the NoticeHub gets the ObjectsChanged notice of the write
+    - model_updated: the manipulator gets `_item_changed` from the model
+    - redraw: the manipulator is rebuilt or updated
+    - frame: the next app update after the redraw, the frame is rendered
+
+    The event stays current until it's finished, so the stages that happen
+    later in the frame are stamped with the same ID. The work that is
+    deferred, like the scale of the widget info that is written on the next
+    frame, keeps the ID and calls `resume_gesture_event`.
+
+    The latency of a stage is the time from the previous stage. Write to
+    notice is USD, notice to redraw is Python, and redraw to frame is the
+    rendering. The last `window` values are kept per gesture type and stage.
+    The input events that are replaced by a newer one before they are
+    written are counted as coalesced, and the ones that are not redrawn in
+    `timeout_frames` frames are counted as incomplete.
+    """
+
+    INPUT = INPUT
+    WRITE = WRITE
+    NOTICE = NOTICE
+    MODEL_UPDATED = MODEL_UPDATED
+    REDRAW = REDRAW
+    FRAME = FRAME
+
+    def __init__(self, window: int = 1024, timeout_frames: int = 30):
+        self._window = window
+        self._timeout_frames = timeout_frames
+        self._next_id = 1
+        self._open: Dict[int, _Event] = {}
+        self._current: Optional[_Event] = None
+        # Gesture type -> stage -> the last latencies in seconds
+        self._latencies: Dict[str, Dict[str, deque]] = {}
+        # Gesture type -> "completed", "coalesced", "incomplete" -> count
+        self._counts: Dict[str, Dict[str, int]] = {}
+        self._update_sub = None
+
+    def destroy(self):
+        self._update_sub = None
+        self._open = {}
+        self._current = None
+
+    @property
+    def enabled(self) -> bool:
+        return _enabled
+
+    @enabled.setter
+    def enabled(self, value: bool):
+        carb.settings.get_settings().set(SETTING_ENABLED, bool(value))
+        _set_enabled(bool(value))
+
+    @property
+    def correlation_id(self) -> Optional[int]:
+        """The ID of the current event or None"""
+        return self._current.id if self._current else None
+
+    def begin(self, gesture_type: str) -> int:
+        """A new input event of the gesture, it's the current event now"""
+        now = time.perf_counter()
+        # The events that were never written are replaced by this one
+        for event in list(self._open.values()):
+            if event.gesture_type == gesture_type and WRITE not in event.stamps:
+                self._close(event, "coalesced")
+
+        event = _Event(self._next_id, gesture_type, now)
+        self._next_id += 1
+        self._open[event.id] = event
+        self._current = event
+        self._watch_frames()
+        trace_args(correlation_id=event.id)
+        return event.id
+
+    def resume(self, correlation_id: Optional[int]) -> bool:
+        """Make the event current again for the deferred stages. False if it's finished."""
+        event = self._open.get(correlation_id)
+        if event is None:
+            return False
+        self._current = event
+        return True
+
+    def mark(self, stage: str):
+        """Stamp the stage of the current event. Only the redraw is stamped again."""
+        event = self._current
+        if event is None or (stage in event.stamps and stage != REDRAW):
+            return
+        event.stamps[stage] = time.perf_counter()
+        trace_args(correlation_id=event.id)
+
+    def get_percentiles(self, percentiles: Iterable[float] = (50, 90, 99)) -> Dict[str, Dict[str, Dict[float, float]]]:
+        """Gesture type -> stage -> percentile -> latency in milliseconds"""
+        percentiles = list(percentiles)
+        result = {}
+        for gesture_type, stages in self._latencies.items():
+            result[gesture_type] = {}
+            for stage, values in stages.items():
+                ordered = sorted(values)
+                result[gesture_type][stage] = {p: _percentile(ordered, p) * 1000.0 for p in percentiles}
+        return result
+
+    def get_counts(self) -> Dict[str, Dict[str, int]]:
+        """Gesture type -> the number of the completed, coalesced and incomplete events"""
+        return {gesture_type: dict(counts) for gesture_type, counts in self._counts.items()}
+
+    def clear(self):
+        self._open = {}
+        self._current = None
+        self._latencies = {}
+        self._counts = {}
+
+    def end_frame(self):
+        """Finish the events that are redrawn. It's called on every app update."""
+        now = time.perf_counter()
+        for event in list(self._open.values()):
+            event.frames += 1
+            if REDRAW in event.stamps:
+                event.stamps[FRAME] = now
+                self._close(event, "completed")
+            elif event.frames > self._timeout_frames:
+                self._close(event, "incomplete")
+        if not self._open:
+            self._update_sub = None
+
+    def _close(self, event: _Event, result: str):
+        self._open.pop(event.id, None)
+        if self._current is event:
+            self._current = None
+        counts = self._counts.setdefault(event.gesture_type, {"completed": 0, "coalesced": 0, "incomplete": 0})
+        counts[result] += 1
+        if result != "completed":
+            return
+
+        stages = self._latencies.setdefault(event.gesture_type, {})
+        previous = event.stamps[INPUT]
+        for stage in STAGES[1:]:
+            stamp = event.stamps.get(stage)
+            if stamp is None:
+                # Like a redraw without a notice, when only the model changed
+                continue
+            stages.setdefault(stage, deque(maxlen=self._window)).append(stamp - previous)
+            previous = stamp
+        stages.setdefault("total", deque(maxlen=self._window)).append(event.stamps[FRAME] - event.stamps[INPUT])
+
+    def _watch_frames(self):
+        if self._update_sub is None:
+            import omni.kit.app
+
+            self._update_sub = (
+                omni.kit.app.get_app()
+                .get_update_event_stream()
+                .create_subscription_to_pop(
+                    lambda event: self.end_frame(), name="omni.example.ui_scene.common GestureLatency"
+                )
+            )
+
+
+def _percentile(ordered: list, percentile: float) -> float:
+    """The nearest-rank percentile of the sorted values"""
+    if not ordered:
+        return 0.0
+    rank = max(0, min(len(ordered) - 1, math.ceil(percentile / 100.0 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+_latency: Optional[GestureLatency] = None
+_setting_sub = None
+
+
+def _set_enabled(value: bool):
+    global _enabled
+    _enabled = value
+    if not value and _latency:
+        _latency.destroy()
+
+
+def _on_setting_changed(item, event_type):
+    _set_enabled(bool(carb.settings.get_settings().get(SETTING_ENABLED)))
+
+
+def get_gesture_latency() -> GestureLatency:
+    """The latency of the gestures of all the samples"""
+    global _latency, _setting_sub
+    if _latency is None:
+        _latency = GestureLatency()
+        settings = carb.settings.get_settings()
+        _setting_sub = settings.subscribe_to_node_change_events(SETTING_ENABLED, _on_setting_changed)
+        _on_setting_changed(None, None)
+    return _latency
+
+
+def _shutdown():
+    """Called when the extension is shutting down, the setting subscription is released"""
+    global _latency, _setting_sub
+    if _setting_sub is not None:
+        carb.settings.get_settings().unsubscribe_to_change_events(_setting_sub)
+    _setting_sub = None
+    _set_enabled(False)
+    _latency = None
+
+
+def begin_gesture_event(gesture_type: str) -> Optional[int]:
+    """Called by the gesture on the input event. Returns the correlation ID or None when it's off."""
+    count_gesture_event()
+    if _latency is None:
+        # Reads the setting
+        get_gesture_latency()
+    if not _enabled:
+        return None
+    return get_gesture_latency().begin(gesture_type)
+
+
+def mark_gesture_stage(stage: str):
+    """Stamp the stage of the current gesture event, if any"""
+    if _enabled:
+        get_gesture_latency().mark(stage)
+
+
+def get_correlation_id() -> Optional[int]:
+    """The ID of the current gesture event, to keep for the deferred work"""
+    return get_gesture_latency().correlation_id if _enabled else None
+
+
+def resume_gesture_event(correlation_id: Optional[int]) -> bool:
+    """Make the event current again before the deferred work"""
+    if not _enabled or correlation_id is None:
+        return False
+    return get_gesture_latency().resume(correlation_id)
+
+
+def gesture_stage(stage: str) -> Callable:
+    """Decorates the method that finishes the stage, it's stamped when the method returns"""
+
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                get_gesture_latency().mark(stage)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,309 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+__all__ = [
+    "GestureEvent",
+    "GestureRecording",
+    "GestureReplayer",
+    "ReplayReport",
+    "record_gesture",
+    "start_gesture_recording",
+    "stop_gesture_recording",
+]
+
+from typing import Callable, Dict, List, Optional
+import json
+import time
+
+import carb
+
+from .instrumentation import get_instrumentation
+
+# The version of the JSON file
+FORMAT_VERSION = 1
+
+# The gestures only check this flag when nothing is recorded
+_recording: Optional["GestureRecording"] = None
+
+
+class GestureEvent:
+    """
+    A single input event of a gesture. `values` is what the gesture reads
+    from its payload, like `ray_closest_point`, in plain lists and floats.
+    """
+
+    __slots__ = ("frame", "seconds", "gesture", "state", "values")
+
+    def __init__(self, frame: int, seconds: float, gesture: str, state: str, values: dict):
+        # The frame and the time since the recording is started
+        self.frame = frame
+        self.seconds = seconds
+        self.gesture = gesture
+        # "began", "changed" or "ended"
+        self.state = state
+        self.values = values
+
+    def to_dict(self) -> dict:
+        return {
+            "frame": self.frame,
+            "seconds": self.seconds,
+            "gesture": self.gesture,
+            "state": self.state,
+            "values": self.values,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "GestureEvent":
+        return cls(data["frame"], data["seconds"], data["gesture"], data["state"], data["values"])
+
+    def __repr__(self):
+        return f"<GestureEvent {self.gesture} {self.state} frame={self.frame}>"
+
+
+class GestureRecording:
+    """The gesture events with the stage and the selection they start from"""
+
+    def __init__(self, stage_url: str = "", selection: Optional[List[str]] = None):
+        self.stage_url = stage_url
+        self.selection = list(selection or [])
+        self.events: List[GestureEvent] = []
+        self._start = time.perf_counter()
+        self._frame = 0
+        self._update_sub = None
+
+    @property
+    def frame_count(self) -> int:
+        """The frames from the first event to the last one"""
+        return self.events[-1].frame - self.events[0].frame + 1 if self.events else 0
+
+    def add(self, gesture: str, state: str, values: dict):
+        self.events.append(GestureEvent(self._frame, time.perf_counter() - self._start, gesture, state, values))
+
+    def save(self, path: str):
+        data = {
+            "version": FORMAT_VERSION,
+            "stage_url": self.stage_url,
+            "selection": self.selection,
+            "events": [event.to_dict() for event in self.events],
+        }
+        with open(path, "w") as f:
+            json.dump(data, f, indent=1)
+
+    @classmethod
+    def load(cls, path: str) -> "GestureRecording":
+        with open(path) as f:
+            data = json.load(f)
+        if data.get("version") != FORMAT_VERSION:
+            raise ValueError(f"{path} has the version {data.get('version')}, {FORMAT_VERSION} is expected")
+        recording = cls(data["stage_url"], data["selection"])
+        recording.events = [GestureEvent.from_dict(event) for event in data["events"]]
+        return recording
+
+    def _watch_frames(self, watch: bool):
+        if not watch:
+            self._update_sub = None
+            return
+        import omni.kit.app
+
+        self._update_sub = (
+            omni.kit.app.get_app()
+            .get_update_event_stream()
+            .create_subscription_to_pop(self._on_update, name="omni.example.ui_scene.common GestureRecording")
+        )
+
+    def _on_update(self, event):
+        self._frame += 1
+
+
+def record_gesture(gesture: str, state: str, **values):
+    """
+    Called by the gestures with what they read from the payload. It only
+    checks a flag when nothing is recorded.
+    """
+    if _recording is not None:
+        _recording.add(gesture, state, values)
+
+
+def start_gesture_recording(usd_context_name: str = "") -> GestureRecording:
+    """Starts recording the gestures of all the samples on the current stage and selection"""
+    global _recording
+    if _recording is not None:
+        return _recording
+
+    import omni.usd
+
+    context = omni.usd.get_context(usd_context_name)
+    _recording = GestureRecording(context.get_stage_url(), context.get_selection().get_selected_prim_paths())
+    _recording._watch_frames(True)
+    return _recording
+
+
+def stop_gesture_recording() -> Optional[GestureRecording]:
+    """Stops recording and returns the recording, None if it's not started"""
+    global _recording
+    recording = _recording
+    _recording = None
+    if recording:
+        recording._watch_frames(False)
+    return recording
+
+
+class ReplayReport:
+    """What a replay did and how long it took"""
+
+    def __init__(self):
+        self.events = 0
+        # The events without a target or that the target didn't match
+        self.skipped = 0
+        self.frames = 0
+        self.total_time = 0.0
+        # The ObjectsChanged notices and the paths they have
+        self.usd_writes = 0
+        self.changed_paths = 0
+        # The calls of the instrumented entry points during the replay
+        self.calls: Dict[str, int] = {}
+
+    @property
+    def events_per_second(self) -> float:
+        return self.events / self.total_time if self.total_time else 0.0
+
+    @property
+    def frame_time(self) -> float:
+        return self.total_time / self.frames if self.frames else 0.0
+
+    @property
+    def rebuilds(self) -> int:
+        """The calls of `on_build` of the manipulators"""
+        return sum(count for name, count in self.calls.items() if name.endswith(".on_build"))
+
+    @property
+    def model_updates(self) -> int:
+        """The calls of `on_model_updated` of the manipulators"""
+        return sum(count for name, count in self.calls.items() if name.endswith(".on_model_updated"))
+
+    def to_dict(self) -> dict:
+        return {
+            "events": self.events,
+            "skipped": self.skipped,
+            "frames": self.frames,
+            "total_ms": self.total_time * 1000.0,
+            "frame_ms": self.frame_time * 1000.0,
+            "events_per_second": self.events_per_second,
+            "usd_writes": self.usd_writes,
+            "changed_paths": self.changed_paths,
+            "rebuilds": self.rebuilds,
+            "model_updates": self.model_updates,
+            "calls": dict(self.calls),
+        }
+
+    def __repr__(self):
+        return (
+            f"<ReplayReport events={self.events} frames={self.frames} {self.events_per_second:.1f} events/s "
+            f"usd_writes={self.usd_writes} rebuilds={self.rebuilds}>"
+        )
+
+
+class GestureReplayer:
+    """
+    Feeds a recording to the models and the manipulators without the mouse.
+    `targets` is the gesture name to the function that replays its events,
+    like `LightManipulator.replay_gesture`. The function returns False when
+    the event has nothing to replay on, like a handle or a prim that is not
+    shown, and the event is counted in `ReplayReport.skipped`.
+
+    The stage of the recording is opened when it's not the current one, and
+    the selection is restored. The manipulators have to be created before,
+    they get the selection like they do in the viewport. Then the events
+    are sent on the same frames they were recorded, so the coalescing and the
+    deferred writes are the same on every run.
+    """
+
+    def __init__(
+        self,
+        recording: GestureRecording,
+        targets: Dict[str, Callable[[GestureEvent], Optional[bool]]],
+        usd_context_name: str = "",
+        settle_frames: int = 10,
+    ):
+        self._recording = recording
+        self._targets = dict(targets)
+        self._usd_context_name = usd_context_name
+        self._settle_frames = settle_frames
+        self._report: Optional[ReplayReport] = None
+
+    async def prepare(self):
+        """Opens the stage and selects the prims of the recording"""
+        import omni.kit.app
+        import omni.usd
+
+        context = omni.usd.get_context(self._usd_context_name)
+        if self._recording.stage_url and context.get_stage_url() != self._recording.stage_url:
+            await context.open_stage_async(self._recording.stage_url)
+        context.get_selection().set_selected_prim_paths(self._recording.selection, True)
+        for _ in range(self._settle_frames):
+            await omni.kit.app.get_app().next_update_async()
+
+    async def replay(self) -> ReplayReport:
+        """Sends the events and returns the report. `prepare` is called first."""
+        import omni.kit.app
+        import omni.usd
+        from pxr import Tf
+        from pxr import Usd
+
+        await self.prepare()
+        app = omni.kit.app.get_app()
+        report = ReplayReport()
+
+        def on_objects_changed(notice, stage):
+            report.usd_writes += 1
+            report.changed_paths += len(notice.GetResyncedPaths()) + len(notice.GetChangedInfoOnlyPaths())
+
+        stage = omni.usd.get_context(self._usd_context_name).get_stage()
+        listener = Tf.Notice.Register(Usd.Notice.ObjectsChanged, on_objects_changed, stage)
+
+        # The entry points are counted by the instrumentation
+        instrumentation = get_instrumentation()
+        was_enabled = instrumentation.enabled
+        instrumentation.enabled = True
+        before = {name: stats.count for name, stats in instrumentation.get_stats().items()}
+
+        start = time.perf_counter()
+        try:
+            events = self._recording.events
+            first = events[0].frame if events else 0
+            frame = 0
+            for event in events:
+                while frame < event.frame - first:
+                    await app.next_update_async()
+                    frame += 1
+                target = self._targets.get(event.gesture)
+                if target is None or target(event) is False:
+                    report.skipped += 1
+                    continue
+                report.events += 1
+            # The frame that shows the last event
+            await app.next_update_async()
+            report.frames = frame + 1
+        finally:
+            report.total_time = time.perf_counter() - start
+            listener.Revoke()
+            after = {name: stats.count for name, stats in instrumentation.get_stats().items()}
+            instrumentation.enabled = was_enabled
+
+        report.calls = {
+            name: count - before.get(name, 0) for name, count in after.items() if count > before.get(name, 0)
+        }
+        if report.skipped:
+            carb.log_warn(f"[omni.example.ui_scene.common] {report.skipped} gesture events have nothing to replay on")
+        self._report = report
+        return report
+
+    @property
+    def report(self) -> Optional[ReplayReport]:
+        """The report of the last replay"""
+        return self._report
@@ -0,0 +1,142 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+__all__ = ["PrototypeBoundCache", "get_prototype", "is_prototype_path", "range_corners", "transform_ranges"]
+
+from typing import Dict, List, Sequence
+
+from pxr import Gf
+from pxr import Sdf
+from pxr import Usd
+from pxr import UsdGeom
+import numpy as np
+
+from .bounds import DEFAULT_PURPOSES
+from .bounds import compute_world_range
+
+
+def get_prototype(prim: Usd.Prim) -> Usd.Prim:
+    """The prototype of the instance. It's called master in the older USD."""
+    if hasattr(prim, "GetPrototype"):
+        return prim.GetPrototype()
+    return prim.GetMaster()
+
+
+def is_prototype_path(path: Sdf.Path) -> bool:
+    """True if the path is in a prototype"""
+    if hasattr(Usd.Prim, "IsPathInPrototype"):
+        return Usd.Prim.IsPathInPrototype(path)
+    return Usd.Prim.IsPathInMaster(path)
+
+
+def range_corners(range: Gf.Range3d) -> np.ndarray:
+    """Returns the 8 corners of the box as (8, 4) homogeneous points"""
+    if range.IsEmpty():
+        # Nothing to draw, we put it to the pivot of the instance
+        range = Gf.Range3d(Gf.Vec3d(0.0), Gf.Vec3d(0.0))
+    bbox_min = range.GetMin()
+    bbox_max = range.GetMax()
+    return np.array(
+        [
+            [x, y, z, 1.0]
+            for x in (bbox_min[0], bbox_max[0])
+            for y in (bbox_min[1], bbox_max[1])
+            for z in (bbox_min[2], bbox_max[2])
+        ]
+    )
+
+
+def transform_ranges(corners: np.ndarray, matrices: np.ndarray) -> np.ndarray:
+    """
+    Transforms the box corners (8, 4) by every matrix (N, 4, 4) and returns
+    the world axis-aligned boxes as (N, 2, 3) array of min and max.
+
+    The matrices are Gf matrices, so the points are row vectors.
+    """
+    world_corners = np.einsum("ci,nij->ncj", corners, matrices)[:, :, :3]
+    return np.stack((world_corners.min(axis=1), world_corners.max(axis=1)), axis=1)
+
+
+class PrototypeBoundCache:
+    """
+    Computes the world bounds of many prims at once. All the instances of
+    the same prototype have the same untransformed bound, so it's computed
+    only once per prototype, and then transformed by the world matrices of
+    all the instances in one NumPy operation.
+    """
+
+    def __init__(self, time: Usd.TimeCode = Usd.TimeCode.Default(), purposes: Sequence[str] = DEFAULT_PURPOSES):
+        self._time = time
+        self._purposes = purposes
+        self.clear()
+
+    def clear(self):
+        """Forget everything"""
+        self._bbox_cache = UsdGeom.BBoxCache(self._time, includedPurposes=list(self._purposes))
+        self._xform_cache = UsdGeom.XformCache(self._time)
+        # Prototype path -> the corners of its untransformed bound
+        self._prototype_corners: Dict[Sdf.Path, np.ndarray] = {}
+
+    def clear_transforms(self):
+        """
+        Forget the transforms and the bounds of the prims that are not
+        instances. Should be called when the prims are moved or edited.
+        """
+        self._bbox_cache.Clear()
+        self._xform_cache.Clear()
+
+    def clear_prototypes(self):
+        """Forget the bounds of the prototypes. Should be called when the prototypes are edited."""
+        self._bbox_cache.Clear()
+        self._prototype_corners = {}
+
+    def set_time(self, time: Usd.TimeCode):
+        if time != self._time:
+            self._time = time
+            self.clear()
+
+    @property
+    def prototype_count(self) -> int:
+        """The number of the prototypes with the cached bound"""
+        return len(self._prototype_corners)
+
+    def _get_prototype_corners(self, instance: Usd.Prim) -> np.ndarray:
+        prototype_path = get_prototype(instance).GetPath()
+        corners = self._prototype_corners.get(prototype_path)
+        if corners is None:
+            # The bound of the instance's descendants in its own space, which
+            # is the same for all the instances of the prototype
+            bound = self._bbox_cache.ComputeUntransformedBound(instance)
+            corners = range_corners(bound.ComputeAlignedRange())
+            self._prototype_corners[prototype_path] = corners
+        return corners
+
+    def compute_world_range(self, prim: Usd.Prim) -> Gf.Range3d:
+        """The world bound of a single prim"""
+        ranges = self.compute_world_ranges([prim])
+        return Gf.Range3d(Gf.Vec3d(*ranges[0][0]), Gf.Vec3d(*ranges[0][1]))
+
+    def compute_world_ranges(self, prims: Sequence[Usd.Prim]) -> np.ndarray:
+        """Returns the world bounds of the prims as (N, 2, 3) array of min and max"""
+        result = np.zeros((len(prims), 2, 3))
+
+        # Prototype path -> indices of its instances in prims
+        instances: Dict[Sdf.Path, List[int]] = {}
+        for i, prim in enumerate(prims):
+            if prim.IsInstance():
+                instances.setdefault(get_prototype(prim).GetPath(), []).append(i)
+            else:
+                range = compute_world_range(prim, self._time, self._bbox_cache, self._purposes)
+                result[i] = (range.GetMin(), range.GetMax())
+
+        for indices in instances.values():
+            corners = self._get_prototype_corners(prims[indices[0]])
+            matrices = np.array([self._xform_cache.GetLocalToWorldTransform(prims[i]) for i in indices])
+            result[indices] = transform_ranges(corners, matrices)
+
+        return result
@@ -0,0 +1,379 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+__all__ = ["CallStats", "Instrumentation", "get_instrumentation", "instrumented", "span", "trace_args", "trace_item"]
+
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import bisect
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+
+import carb
+import carb.settings
+
+SETTING_ENABLED = "/exts/omni.example.ui_scene.common/instrumentation/enabled"
+SETTING_CAPACITY = "/exts/omni.example.ui_scene.common/instrumentation/capacity"
+SETTING_TRACE = "/exts/omni.example.ui_scene.common/instrumentation/trace"
+SETTING_TRACE_CAPACITY = "/exts/omni.example.ui_scene.common/instrumentation/trace_capacity"
+SETTING_PROFILER_CAPTURE = "/exts/omni.example.ui_scene.common/profiler/capture"
+
+# The upper edges of the histogram buckets in milliseconds, the last bucket
+# has everything slower
+BUCKET_EDGES_MS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0)
+
+# The wrappers only check `_active` when the instrumentation, the tracing and
+# the profiler are off
+_enabled = False
+_tracing = False
+_active = False
+
+# The running ProfilerCapture, it's entered by the wrappers
+_capture = None
+
+# The spans that are not ended yet, the innermost is the last
+_open_spans: List["_Span"] = []
+_null_context = contextlib.nullcontext()
+
+
+class CallStats:
+    """The calls of a single entry point"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.count = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        # The number of the calls per bucket of BUCKET_EDGES_MS
+        self.histogram = [0] * (len(BUCKET_EDGES_MS) + 1)
+
+    @property
+    def average_time(self) -> float:
+        return self.total_time / self.count if self.count else 0.0
+
+    def add(self, duration: float):
+        self.count += 1
+        self.total_time += duration
+        self.max_time = max(self.max_time, duration)
+        self.histogram[bisect.bisect_left(BUCKET_EDGES_MS, duration * 1000.0)] += 1
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "total_ms": self.total_time * 1000.0,
+            "average_ms": self.average_time * 1000.0,
+            "max_ms": self.max_time * 1000.0,
+            "histogram": dict(zip([f"<={edge}ms" for edge in BUCKET_EDGES_MS] + ["slower"], self.histogram)),
+        }
+
+    def __repr__(self):
+        return (
+            f"<CallStats {self.name} count={self.count} "
+            f"avg={self.average_time * 1000:.3f}ms max={self.max_time * 1000:.3f}ms>"
+        )
+
+
+class Instrumentation:
+    """
+    The timing of the callbacks of the models, the manipulators and the
+    gestures. The entry points are decorated with `instrumented`, and they are
+    only timed when the carb setting
+    `/exts/omni.example.ui_scene.common/instrumentation/enabled` is true.
+
+    Every call is kept in a ring buffer of `capacity` records, the oldest ones
+    are dropped. The counts and the histograms are kept per entry point for
+    the whole session.
+
+    When `/exts/omni.example.ui_scene.common/instrumentation/trace` is true,
+    the same entry points and the `span` blocks are kept as spans with their
+    arguments, like the prim path or the size of the notice, together with
+    the frames of the app. `dump_trace` writes them in the Chrome trace
+    format that chrome://tracing and Perfetto open.
+    """
+
+    def __init__(self, capacity: int = 4096, trace_capacity: int = 65536):
+        self._stats: Dict[str, CallStats] = {}
+        # (name, start, duration), the start is time.perf_counter()
+        self._records: "deque[Tuple[str, float, float]]" = deque(maxlen=capacity)
+        # (name, start, end, args, thread), the frames have no end
+        self._spans: "deque[Tuple[str, float, Optional[float], Optional[dict], int]]" = deque(maxlen=trace_capacity)
+        self._update_sub = None
+
+    @property
+    def enabled(self) -> bool:
+        return _enabled
+
+    @enabled.setter
+    def enabled(self, value: bool):
+        _set_flags(enabled=bool(value))
+        carb.settings.get_settings().set(SETTING_ENABLED, bool(value))
+
+    @property
+    def tracing(self) -> bool:
+        return _tracing
+
+    @tracing.setter
+    def tracing(self, value: bool):
+        _set_flags(tracing=bool(value))
+        carb.settings.get_settings().set(SETTING_TRACE, bool(value))
+
+    @property
+    def capacity(self) -> int:
+        return self._records.maxlen
+
+    def record(self, name: str, start: float, duration: float):
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = CallStats(name)
+            self._stats[name] = stats
+        stats.add(duration)
+        self._records.append((name, start, duration))
+
+    def get_stats(self) -> Dict[str, CallStats]:
+        return dict(self._stats)
+
+    def get_records(self, name: Optional[str] = None) -> List[Tuple[str, float, float]]:
+        """The calls in the ring buffer, the oldest first"""
+        if name is None:
+            return list(self._records)
+        return [record for record in self._records if record[0] == name]
+
+    def get_spans(self) -> List[Tuple[str, float, Optional[float], Optional[dict], int]]:
+        """The spans in the buffer in the order they are ended"""
+        return list(self._spans)
+
+    def add_span(self, name: str, start: float, end: Optional[float], args: Optional[dict] = None):
+        self._spans.append((name, start, end, args, threading.get_ident()))
+
+    def clear(self):
+        self._stats = {}
+        self._records.clear()
+        self._spans.clear()
+
+    def dump(self, path: str):
+        """Writes the stats and the records of the ring buffer to a JSON file"""
+        data = {
+            "bucket_edges_ms": list(BUCKET_EDGES_MS),
+            "stats": {name: stats.to_dict() for name, stats in self._stats.items()},
+            "records": [
+                {"name": name, "start": start, "duration_ms": duration * 1000.0}
+                for name, start, duration in self._records
+            ],
+        }
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
+
+    def dump_trace(self, path: str):
+        """
+        Writes the spans to a JSON file in the Chrome trace format. The buffer
+        is not cleared, call `clear` to start a new trace.
+        """
+        pid = os.getpid()
+        events = []
+        for name, start, end, args, thread in self._spans:
+            event = {"name": name, "cat": "ui_scene", "ts": start * 1e6, "pid": pid, "tid": thread}
+            if end is None:
+                # An instant event for the whole process, like a new frame
+                event.update({"ph": "i", "s": "p"})
+            else:
+                event.update({"ph": "X", "dur": (end - start) * 1e6})
+            if args:
+                event["args"] = args
+            events.append(event)
+        events.sort(key=lambda event: event["ts"])
+        with open(path, "w") as f:
+            # The arguments can be Sdf.Path and other USD objects
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, default=str)
+
+    def _watch_frames(self, watch: bool):
+        if not watch:
+            self._update_sub = None
+        elif self._update_sub is None:
+            import omni.kit.app
+
+            self._update_sub = (
+                omni.kit.app.get_app()
+                .get_update_event_stream()
+                .create_subscription_to_pop(self._on_update, name="omni.example.ui_scene.common Instrumentation")
+            )
+
+    def _on_update(self, event):
+        self.add_span("Frame", time.perf_counter(), None)
+
+
+_instrumentation: Optional[Instrumentation] = None
+_setting_sub = None
+_trace_setting_sub = None
+_profiler_setting_sub = None
+
+
+def _set_flags(enabled: Optional[bool] = None, tracing: Optional[bool] = None):
+    global _enabled, _tracing, _active
+    if enabled is not None:
+        _enabled = enabled
+    if tracing is not None:
+        _tracing = tracing
+        if not tracing:
+            _open_spans.clear()
+        if _instrumentation:
+            _instrumentation._watch_frames(tracing)
+    _active = _enabled or _tracing or _capture is not None
+
+
+def _set_capture(capture):
+    global _capture
+    _capture = capture
+    _set_flags()
+
+
+def _on_setting_changed(item, event_type):
+    settings = carb.settings.get_settings()
+    _set_flags(bool(settings.get(SETTING_ENABLED)), bool(settings.get(SETTING_TRACE)))
+
+
+def _on_profiler_setting_changed(item, event_type):
+    # The profiler is only imported when it's used
+    from .profiler import _on_setting_changed
+
+    _on_setting_changed(item, event_type)
+
+
+def get_instrumentation() -> Instrumentation:
+    """The instrumentation shared by all the samples"""
+    global _instrumentation, _setting_sub, _trace_setting_sub, _profiler_setting_sub
+    if _instrumentation is None:
+        settings = carb.settings.get_settings()
+        _instrumentation = Instrumentation(
+            settings.get(SETTING_CAPACITY) or 4096, settings.get(SETTING_TRACE_CAPACITY) or 65536
+        )
+        _setting_sub = settings.subscribe_to_node_change_events(SETTING_ENABLED, _on_setting_changed)
+        _trace_setting_sub = settings.subscribe_to_node_change_events(SETTING_TRACE, _on_setting_changed)
+        _profiler_setting_sub = settings.subscribe_to_node_change_events(
+            SETTING_PROFILER_CAPTURE, _on_profiler_setting_changed
+        )
+        _on_setting_changed(None, None)
+    return _instrumentation
+
+
+def _shutdown():
+    """Called when the extension is shutting down, the setting subscriptions are released"""
+    global _instrumentation, _setting_sub, _trace_setting_sub, _profiler_setting_sub
+    settings = carb.settings.get_settings()
+    for subscription in (_setting_sub, _trace_setting_sub, _profiler_setting_sub):
+        if subscription is not None:
+            settings.unsubscribe_to_change_events(subscription)
+    _setting_sub = None
+    _trace_setting_sub = None
+    _profiler_setting_sub = None
+    _set_flags(False, False)
+    if _instrumentation:
+        _instrumentation._watch_frames(False)
+    _instrumentation = None
+
+
+class _Span:
+    """A block that is traced, `record` also counts it in the stats"""
+
+    __slots__ = ("name", "args", "record", "start")
+
+    def __init__(self, name: str, args: Optional[dict] = None, record: bool = False):
+        self.name = name
+        self.args = args
+        self.record = record
+        self.start = 0.0
+
+    def __enter__(self):
+        _open_spans.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        end = time.perf_counter()
+        if _open_spans and _open_spans[-1] is self:
+            _open_spans.pop()
+        instrumentation = get_instrumentation()
+        if self.record and _enabled:
+            instrumentation.record(self.name, self.start, end - self.start)
+        instrumentation.add_span(self.name, self.start, end, self.args)
+        return False
+
+
+def trace_args(**args: Any):
+    """Attaches the arguments to the innermost open span when tracing"""
+    if _tracing and _open_spans:
+        current = _open_spans[-1]
+        if current.args is None:
+            current.args = args
+        else:
+            current.args.update(args)
+
+
+def trace_item(model, item, **args: Any):
+    """
+    Attaches the name of the model attribute that holds the item, and the
+    other arguments, to the innermost open span when tracing. The name is
+    only looked up when tracing.
+    """
+    if not _tracing or not _open_spans:
+        return
+    name = type(item).__name__ if item is not None else ""
+    for attribute, value in vars(model).items():
+        if value is item:
+            name = attribute
+            break
+    trace_args(item=name, **args)
+
+
+def span(name: str, **args: Any):
+    """
+    A block that is kept as a span when tracing:
+
+        with span("NoticeHub.objects_changed", resynced=len(changes.resynced)):
+            ...
+    """
+    if not _tracing:
+        return _null_context
+    return _Span(name, args or None)
+
+
+def instrumented(name: str = "") -> Callable:
+    """
+    Decorates an entry point to be timed when the instrumentation is enabled,
+    to be a span when tracing, and to be profiled during a profiler capture.
+    The name is the module and the qualified name of the function by default.
+    When all of them are off, the wrapper only checks a flag.
+    """
+
+    def decorator(fn: Callable) -> Callable:
+        label = name or f"{fn.__module__}.{fn.__qualname__}".replace("omni.example.ui_scene.", "")
+        instrumentation = get_instrumentation()
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _active:
+                return fn(*args, **kwargs)
+            with _capture or _null_context:
+                if not _enabled and not _tracing:
+                    return fn(*args, **kwargs)
+                if not _tracing:
+                    start = time.perf_counter()
+                    try:
+                        return fn(*args, **kwargs)
+                    finally:
+                        instrumentation.record(label, start, time.perf_counter() - start)
+
+                with _Span(label, record=True):
+                    return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,461 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+__all__ = ["ChangeSet", "NoticeHub", "PathSet", "SubscriberStats", "get_notice_hub"]
+
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Union
+import bisect
+import time
+import weakref
+
+from pxr import Sdf
+from pxr import Tf
+from pxr import Usd
+from pxr import UsdGeom
+import carb
+import omni.usd
+
+from .gesture_latency import NOTICE
+from .gesture_latency import mark_gesture_stage
+from .instrumentation import span
+
+# The classes of the changed properties
+XFORM = "xform"
+EXTENT = "extent"
+VISIBILITY = "visibility"
+MATERIAL = "material"
+OTHER = "other"
+
+_EXTENT_NAMES = {UsdGeom.Tokens.extent, UsdGeom.Tokens.extentsHint}
+_VISIBILITY_NAMES = {UsdGeom.Tokens.visibility, UsdGeom.Tokens.purpose}
+
+
+def _classify(name: str) -> str:
+    """The class of the changed property"""
+    if not name:
+        return OTHER
+    if UsdGeom.Xformable.IsTransformationAffectedByAttrNamed(name):
+        return XFORM
+    if name in _EXTENT_NAMES:
+        return EXTENT
+    if name in _VISIBILITY_NAMES:
+        return VISIBILITY
+    if name.startswith("material:binding"):
+        return MATERIAL
+    return OTHER
+
+
+class ChangeSet:
+    """
+    The changes of a single Usd.Notice.ObjectsChanged, parsed once for all
+    the subscribers. The paths are the prim paths.
+    """
+
+    XFORM = XFORM
+    EXTENT = EXTENT
+    VISIBILITY = VISIBILITY
+    MATERIAL = MATERIAL
+    OTHER = OTHER
+
+    def __init__(self, resynced: Iterable[Sdf.Path] = (), info_only: Optional[Dict[Sdf.Path, Set[str]]] = None):
+        self.resynced: FrozenSet[Sdf.Path] = frozenset(resynced)
+        # Prim path -> the names of the changed properties, an empty name
+        # is the change of the prim itself
+        self.info_only: Dict[Sdf.Path, Set[str]] = info_only or {}
+
+    @classmethod
+    def from_notice(cls, notice: Usd.Notice.ObjectsChanged) -> "ChangeSet":
+        resynced = set()
+        info_only: Dict[Sdf.Path, Set[str]] = {}
+        for path in notice.GetResyncedPaths():
+            if path.IsPropertyPath():
+                # A property is added or removed, the prim is not recomposed
+                info_only.setdefault(path.GetPrimPath(), set()).add(path.name)
+            else:
+                resynced.add(path.GetPrimPath())
+        for path in notice.GetChangedInfoOnlyPaths():
+            names = info_only.setdefault(path.GetPrimPath(), set())
+            names.add(path.name if path.IsPropertyPath() else "")
+        return cls(resynced, info_only)
+
+    def __bool__(self):
+        return bool(self.resynced or self.info_only)
+
+    @property
+    def paths(self) -> Set[Sdf.Path]:
+        """All the changed prim paths"""
+        return set(self.resynced) | set(self.info_only)
+
+    @property
+    def info_only_paths(self) -> Set[Sdf.Path]:
+        return set(self.info_only)
+
+    def get_classes(self, path: Sdf.Path) -> Set[str]:
+        """The classes of the properties changed on the prim"""
+        if path in self.resynced:
+            return {XFORM, EXTENT, VISIBILITY, MATERIAL, OTHER}
+        return {_classify(name) for name in self.info_only.get(path, ())}
+
+    def has_class(self, change_class: str) -> bool:
+        return any(change_class in self.get_classes(path) for path in self.paths)
+
+    def filter(self, roots: Union["PathSet", Iterable[Sdf.Path]]) -> "ChangeSet":
+        """
+        Returns only the changes that affect the prims under the roots. The
+        changes of the ancestors of the roots are kept as well because they
+        can move the roots. When a root is resynced, all the resynced paths
+        are kept, a rename or a reparent resyncs the new path too.
+        """
+        if not isinstance(roots, PathSet):
+            roots = PathSet(roots)
+        resynced = [path for path in self.resynced if roots.is_related(path)]
+        return ChangeSet(
+            self.resynced if resynced else (),
+            {path: names for path, names in self.info_only.items() if roots.is_related(path)},
+        )
+
+
+def _to_path(path) -> Sdf.Path:
+    return path if isinstance(path, Sdf.Path) else Sdf.Path(str(path))
+
+
+class PathSet:
+    """
+    A set of prim paths that knows all their ancestors, so a changed path is
+    checked against all of them in O(depth), not O(paths). It's updated path
+    by path, so a few prims added to a big selection don't walk the rest.
+    """
+
+    def __init__(self, paths: Iterable = ()):
+        self._paths: Set[Sdf.Path] = set()
+        # The paths and their ancestors -> the number of the paths under them
+        self._prefixes: Dict[Sdf.Path, int] = {}
+        # The sorted strings of the paths for `descendants`, built on the
+        # first use and then kept sorted by `add` and `discard`
+        self._sorted: Optional[List[str]] = None
+        self.update(paths)
+
+    def __contains__(self, path) -> bool:
+        return _to_path(path) in self._paths
+
+    def __iter__(self) -> Iterator[Sdf.Path]:
+        return iter(self._paths)
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def add(self, path):
+        path = _to_path(path)
+        if path.isEmpty or path in self._paths:
+            return
+        self._paths.add(path)
+        if self._sorted is not None:
+            bisect.insort(self._sorted, path.pathString)
+        while not path.isEmpty:
+            self._prefixes[path] = self._prefixes.get(path, 0) + 1
+            path = path.GetParentPath()
+
+    def discard(self, path):
+        path = _to_path(path)
+        if path not in self._paths:
+            return
+        self._paths.remove(path)
+        if self._sorted is not None:
+            del self._sorted[bisect.bisect_left(self._sorted, path.pathString)]
+        while not path.isEmpty:
+            count = self._prefixes[path] - 1
+            if count:
+                self._prefixes[path] = count
+            else:
+                del self._prefixes[path]
+            path = path.GetParentPath()
+
+    def update(self, paths: Iterable):
+        for path in paths:
+            if path:
+                self.add(path)
+
+    def difference_update(self, paths: Iterable):
+        for path in paths:
+            if path:
+                self.discard(path)
+
+    def is_related(self, path: Sdf.Path) -> bool:
+        """True if the path is in the set, under a path of the set, or an ancestor of one"""
+        if path in self._prefixes:
+            return True
+        return any(prefix in self._paths for prefix in path.GetPrefixes())
+
+    def ancestors(self, path: Sdf.Path) -> List[Sdf.Path]:
+        """The paths of the set that are the path or its ancestors, O(depth)"""
+        return [prefix for prefix in path.GetPrefixes() if prefix in self._paths]
+
+    def descendants(self, path: Sdf.Path) -> List[Sdf.Path]:
+        """The paths of the set that are the path or its descendants, O(log(paths)) and the result"""
+        if path not in self._prefixes:
+            return []
+        if path == Sdf.Path.absoluteRootPath:
+            return list(self._paths)
+        if self._sorted is None:
+            self._sorted = sorted(p.pathString for p in self._paths)
+        # The descendants are between "/A" and "/A0" because "0" follows "/"
+        text = path.pathString
+        start = bisect.bisect_left(self._sorted, text)
+        end = bisect.bisect_left(self._sorted, text + "0", start)
+        return [Sdf.Path(p) for p in self._sorted[start:end] if p == text or p.startswith(text + "/")]
+
+
+class SubscriberStats:
+    """The cost of delivering the changes to a single subscriber"""
+
+    def __init__(self, name: str):
+        self.name = name
+        # The notices that had changes for the subscriber and the ones that
+        # didn't, so it was not called
+        self.delivered = 0
+        self.filtered = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        # The async work that was superseded before it's finished
+        self.cancelled = 0
+
+    @property
+    def average_time(self) -> float:
+        return self.total_time / self.delivered if self.delivered else 0.0
+
+    def __repr__(self):
+        return (
+            f"<SubscriberStats {self.name} delivered={self.delivered} filtered={self.filtered} "
+            f"avg={self.average_time * 1000:.3f}ms max={self.max_time * 1000:.3f}ms cancelled={self.cancelled}>"
+        )
+
+
+def _call(fn: Callable, stats: SubscriberStats, argument):
+    """Calls the subscriber and counts the time"""
+    start = time.perf_counter()
+    try:
+        fn(argument)
+    except Exception as e:
+        carb.log_error(f"{stats.name} failed: {e}")
+    elapsed = time.perf_counter() - start
+    stats.delivered += 1
+    stats.total_time += elapsed
+    stats.max_time = max(stats.max_time, elapsed)
+
+
+class _Subscription:
+    """Unsubscribes when it's destroyed or released"""
+
+    def __init__(self, hub: "NoticeHub", key: int):
+        self._hub = weakref.ref(hub)
+        self._key = key
+
+    def __del__(self):
+        self.destroy()
+
+    def destroy(self):
+        hub = self._hub() if self._hub else None
+        if hub:
+            hub._unsubscribe(self._key)
+        self._hub = None
+
+    def set_paths(self, paths: Optional[Iterable[str]]):
+        """Change the paths the subscriber is interested in. None is the whole stage."""
+        hub = self._hub() if self._hub else None
+        if hub and hasattr(hub, "_set_paths"):
+            hub._set_paths(self._key, paths)
+
+
+class _Subscriber:
+    def __init__(self, fn: Callable, roots: Optional[PathSet], name: str, event_types=None, priority=0):
+        self.fn = fn
+        self.roots = roots
+        self.event_types = event_types
+        self.priority = priority
+        self.stats = SubscriberStats(name)
+
+
+def _to_roots(paths: Optional[Iterable[str]]) -> Optional[PathSet]:
+    if paths is None or isinstance(paths, PathSet):
+        # The PathSet is shared with the subscriber, its changes apply at once
+        return paths
+    return PathSet(paths)
+
+
+class NoticeHub:
+    """
+    One Tf.Notice listener and one stage event subscription for all the
+    sample models of the UsdContext.
+
+    Each ObjectsChanged notice is parsed once to a ChangeSet. Every subscriber
+    gets only the changes under the paths it's interested in, and it's not
+    called at all when there are no such changes. The time spent in each
+    subscriber is counted, see `get_stats`.
+    """
+
+    def __init__(self, usd_context_name: str = ""):
+        self._usd_context_name = usd_context_name
+        self._next_key = 0
+        self._notice_subscribers: Dict[int, _Subscriber] = {}
+        self._event_subscribers: Dict[int, _Subscriber] = {}
+        # The notice subscribers in the order of the delivery
+        self._notice_order: List[_Subscriber] = []
+        self._stage_listener = None
+        self._stage_event_sub = None
+
+    def destroy(self):
+        self._revoke()
+        self._stage_event_sub = None
+        self._notice_subscribers = {}
+        self._notice_order = []
+        self._event_subscribers = {}
+
+    @property
+    def usd_context(self):
+        return omni.usd.get_context(self._usd_context_name)
+
+    def subscribe_objects_changed(
+        self,
+        fn: Callable[[ChangeSet], None],
+        paths: Optional[Iterable[str]] = None,
+        name: str = "",
+        priority: int = 0,
+    ) -> _Subscription:
+        """
+        Call `fn` with the ChangeSet of each ObjectsChanged notice that has
+        changes under `paths`. All the changes are delivered when `paths` is
+        None. Keep the returned object, the subscription ends when it's
+        released. When `paths` is a PathSet, it's kept, and the changes to it
+        apply without calling `set_paths`.
+
+        The subscribers with the higher `priority` are called first. The
+        caches use it to be invalidated before the models read them.
+        """
+        subscriber = _Subscriber(fn, _to_roots(paths), name or repr(fn), priority=priority)
+        key = self._add(self._notice_subscribers, subscriber)
+        self._sort_notice_subscribers()
+        self._listen()
+        return _Subscription(self, key)
+
+    def subscribe_stage_event(
+        self, fn: Callable, event_types: Optional[Iterable[int]] = None, name: str = ""
+    ) -> _Subscription:
+        """
+        Call `fn` with the stage events of the UsdContext. Only the events of
+        `event_types` are delivered when it's set.
+        """
+        event_types = frozenset(int(t) for t in event_types) if event_types is not None else None
+        key = self._add(self._event_subscribers, _Subscriber(fn, None, name or repr(fn), event_types))
+        self._watch_stage_events()
+        return _Subscription(self, key)
+
+    def get_stats(self) -> Dict[str, SubscriberStats]:
+        """Subscriber name -> the cost of the delivery"""
+        subscribers = list(self._notice_subscribers.values()) + list(self._event_subscribers.values())
+        return {subscriber.stats.name: subscriber.stats for subscriber in subscribers}
+
+    def dump_stats(self):
+        for stats in self.get_stats().values():
+            carb.log_info(repr(stats))
+
+    def _add(self, subscribers: Dict[int, _Subscriber], subscriber: _Subscriber) -> int:
+        key = self._next_key
+        self._next_key += 1
+        subscribers[key] = subscriber
+        return key
+
+    def _sort_notice_subscribers(self):
+        # The sort is stable, so the same priority keeps the subscription order
+        self._notice_order = sorted(self._notice_subscribers.values(), key=lambda s: -s.priority)
+
+    def _unsubscribe(self, key: int):
+        if self._notice_subscribers.pop(key, None):
+            self._sort_notice_subscribers()
+        self._event_subscribers.pop(key, None)
+        if not self._notice_subscribers:
+            # Nobody is interested, so USD doesn't need to call Python
+            self._revoke()
+        if not self._notice_subscribers and not self._event_subscribers:
+            self._stage_event_sub = None
+
+    def _set_paths(self, key: int, paths: Optional[Iterable[str]]):
+        subscriber = self._notice_subscribers.get(key)
+        if subscriber:
+            subscriber.roots = _to_roots(paths)
+
+    def _watch_stage_events(self):
+        if self._stage_event_sub is None:
+            self._stage_event_sub = self.usd_context.get_stage_event_stream().create_subscription_to_pop(
+                self._on_stage_event, name="omni.example.ui_scene.common NoticeHub"
+            )
+
+    def _listen(self):
+        # The stage events are needed to follow the stage that is opened
+        self._watch_stage_events()
+        if self._stage_listener:
+            return
+        stage = self.usd_context.get_stage()
+        if stage:
+            self._stage_listener = Tf.Notice.Register(Usd.Notice.ObjectsChanged, self._on_objects_changed, stage)
+
+    def _revoke(self):
+        if self._stage_listener:
+            self._stage_listener.Revoke()
+            self._stage_listener = None
+
+    def _on_stage_event(self, event):
+        if event.type == int(omni.usd.StageEventType.OPENED):
+            self._revoke()
+            if self._notice_subscribers:
+                self._listen()
+        elif event.type == int(omni.usd.StageEventType.CLOSING):
+            self._revoke()
+
+        # The subscribers can unsubscribe in the callback
+        for subscriber in list(self._event_subscribers.values()):
+            if subscriber.event_types is not None and event.type not in subscriber.event_types:
+                continue
+            self._call(subscriber, event)
+
+    def _on_objects_changed(self, notice: Usd.Notice.ObjectsChanged, stage: Usd.Stage):
+        mark_gesture_stage(NOTICE)
+        changes = ChangeSet.from_notice(notice)
+        if not changes:
+            return
+
+        with span("NoticeHub.objects_changed", resynced=len(changes.resynced), changed=len(changes.info_only)):
+            # The subscribers can unsubscribe in the callback
+            for subscriber in self._notice_order:
+                subscriber_changes = changes if subscriber.roots is None else changes.filter(subscriber.roots)
+                if not subscriber_changes:
+                    subscriber.stats.filtered += 1
+                    continue
+                self._call(subscriber, subscriber_changes)
+
+    def _call(self, subscriber: _Subscriber, argument):
+        _call(subscriber.fn, subscriber.stats, argument)
+
+
+# UsdContext name -> NoticeHub
+_hubs: Dict[str, NoticeHub] = {}
+
+
+def get_notice_hub(usd_context_name: str = "") -> NoticeHub:
+    """The hub of the UsdContext, it's shared by all the samples"""
+    hub = _hubs.get(usd_context_name)
+    if hub is None:
+        hub = NoticeHub(usd_context_name)
+        _hubs[usd_context_name] = hub
+    return hub
+
+
+def _shutdown():
+    """Called when the extension is shutting down"""
+    for hub in _hubs.values():
+        hub.destroy()
+    _hubs.clear()
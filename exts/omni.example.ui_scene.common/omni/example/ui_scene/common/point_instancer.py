@@ -0,0 +1,186 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+__all__ = ["PointInstancerBounds", "format_instance_path", "parse_instance_path", "quaternions_to_matrices"]
+
+from typing import Dict, Optional, Sequence, Tuple
+import re
+
+from pxr import Sdf
+from pxr import Usd
+from pxr import UsdGeom
+import numpy as np
+
+from .bounds import DEFAULT_PURPOSES
+from .instancing import range_corners
+
+_INSTANCE_PATH_RE = re.compile(r"^(.*)\[(\d+)\]$")
+
+
+def format_instance_path(path: str, index: int) -> str:
+    """The path the samples use for a single instance of a PointInstancer, for example `/World/Trees[12]`"""
+    return f"{path}[{index}]"
+
+
+def parse_instance_path(path: str) -> Tuple[str, Optional[int]]:
+    """Splits `/World/Trees[12]` to `/World/Trees` and 12. The index is None for the usual paths."""
+    match = _INSTANCE_PATH_RE.match(path)
+    if not match:
+        return path, None
+    return match.group(1), int(match.group(2))
+
+
+def quaternions_to_matrices(quaternions: np.ndarray) -> np.ndarray:
+    """
+    Converts (N, 4) quaternions in the memory order of Gf.Quath, which is
+    (i, j, k, real), to (N, 3, 3) rotation matrices for the row vectors, so
+    the point is rotated as `point @ matrix` like in Gf.
+    """
+    q = quaternions / np.linalg.norm(quaternions, axis=1, keepdims=True)
+    x, y, z, w = q[:, 0], q[:, 1], q[:, 2], q[:, 3]
+    matrices = np.empty((len(q), 3, 3))
+    matrices[:, 0, 0] = 1.0 - 2.0 * (y * y + z * z)
+    matrices[:, 0, 1] = 2.0 * (x * y + w * z)
+    matrices[:, 0, 2] = 2.0 * (x * z - w * y)
+    matrices[:, 1, 0] = 2.0 * (x * y - w * z)
+    matrices[:, 1, 1] = 1.0 - 2.0 * (x * x + z * z)
+    matrices[:, 1, 2] = 2.0 * (y * z + w * x)
+    matrices[:, 2, 0] = 2.0 * (x * z + w * y)
+    matrices[:, 2, 1] = 2.0 * (y * z - w * x)
+    matrices[:, 2, 2] = 1.0 - 2.0 * (x * x + y * y)
+    return matrices
+
+
+class PointInstancerBounds:
+    """
+    Computes the world bounds of the individual instances of a
+    UsdGeom.PointInstancer. The bounds of the prototypes are computed once
+    and cached, and then they are transformed with NumPy using the
+    `positions`, `orientations`, `scales` and `protoIndices` arrays, so
+    there is no Python loop over the instances.
+
+    The velocities and the `invisibleIds` are ignored, the bounds are
+    computed at the time code of the samples.
+    """
+
+    def __init__(self, time: Usd.TimeCode = Usd.TimeCode.Default(), purposes: Sequence[str] = DEFAULT_PURPOSES):
+        self._time = time
+        self._purposes = purposes
+        self.clear()
+
+    def clear(self):
+        """Forget the bounds of the prototypes. Should be called when the prototypes are edited."""
+        self._bbox_cache = UsdGeom.BBoxCache(self._time, includedPurposes=list(self._purposes))
+        # Instancer path -> (P, 8, 3) corners of the bounds of its prototypes
+        self._prototype_corners: Dict[Sdf.Path, np.ndarray] = {}
+
+    def _get_prototype_corners(self, instancer: UsdGeom.PointInstancer) -> np.ndarray:
+        path = instancer.GetPath()
+        corners = self._prototype_corners.get(path)
+        if corners is not None:
+            return corners
+
+        targets = instancer.GetPrototypesRel().GetTargets()
+        corners = np.zeros((len(targets), 8, 3))
+        stage = instancer.GetPrim().GetStage()
+        for i, target in enumerate(targets):
+            prototype = stage.GetPrimAtPath(target)
+            if not prototype:
+                continue
+            # The instance transform goes on top of the local transform of
+            # the prototype root
+            bound = self._bbox_cache.ComputeUntransformedBound(prototype)
+            prototype_corners = range_corners(bound.ComputeAlignedRange())
+            local_xform = np.array(UsdGeom.Xformable(prototype).GetLocalTransformation(self._time))
+            corners[i] = (prototype_corners @ local_xform)[:, :3]
+
+        self._prototype_corners[path] = corners
+        return corners
+
+    def _get_array(self, attr: Usd.Attribute, indices: np.ndarray, count: int) -> Optional[np.ndarray]:
+        value = attr.Get(self._time) if attr else None
+        if value is None or len(value) == 0:
+            return None
+        if len(value) != count:
+            # The instancer is malformed, USD doesn't draw it either
+            raise IndexError(f"{attr.GetName()} has {len(value)} items, {count} are expected")
+        return np.asarray(value, dtype=np.float64)[indices]
+
+    def _transform_by_instancer(
+        self, instancer, corners: np.ndarray, indices: np.ndarray, count: int
+    ) -> Optional[np.ndarray]:
+        """
+        The fallback when the arrays can't be converted to NumPy. The
+        instance matrices are computed by USD in C++, so it's still not a
+        Python loop. None when USD can't compute them.
+        """
+        matrices = instancer.ComputeInstanceTransformsAtTime(
+            self._time,
+            self._time,
+            UsdGeom.PointInstancer.ExcludeProtoXform,
+            UsdGeom.PointInstancer.IgnoreMask,
+        )
+        if len(matrices) != count:
+            # USD returns nothing when the arrays don't match
+            return None
+        matrices = np.asarray(matrices, dtype=np.float64)[indices]
+        return np.einsum("nci,nij->ncj", corners, matrices[:, :3, :3]) + matrices[:, None, 3, :3]
+
+    def compute_instance_count(self, instancer: UsdGeom.PointInstancer) -> int:
+        proto_indices = instancer.GetProtoIndicesAttr().Get(self._time)
+        return len(proto_indices) if proto_indices else 0
+
+    def compute_world_ranges(self, instancer: UsdGeom.PointInstancer, indices: Sequence[int] = None) -> np.ndarray:
+        """
+        Returns the world bounds of the instances as (N, 2, 3) array of min
+        and max. All the instances are computed when `indices` is None.
+        The instancer without prototypes, or with the arrays that don't
+        match `protoIndices`, has no bounds.
+        """
+        proto_indices = instancer.GetProtoIndicesAttr().Get(self._time)
+        if not proto_indices:
+            return np.zeros((0, 2, 3))
+
+        count = len(proto_indices)
+        indices = np.arange(count) if indices is None else np.asarray(indices, dtype=np.int64)
+        indices = indices[(indices >= 0) & (indices < count)]
+        if not len(indices):
+            return np.zeros((0, 2, 3))
+
+        prototype_corners = self._get_prototype_corners(instancer)
+        if not len(prototype_corners):
+            return np.zeros((0, 2, 3))
+        proto_indices = np.asarray(proto_indices)[indices]
+        proto_indices = np.clip(proto_indices, 0, len(prototype_corners) - 1)
+        # (N, 8, 3) corners of the prototype of each instance
+        corners = prototype_corners[proto_indices]
+
+        try:
+            scales = self._get_array(instancer.GetScalesAttr(), indices, count)
+            orientations = self._get_array(instancer.GetOrientationsAttr(), indices, count)
+            positions = self._get_array(instancer.GetPositionsAttr(), indices, count)
+        except IndexError:
+            return np.zeros((0, 2, 3))
+        except (TypeError, ValueError):
+            corners = self._transform_by_instancer(instancer, corners, indices, count)
+            if corners is None:
+                return np.zeros((0, 2, 3))
+        else:
+            # Scale, rotate and translate, the same order as USD does
+            if scales is not None:
+                corners = corners * scales[:, None, :]
+            if orientations is not None:
+                corners = np.einsum("nci,nij->ncj", corners, quaternions_to_matrices(orientations))
+            if positions is not None:
+                corners = corners + positions[:, None, :]
+
+        # From the space of the instancer to the world
+        world_xform = np.array(UsdGeom.Imageable(instancer).ComputeLocalToWorldTransform(self._time))
+        corners = corners @ world_xform[:3, :3] + world_xform[3, :3]
+
+        return np.stack((corners.min(axis=1), corners.max(axis=1)), axis=1)
@@ -0,0 +1,123 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+__all__ = ["PrimHandle", "is_resynced", "resolve_resynced_path"]
+
+from typing import Iterable, Optional, Sequence
+
+from pxr import Sdf
+from pxr import Usd
+
+
+def is_resynced(path: str, resynced: Iterable[Sdf.Path]) -> bool:
+    """True if the prim of the path or its ancestor is resynced"""
+    if not path:
+        return False
+    sdf_path = Sdf.Path(path)
+    return any(sdf_path.HasPrefix(resynced_path) for resynced_path in resynced)
+
+
+def resolve_resynced_path(
+    stage: Usd.Stage, path: str, resynced: Sequence[Sdf.Path], type_name: str = ""
+) -> Optional[str]:
+    """
+    Returns where the prim of the path is after the resync. It's the same path
+    when the prim is still there, the new path when the prim or its ancestor
+    is renamed or reparented, and None when it's removed.
+
+    Only the resynced paths of the notice are looked at, the stage is not
+    traversed. A rename or a reparent resyncs the old and the new path, so the
+    new path is the other resynced path that has the prim under it. When
+    `type_name` is set, the prim at the new path must be of that type.
+    """
+    sdf_path = Sdf.Path(path)
+    if stage.GetPrimAtPath(sdf_path):
+        return path
+
+    # The outermost removed path the prim was under
+    removed = [p for p in resynced if sdf_path.HasPrefix(p) and not stage.GetPrimAtPath(p)]
+    if not removed:
+        return None
+    old_root = min(removed, key=lambda p: p.pathElementCount)
+
+    candidates = set()
+    for new_root in resynced:
+        if new_root == old_root or new_root.HasPrefix(old_root) or old_root.HasPrefix(new_root):
+            continue
+        renamed = new_root.GetParentPath() == old_root.GetParentPath()
+        reparented = new_root.name == old_root.name
+        if not new_root.IsPrimPath() or not (renamed or reparented):
+            continue
+        new_path = sdf_path.ReplacePrefix(old_root, new_root)
+        prim = stage.GetPrimAtPath(new_path)
+        if prim and (not type_name or prim.GetTypeName() == type_name):
+            candidates.add(new_path)
+
+    # Two prims could be the moved one, it's safer to lose the prim
+    return candidates.pop().pathString if len(candidates) == 1 else None
+
+
+class PrimHandle:
+    """
+    The Usd.Prim of a path, kept between the calls. The path is looked up in
+    the stage only the first time and after the handle is invalidated, the
+    rest of the time it's only `IsValid()`.
+
+    The owner calls `invalidate_resynced` with the resynced paths from its
+    notice listener. A prim that is recomposed can still be valid, but it's
+    not the same prim anymore.
+    """
+
+    def __init__(self, stage: Optional[Usd.Stage], path: str):
+        self._stage = stage
+        self._path = path
+        self._sdf_path = Sdf.Path(path) if path else Sdf.Path.emptyPath
+        self._prim: Optional[Usd.Prim] = None
+        # The times the path was looked up in the stage, and the times the
+        # kept prim was returned instead
+        self.lookups = 0
+        self.lookups_avoided = 0
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def get(self) -> Usd.Prim:
+        """Returns the prim or an invalid prim"""
+        prim = self._prim
+        if prim is not None and prim.IsValid():
+            self.lookups_avoided += 1
+            return prim
+
+        if not self._stage or not self._path:
+            return Usd.Prim()
+        self.lookups += 1
+        prim = self._stage.GetPrimAtPath(self._path)
+        # The prim that doesn't exist is looked up again next time
+        self._prim = prim if prim else None
+        return prim
+
+    def invalidate(self):
+        """The path will be looked up on the next `get`"""
+        self._prim = None
+
+    def rebind(self, path: str):
+        """Point the handle to the new path of the prim, the counters are kept"""
+        self._path = path
+        self._sdf_path = Sdf.Path(path) if path else Sdf.Path.emptyPath
+        self._prim = None
+
+    def invalidate_resynced(self, resynced: Iterable[Sdf.Path]) -> bool:
+        """Drop the prim if it or its ancestor is resynced. Returns True if it's dropped."""
+        if self._prim is None:
+            return False
+        for path in resynced:
+            if self._sdf_path.HasPrefix(path):
+                self._prim = None
+                return True
+        return False
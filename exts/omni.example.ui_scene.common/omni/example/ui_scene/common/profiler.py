@@ -0,0 +1,247 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+__all__ = ["ProfilerCapture", "get_profiler_capture", "start_profiler_capture", "stop_profiler_capture"]
+
+from collections import Counter
+from typing import List, Optional
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import time
+
+import carb
+import carb.settings
+import carb.tokens
+
+from . import instrumentation
+
+SETTING_CAPTURE = "/exts/omni.example.ui_scene.common/profiler/capture"
+SETTING_SECONDS = "/exts/omni.example.ui_scene.common/profiler/seconds"
+SETTING_GESTURES = "/exts/omni.example.ui_scene.common/profiler/gestures"
+SETTING_DIRECTORY = "/exts/omni.example.ui_scene.common/profiler/directory"
+SETTING_INTERVAL = "/exts/omni.example.ui_scene.common/profiler/interval_ms"
+
+DEFAULT_DIRECTORY = "${data}/omni.example.ui_scene.profiles"
+
+
+class ProfilerCapture:
+    """
+    Profiles the entry points of the samples for a while. Only the calls that
+    are decorated with `instrumented` are profiled, the rest of Kit runs at
+    full speed.
+
+    Inside the entry points, cProfile counts every call, and a sampler thread
+    takes the stack of the main thread every `interval` seconds. The capture
+    stops after `seconds`, or after `gestures` input events of the gestures,
+    whichever is first. 0 is no limit, it's stopped with `stop`. Then `<name>.pstats` and
+    `<name>.collapsed` are written to `directory`. The collapsed stacks are
+    the input of flamegraph.pl, speedscope and the other flame graph tools.
+    """
+
+    def __init__(
+        self, directory: str, seconds: float = 10.0, gestures: int = 0, interval: float = 0.001, name: str = ""
+    ):
+        self._directory = directory
+        self._seconds = seconds
+        self._gestures = gestures
+        self._interval = interval
+        self._name = name or time.strftime("capture_%Y%m%d_%H%M%S")
+
+        self._profile = cProfile.Profile()
+        # The stack -> the number of the samples
+        self._samples: Counter = Counter()
+        self._gesture_count = 0
+        self._start = 0.0
+        # Enough gesture events, it's stopped on the next frame
+        self._done = False
+        # The depth of the nested entry points and the frame of the outermost,
+        # the sampler only takes the stacks under it
+        self._depth = 0
+        self._root_frame = None
+        self._thread_id = threading.get_ident()
+        self._sampler: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+        self._update_sub = None
+        self.paths: List[str] = []
+
+    @property
+    def running(self) -> bool:
+        return self._sampler is not None
+
+    @property
+    def gesture_count(self) -> int:
+        return self._gesture_count
+
+    @property
+    def sample_count(self) -> int:
+        return sum(self._samples.values())
+
+    def start(self):
+        if self.running:
+            return
+        self._start = time.perf_counter()
+        self._thread_id = threading.get_ident()
+        self._stopped.clear()
+        self._sampler = threading.Thread(target=self._sample, name="omni.example.ui_scene.common Profiler", daemon=True)
+        self._sampler.start()
+        self._watch_time()
+        instrumentation._set_capture(self)
+
+    def stop(self) -> List[str]:
+        """Stops the capture and writes the files. Returns their paths."""
+        if not self.running:
+            return self.paths
+        instrumentation._set_capture(None)
+        self._update_sub = None
+        self._stopped.set()
+        self._sampler.join()
+        self._sampler = None
+        if self._depth:
+            # Stopped from inside an entry point
+            self._profile.disable()
+            self._depth = 0
+            self._root_frame = None
+        self.paths = self._write()
+        return self.paths
+
+    def count_gesture(self):
+        """Called on every input event of the gestures"""
+        self._gesture_count += 1
+        if self._gestures and self._gesture_count >= self._gestures:
+            self._done = True
+
+    def __enter__(self):
+        # Only the main thread is profiled
+        if threading.get_ident() != self._thread_id:
+            return self
+        if self._depth == 0:
+            # The frame of the wrapper that is entered
+            self._root_frame = sys._getframe(1)
+            self._profile.enable()
+        self._depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Zero when the capture is started inside the entry point
+        if threading.get_ident() != self._thread_id or self._depth == 0:
+            return False
+        self._depth -= 1
+        if self._depth == 0:
+            self._profile.disable()
+            self._root_frame = None
+        return False
+
+    def _sample(self):
+        while not self._stopped.wait(self._interval):
+            root = self._root_frame
+            if root is None:
+                continue
+            frame = sys._current_frames().get(self._thread_id)
+            stack = []
+            while frame is not None and frame is not root:
+                code = frame.f_code
+                stack.append(f"{getattr(code, 'co_qualname', code.co_name)} ({os.path.basename(code.co_filename)})")
+                frame = frame.f_back
+            if frame is root:
+                # Not sampled when the entry point returned in the meantime
+                self._samples[";".join(reversed(stack))] += 1
+
+    def _watch_time(self):
+        import omni.kit.app
+
+        self._update_sub = (
+            omni.kit.app.get_app()
+            .get_update_event_stream()
+            .create_subscription_to_pop(self._on_update, name="omni.example.ui_scene.common Profiler")
+        )
+
+    def _on_update(self, event):
+        # The files are written between the frames, not inside an entry point
+        if self._done or (self._seconds and time.perf_counter() - self._start >= self._seconds):
+            stop_profiler_capture()
+
+    def _write(self) -> List[str]:
+        os.makedirs(self._directory, exist_ok=True)
+        base = os.path.join(self._directory, self._name)
+
+        paths = []
+        if self._profile.getstats():
+            pstats.Stats(self._profile).dump_stats(f"{base}.pstats")
+            paths.append(f"{base}.pstats")
+        with open(f"{base}.collapsed", "w") as f:
+            for stack, count in sorted(self._samples.items()):
+                if stack:
+                    f.write(f"{stack} {count}\n")
+        paths.append(f"{base}.collapsed")
+        return paths
+
+
+_capture: Optional[ProfilerCapture] = None
+
+
+def get_profiler_capture() -> Optional[ProfilerCapture]:
+    """The running capture or the last one"""
+    return _capture
+
+
+def start_profiler_capture(
+    seconds: Optional[float] = None, gestures: Optional[int] = None, directory: Optional[str] = None
+) -> ProfilerCapture:
+    """
+    Starts profiling the entry points of the samples. The arguments that are
+    not given are read from the settings. The same as setting
+    `/exts/omni.example.ui_scene.common/profiler/capture` to true.
+    """
+    global _capture
+    if _capture and _capture.running:
+        return _capture
+
+    settings = carb.settings.get_settings()
+    if seconds is None:
+        seconds = settings.get(SETTING_SECONDS)
+        seconds = 10.0 if seconds is None else seconds
+    if gestures is None:
+        gestures = settings.get(SETTING_GESTURES) or 0
+    if directory is None:
+        directory = settings.get(SETTING_DIRECTORY) or DEFAULT_DIRECTORY
+    interval = (settings.get(SETTING_INTERVAL) or 1.0) / 1000.0
+
+    _capture = ProfilerCapture(carb.tokens.get_tokens_interface().resolve(directory), seconds, gestures, interval)
+    _capture.start()
+    carb.log_info(f"[omni.example.ui_scene.common] Profiler capture is started for {seconds}s")
+    if not settings.get(SETTING_CAPTURE):
+        settings.set(SETTING_CAPTURE, True)
+    return _capture
+
+
+def stop_profiler_capture() -> List[str]:
+    """Stops the capture and returns the paths of the written files"""
+    if not _capture or not _capture.running:
+        return []
+    paths = _capture.stop()
+    carb.log_warn(f"[omni.example.ui_scene.common] Profiler capture is written to {', '.join(paths)}")
+    settings = carb.settings.get_settings()
+    if settings.get(SETTING_CAPTURE):
+        settings.set(SETTING_CAPTURE, False)
+    return paths
+
+
+def count_gesture_event():
+    """Called by `begin_gesture_event`, counts the events for the capture"""
+    if _capture is not None and _capture.running:
+        _capture.count_gesture()
+
+
+def _on_setting_changed(item, event_type):
+    if carb.settings.get_settings().get(SETTING_CAPTURE):
+        start_profiler_capture()
+    else:
+        stop_profiler_capture()
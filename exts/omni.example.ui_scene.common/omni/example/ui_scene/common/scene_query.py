@@ -0,0 +1,256 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+__all__ = ["SceneQuery", "get_scene_query"]
+
+from collections import OrderedDict
+from typing import Dict, Optional, Sequence, Set, Tuple
+
+from pxr import Gf
+from pxr import Sdf
+from pxr import Usd
+from pxr import UsdGeom
+from pxr import UsdShade
+import omni.usd
+
+from .bounds import DEFAULT_PURPOSES
+from .bounds import compute_world_range
+from .notice_hub import ChangeSet
+from .notice_hub import PathSet
+from .notice_hub import get_notice_hub
+
+# The cached fields
+PRIM = "prim"
+WORLD_BOUND = "world_bound"
+WORLD_XFORM = "world_xform"
+BOUND_MATERIAL = "bound_material"
+
+_ALL_FIELDS = frozenset([PRIM, WORLD_BOUND, WORLD_XFORM, BOUND_MATERIAL])
+# The fields computed from the prim, all of them but the prim itself
+_DATA_FIELDS = frozenset([WORLD_BOUND, WORLD_XFORM, BOUND_MATERIAL])
+
+# The fields to forget on the prim and its descendants when a property of
+# the class is changed
+_FIELDS_BY_CLASS = {
+    ChangeSet.XFORM: frozenset([WORLD_XFORM, WORLD_BOUND]),
+    ChangeSet.EXTENT: frozenset([WORLD_BOUND]),
+    ChangeSet.VISIBILITY: frozenset([WORLD_BOUND]),
+    ChangeSet.MATERIAL: frozenset([BOUND_MATERIAL]),
+    ChangeSet.OTHER: frozenset([WORLD_BOUND]),
+}
+
+_Key = Tuple[str, Sdf.Path, Optional[float]]
+
+
+def _time_key(time: Usd.TimeCode) -> Optional[float]:
+    return None if time.IsDefault() else time.GetValue()
+
+
+class SceneQuery:
+    """
+    The bounds, the transforms, the material bindings and the prims of the
+    stage of the UsdContext, cached for all the samples and all the
+    viewports.
+
+    The results are kept per path and per time code until a change from the
+    NoticeHub makes them stale. Only `max_entries` results are kept, the ones
+    that were not used for the longest time are dropped first.
+    """
+
+    PRIM = PRIM
+    WORLD_BOUND = WORLD_BOUND
+    WORLD_XFORM = WORLD_XFORM
+    BOUND_MATERIAL = BOUND_MATERIAL
+
+    def __init__(
+        self, usd_context_name: str = "", max_entries: int = 4096, purposes: Sequence[str] = DEFAULT_PURPOSES
+    ):
+        self._usd_context_name = usd_context_name
+        self._max_entries = max_entries
+        self._purposes = purposes
+        # The order is the order of the use, the oldest first
+        self._cache: "OrderedDict[_Key, object]" = OrderedDict()
+        # Path -> the keys of the path, for the invalidation
+        self._keys_by_path: Dict[Sdf.Path, Set[_Key]] = {}
+        # The same paths, the cached ones under a changed path are found
+        # without walking the whole cache
+        self._paths = PathSet()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+        hub = get_notice_hub(usd_context_name)
+        # The cache must be clean when the models are notified
+        self._notice_sub = hub.subscribe_objects_changed(self._on_changes, name="Scene Query", priority=100)
+        self._stage_event_sub = hub.subscribe_stage_event(
+            lambda event: self.clear(),
+            [omni.usd.StageEventType.OPENED, omni.usd.StageEventType.CLOSING],
+            name="Scene Query Stage",
+        )
+
+    def destroy(self):
+        self._notice_sub = None
+        self._stage_event_sub = None
+        self.clear()
+
+    def __len__(self):
+        return len(self._cache)
+
+    @property
+    def stage(self) -> Optional[Usd.Stage]:
+        return omni.usd.get_context(self._usd_context_name).get_stage()
+
+    def clear(self):
+        self._cache.clear()
+        self._keys_by_path = {}
+        self._paths = PathSet()
+
+    def prim(self, path: str) -> Usd.Prim:
+        """Returns the prim or an invalid prim"""
+        return self._find_prim(path, True)
+
+    def world_bound(self, path: str, time: Usd.TimeCode = Usd.TimeCode.Default()) -> Optional[Gf.Range3d]:
+        """The world axis-aligned bound, the authored extent is preferred, see `compute_world_range`"""
+        value = self._get(WORLD_BOUND, path, time)
+        return Gf.Range3d(value) if value is not None else None
+
+    def world_xform(self, path: str, time: Usd.TimeCode = Usd.TimeCode.Default()) -> Optional[Gf.Matrix4d]:
+        """The local to world transform"""
+        value = self._get(WORLD_XFORM, path, time)
+        return Gf.Matrix4d(value) if value is not None else None
+
+    def bound_material(self, path: str) -> Optional[str]:
+        """The path of the bound material or None"""
+        return self._get(BOUND_MATERIAL, path, Usd.TimeCode.Default())
+
+    def _find_prim(self, path: str, count: bool) -> Usd.Prim:
+        if not path:
+            return Usd.Prim()
+        key = (PRIM, Sdf.Path(path), None)
+        prim = self._cache.get(key)
+        # Usd.Prim expires when its subtree is recomposed
+        if prim is not None and prim.IsValid():
+            self._cache.move_to_end(key)
+            self.hits += count
+            return prim
+
+        self.misses += count
+        stage = self.stage
+        prim = stage.GetPrimAtPath(path) if stage else Usd.Prim()
+        if prim:
+            self._store(key, prim)
+        return prim
+
+    def _compute(self, field: str, prim: Usd.Prim, time: Usd.TimeCode):
+        if field == WORLD_BOUND:
+            return compute_world_range(prim, time, purposes=self._purposes)
+        if field == WORLD_XFORM:
+            return UsdGeom.Imageable(prim).ComputeLocalToWorldTransform(time)
+        material, relationship = UsdShade.MaterialBindingAPI(prim).ComputeBoundMaterial()
+        return str(material.GetPath()) if material else None
+
+    def _get(self, field: str, path: str, time: Usd.TimeCode):
+        if not path:
+            return None
+        key = (field, Sdf.Path(path), _time_key(time))
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return self._cache[key]
+
+        self.misses += 1
+        prim = self._find_prim(path, False)
+        if not prim:
+            return None
+        value = self._compute(field, prim, time)
+        self._store(key, value)
+        return value
+
+    def _store(self, key: _Key, value):
+        self._cache[key] = value
+        keys = self._keys_by_path.get(key[1])
+        if keys is None:
+            keys = self._keys_by_path[key[1]] = set()
+            self._paths.add(key[1])
+        keys.add(key)
+        while len(self._cache) > self._max_entries:
+            old_key, _ = self._cache.popitem(last=False)
+            self._forget_key(old_key)
+            self.evictions += 1
+
+    def _forget_key(self, key: _Key):
+        keys = self._keys_by_path.get(key[1])
+        if keys is None:
+            return
+        keys.discard(key)
+        if not keys:
+            del self._keys_by_path[key[1]]
+            self._paths.discard(key[1])
+
+    def _drop(self, path: Sdf.Path, fields: frozenset):
+        for key in list(self._keys_by_path.get(path, ())):
+            if key[0] in fields:
+                self._cache.pop(key, None)
+                self._forget_key(key)
+                self.invalidations += 1
+
+    def _on_changes(self, changes: ChangeSet):
+        """Called by the NoticeHub before the models"""
+        if not self._cache:
+            return
+
+        # Changed path -> the fields to forget on it and its descendants
+        subtree_fields: Dict[Sdf.Path, frozenset] = {path: _ALL_FIELDS for path in changes.resynced}
+        for path, names in changes.info_only.items():
+            if "" in names:
+                # The prim itself is changed, like its `active` or `kind`
+                subtree_fields[path] = _DATA_FIELDS | subtree_fields.get(path, frozenset())
+                continue
+            fields = frozenset().union(*(_FIELDS_BY_CLASS[c] for c in changes.get_classes(path)))
+            subtree_fields[path] = fields | subtree_fields.get(path, frozenset())
+
+        # Only the cached paths under the changed paths are looked at,
+        # O(log(cached paths)) per changed path, not O(cached paths)
+        dropped: Dict[Sdf.Path, frozenset] = {}
+        for path, fields in subtree_fields.items():
+            if not fields:
+                continue
+            for cached_path in self._paths.descendants(path):
+                dropped[cached_path] = fields | dropped.get(cached_path, frozenset())
+        for cached_path, fields in dropped.items():
+            self._drop(cached_path, fields)
+
+        # The bounds of the ancestors contain the changed prims
+        for path, fields in subtree_fields.items():
+            if WORLD_BOUND not in fields:
+                continue
+            for prefix in path.GetPrefixes()[:-1]:
+                if prefix in self._keys_by_path:
+                    self._drop(prefix, frozenset([WORLD_BOUND]))
+
+
+# UsdContext name -> SceneQuery
+_queries: Dict[str, SceneQuery] = {}
+
+
+def get_scene_query(usd_context_name: str = "") -> SceneQuery:
+    """The query of the UsdContext, it's shared by all the samples"""
+    query = _queries.get(usd_context_name)
+    if query is None:
+        query = SceneQuery(usd_context_name)
+        _queries[usd_context_name] = query
+    return query
+
+
+def _shutdown():
+    """Called when the extension is shutting down"""
+    for query in _queries.values():
+        query.destroy()
+    _queries.clear()
@@ -0,0 +1,292 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+__all__ = ["SceneNode", "SceneRecorder", "SceneSnapshot", "snapshot_build"]
+
+from typing import Any, Dict, Iterable, List, Optional
+import contextlib
+import json
+import sys
+import time
+
+from omni.ui import scene as sc
+
+# The version of the JSON file
+FORMAT_VERSION = 1
+
+
+def _to_plain(value: Any) -> Any:
+    """The value as JSON: the numbers, the strings and the lists stay, the rest is described"""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [_to_plain(item) for item in value]
+    if isinstance(value, sc.Matrix44):
+        return [float(value[i]) for i in range(16)]
+    if isinstance(value, SceneNode):
+        return value.type_name
+    if isinstance(value, sc.AbstractGesture):
+        return f"<{type(value).__name__}>"
+    if callable(value):
+        # The callbacks are not compared
+        return "<function>"
+    if hasattr(value, "name") and hasattr(value, "value"):
+        # The enums like sc.Space
+        return str(value)
+    return f"<{type(value).__name__}>"
+
+
+class _RecordedFrame:
+    """
+    The omni.ui frame of a recorded sc.Widget, its build function is kept and
+    not called. The content built inside `with` has no parent.
+    """
+
+    def __init__(self):
+        self.build_fn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+    def set_build_fn(self, fn):
+        self.build_fn = fn
+
+    def rebuild(self):
+        pass
+
+
+class SceneNode:
+    """
+    A shape or a container that `on_build` created. The arguments and the
+    properties that are set later are kept in `properties`, and the items
+    created inside `with` are the children.
+    """
+
+    def __init__(self, recorder: "SceneRecorder", type_name: str, args: tuple, kwargs: dict):
+        object.__setattr__(self, "_recorder", recorder)
+        object.__setattr__(self, "type_name", type_name)
+        object.__setattr__(self, "children", [])
+        object.__setattr__(self, "properties", dict(kwargs))
+        object.__setattr__(self, "invalidated", 0)
+        if args:
+            self.properties["args"] = list(args)
+        if type_name == "Widget":
+            object.__setattr__(self, "frame", _RecordedFrame())
+
+    def __enter__(self):
+        self._recorder._stack.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._recorder._stack.pop()
+        return False
+
+    def __getattr__(self, name: str):
+        properties = self.__dict__["properties"]
+        if name in properties:
+            return properties[name]
+        if name == "gestures":
+            return []
+        if name == "visible":
+            return True
+        raise AttributeError(f"The recorded {self.type_name} has no {name!r}")
+
+    def __setattr__(self, name: str, value):
+        self.properties[name] = value
+
+    def invalidate(self):
+        object.__setattr__(self, "invalidated", self.invalidated + 1)
+
+    def to_dict(self) -> dict:
+        data = {"type": self.type_name}
+        if self.properties:
+            data["properties"] = {name: _to_plain(value) for name, value in sorted(self.properties.items())}
+        if self.children:
+            data["children"] = [child.to_dict() for child in self.children]
+        return data
+
+    def __repr__(self):
+        return f"<SceneNode {self.type_name} children={len(self.children)}>"
+
+
+class _RecordedType:
+    """Stands for a class of omni.ui.scene, creating it creates a SceneNode"""
+
+    def __init__(self, recorder: "SceneRecorder", cls: type):
+        self._recorder = recorder
+        self._cls = cls
+
+    def __call__(self, *args, **kwargs) -> SceneNode:
+        return self._recorder._add(SceneNode(self._recorder, self._cls.__name__, args, kwargs))
+
+    def __getattr__(self, name: str):
+        # The nested enums like sc.Transform.LookAt
+        return getattr(self._cls, name)
+
+
+class SceneRecorder:
+    """
+    Stands for the `omni.ui.scene` module while the manipulator builds. The
+    shapes and the containers are recorded as SceneNode, everything else,
+    like the gestures, Matrix44 and the enums, is the real omni.ui.scene.
+    Nothing is rendered, so it works without the GPU:
+
+        recorder = SceneRecorder()
+        with recorder.install(light_manipulator_module):
+            manipulator.on_build()
+        snapshot = recorder.snapshot()
+    """
+
+    def __init__(self):
+        self._roots: List[SceneNode] = []
+        self._stack: List[SceneNode] = []
+        self._types: Dict[str, _RecordedType] = {}
+
+    def __getattr__(self, name: str):
+        value = getattr(sc, name)
+        if isinstance(value, type) and issubclass(value, sc.AbstractItem) and not issubclass(value, sc.Manipulator):
+            recorded = self._types.get(name)
+            if recorded is None:
+                recorded = _RecordedType(self, value)
+                self._types[name] = recorded
+            return recorded
+        return value
+
+    def _add(self, node: SceneNode) -> SceneNode:
+        if self._stack:
+            self._stack[-1].children.append(node)
+        else:
+            self._roots.append(node)
+        return node
+
+    @contextlib.contextmanager
+    def install(self, *modules):
+        """
+        Replaces omni.ui.scene in the modules with the recorder. The modules
+        are the module objects or their names.
+        """
+        patched = []
+        try:
+            for module in modules:
+                if isinstance(module, str):
+                    module = sys.modules[module]
+                for name, value in list(vars(module).items()):
+                    if value is sc:
+                        setattr(module, name, self)
+                        patched.append((module, name))
+            yield self
+        finally:
+            for module, name in patched:
+                setattr(module, name, sc)
+
+    def clear(self):
+        self._roots = []
+        self._stack = []
+
+    def snapshot(self) -> "SceneSnapshot":
+        return SceneSnapshot([root.to_dict() for root in self._roots])
+
+
+class SceneSnapshot:
+    """
+    The shape tree in plain dicts, so it can be saved to JSON and compared
+    with another one. `diff` compares the types, the properties and the
+    children, the floats are compared with a tolerance.
+    """
+
+    def __init__(self, roots: List[dict], build_time: float = 0.0):
+        self.roots = roots
+        # The time of `on_build` when it's made by `snapshot_build`
+        self.build_time = build_time
+
+    def count(self, type_name: Optional[str] = None) -> int:
+        """The number of the nodes, or only the ones of the type"""
+        return sum(1 for node in self.nodes() if type_name is None or node["type"] == type_name)
+
+    def nodes(self) -> Iterable[dict]:
+        """All the nodes, depth first"""
+        stack = list(reversed(self.roots))
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.get("children", [])))
+
+    def find(self, type_name: str) -> List[dict]:
+        return [node for node in self.nodes() if node["type"] == type_name]
+
+    def to_json(self) -> str:
+        return json.dumps({"version": FORMAT_VERSION, "roots": self.roots}, indent=1, sort_keys=True)
+
+    def save(self, path: str):
+        with open(path, "w") as f:
+            f.write(self.to_json())
+
+    @classmethod
+    def load(cls, path: str) -> "SceneSnapshot":
+        with open(path) as f:
+            data = json.load(f)
+        if data.get("version") != FORMAT_VERSION:
+            raise ValueError(f"{path} has the version {data.get('version')}, {FORMAT_VERSION} is expected")
+        return cls(data["roots"])
+
+    def diff(self, other: "SceneSnapshot", tolerance: float = 1e-5) -> List[str]:
+        """The differences, like "Transform[0]/Line[1].color: 1 != 2". Empty when they are the same."""
+        differences = []
+        _diff_children(self.roots, other.roots, "", tolerance, differences)
+        return differences
+
+    def __eq__(self, other):
+        return isinstance(other, SceneSnapshot) and not self.diff(other)
+
+    def __repr__(self):
+        return f"<SceneSnapshot nodes={self.count()}>"
+
+
+def _diff_children(left: List[dict], right: List[dict], path: str, tolerance: float, differences: List[str]):
+    if len(left) != len(right):
+        differences.append(f"{path or '/'}: {len(left)} children != {len(right)}")
+    for i, (a, b) in enumerate(zip(left, right)):
+        node_path = f"{path}/{a['type']}[{i}]"
+        if a["type"] != b["type"]:
+            differences.append(f"{node_path}: {a['type']} != {b['type']}")
+            continue
+        properties_a = a.get("properties", {})
+        properties_b = b.get("properties", {})
+        for name in sorted(set(properties_a) | set(properties_b)):
+            value_a = properties_a.get(name)
+            value_b = properties_b.get(name)
+            if not _same(value_a, value_b, tolerance):
+                differences.append(f"{node_path}.{name}: {value_a} != {value_b}")
+        _diff_children(a.get("children", []), b.get("children", []), node_path, tolerance, differences)
+
+
+def _same(a, b, tolerance: float) -> bool:
+    if isinstance(a, (int, float)) and isinstance(b, (int, float)) and not isinstance(a, bool):
+        return abs(a - b) <= tolerance
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(_same(x, y, tolerance) for x, y in zip(a, b))
+    return a == b
+
+
+def snapshot_build(manipulator: sc.Manipulator, *modules) -> SceneSnapshot:
+    """
+    Calls `on_build` of the manipulator with the recorder and returns what it
+    built. The module of the manipulator is patched, and the other modules
+    that create the shapes for it.
+    """
+    recorder = SceneRecorder()
+    with recorder.install(type(manipulator).__module__, *modules):
+        start = time.perf_counter()
+        manipulator.on_build()
+        build_time = time.perf_counter() - start
+    snapshot = recorder.snapshot()
+    snapshot.build_time = build_time
+    return snapshot
@@ -0,0 +1,268 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+__all__ = ["SelectionSnapshot"]
+
+from typing import Callable, Dict, Iterable, Optional, Sequence, Tuple
+
+from pxr import Gf
+from pxr import Sdf
+from pxr import Usd
+from pxr import UsdLux
+from pxr import UsdShade
+import omni.kit.app
+import omni.usd
+
+from .bounds import DEFAULT_PURPOSES
+from .bounds import compute_world_range
+from .prim_handle import PrimHandle
+from .scene_query import SceneQuery
+
+# The names of the derived fields, they are used to invalidate them
+MATERIAL = "material"
+WORLD_RANGE = "world_range"
+LOCAL_SRT = "local_srt"
+LIGHT = "light"
+
+
+def _compute_material(prim: Usd.Prim, time: Usd.TimeCode, purposes) -> Optional[str]:
+    material, relationship = UsdShade.MaterialBindingAPI(prim).ComputeBoundMaterial()
+    return str(material.GetPath()) if material else None
+
+
+def _compute_world_range(prim: Usd.Prim, time: Usd.TimeCode, purposes) -> Gf.Range3d:
+    return compute_world_range(prim, time, purposes=purposes)
+
+
+def _compute_local_srt(prim: Usd.Prim, time: Usd.TimeCode, purposes) -> tuple:
+    return omni.usd.get_local_transform_SRT(prim, time)
+
+
+def _get_attr(attr: Usd.Attribute, time: Usd.TimeCode):
+    return attr.Get(time) if attr else None
+
+
+def _compute_light(prim: Usd.Prim, time: Usd.TimeCode, purposes) -> Dict[str, float]:
+    if prim.IsA(UsdLux.RectLight):
+        rect_light = UsdLux.RectLight(prim)
+        return {
+            "intensity": _get_attr(rect_light.GetIntensityAttr(), time),
+            "width": _get_attr(rect_light.GetWidthAttr(), time),
+            "height": _get_attr(rect_light.GetHeightAttr(), time),
+        }
+
+    # The light attributes are in UsdLux.LightAPI since USD 21.11, and in
+    # UsdLux.Light before
+    light = UsdLux.LightAPI(prim) if hasattr(UsdLux, "LightAPI") else UsdLux.Light(prim)
+    return {"intensity": _get_attr(light.GetIntensityAttr(), time)}
+
+
+_COMPUTE: Dict[str, Callable] = {
+    MATERIAL: _compute_material,
+    WORLD_RANGE: _compute_world_range,
+    LOCAL_SRT: _compute_local_srt,
+    LIGHT: _compute_light,
+}
+
+
+class SelectionSnapshot:
+    """
+    The selected paths at the moment of the selection change, and the data
+    derived from them.
+
+    Nothing is computed when the snapshot is created. The material, the bound,
+    the local transform and the light parameters are computed when they are
+    requested the first time, and then they are kept until they are
+    invalidated. Clicking quickly through the stage only costs the paths.
+
+    When `query` is set, the material and the bound are taken from the
+    SceneQuery, so they are shared with the other samples.
+    """
+
+    # The names of the fields for `invalidate`
+    MATERIAL = MATERIAL
+    WORLD_RANGE = WORLD_RANGE
+    LOCAL_SRT = LOCAL_SRT
+    LIGHT = LIGHT
+
+    def __init__(
+        self,
+        stage: Optional[Usd.Stage],
+        paths: Sequence[str],
+        time: Usd.TimeCode = Usd.TimeCode.Default(),
+        purposes: Sequence[str] = DEFAULT_PURPOSES,
+        query: Optional[SceneQuery] = None,
+    ):
+        self._stage = stage
+        self._query = query
+        self._paths = tuple(paths)
+        self._time = time
+        self._purposes = purposes
+        # Path -> field -> value, so forgetting a path is a single pop
+        self._cache: Dict[str, Dict[str, object]] = {}
+        # The prims are looked up once per path
+        self._handles: Dict[str, PrimHandle] = {}
+        # Field -> the number of times it was computed
+        self.compute_counts: Dict[str, int] = {}
+
+    @property
+    def paths(self) -> Tuple[str, ...]:
+        return self._paths
+
+    @property
+    def primary(self) -> str:
+        """The first selected path, or an empty string"""
+        return self._paths[0] if self._paths else ""
+
+    @property
+    def stage(self) -> Optional[Usd.Stage]:
+        return self._stage
+
+    @property
+    def time(self) -> Usd.TimeCode:
+        return self._time
+
+    def __bool__(self):
+        return bool(self._paths)
+
+    def __contains__(self, path: str):
+        return path in self._paths
+
+    @property
+    def prim_lookups(self) -> int:
+        """The times the selected paths were looked up in the stage"""
+        return sum(handle.lookups for handle in self._handles.values())
+
+    @property
+    def prim_lookups_avoided(self) -> int:
+        """The times the kept prims were returned instead of the lookup"""
+        return sum(handle.lookups_avoided for handle in self._handles.values())
+
+    def prim(self, path: str) -> Usd.Prim:
+        """Returns the prim, it's kept until it expires or it's resynced"""
+        handle = self._handles.get(path)
+        if handle is None:
+            if not self._stage or not path:
+                return Usd.Prim()
+            handle = PrimHandle(self._stage, path)
+            self._handles[path] = handle
+        return handle.get()
+
+    def invalidate_prims(self, resynced: Iterable[Sdf.Path]):
+        """
+        Forget the prims under the resynced paths and all the data derived
+        from them.
+        """
+        resynced = set(resynced)
+        if not resynced:
+            return
+        # The ancestors of every path are looked up in the set, O(paths * depth)
+        paths = [path for path in self._paths if any(prefix in resynced for prefix in Sdf.Path(path).GetPrefixes())]
+        for path in paths:
+            handle = self._handles.get(path)
+            if handle:
+                handle.invalidate()
+        self.invalidate_paths(paths)
+
+    def material(self, path: str) -> Optional[str]:
+        """The path of the bound material or None"""
+        return self._get(MATERIAL, path)
+
+    def world_range(self, path: str) -> Optional[Gf.Range3d]:
+        """The world axis-aligned bound, the authored extent is preferred"""
+        return self._get(WORLD_RANGE, path)
+
+    def local_srt(self, path: str) -> Optional[tuple]:
+        """(scale, rotation euler, rotation order, translation) like omni.usd.get_local_transform_SRT"""
+        return self._get(LOCAL_SRT, path)
+
+    def light_parameters(self, path: str) -> Optional[Dict[str, float]]:
+        """The intensity of the light, and the width and the height of the rect light"""
+        return self._get(LIGHT, path)
+
+    def update(self, added: Sequence[str] = (), removed: Iterable[str] = (), primary: str = ""):
+        """
+        Apply the change of the selection. The data of the prims that stay
+        selected is kept. The `primary` path is moved to the front when it's
+        selected.
+        """
+        removed = set(removed)
+        self.invalidate_paths(removed)
+        for path in removed:
+            self._handles.pop(path, None)
+        kept = [path for path in self._paths if path not in removed]
+        kept_set = set(kept)
+        paths = kept + [path for path in added if path not in kept_set]
+        if primary and paths and paths[0] != primary and primary in kept_set | set(added):
+            paths.remove(primary)
+            paths.insert(0, primary)
+        self._paths = tuple(paths)
+
+    def rebind(self, moved: Dict[str, Optional[str]]):
+        """
+        Follow the prims that are renamed or reparented: old path -> new path,
+        or None when the prim is removed. The data of the moved prims is
+        forgotten, the data of the other prims is kept.
+        """
+        self.invalidate_paths(moved)
+        for old_path in moved:
+            self._handles.pop(old_path, None)
+        self._paths = tuple(path for path in (moved.get(path, path) for path in self._paths) if path)
+
+    async def prefetch_async(self, fields: Sequence[str], chunk_size: int = 64):
+        """
+        Compute the fields of all the paths, `chunk_size` prims per frame, so
+        a big selection doesn't stall a single frame. Cancel the task to stop
+        it, the computed data is kept.
+        """
+        app = omni.kit.app.get_app()
+        for i, path in enumerate(self._paths):
+            if i and i % chunk_size == 0:
+                await app.next_update_async()
+            for field in fields:
+                self._get(field, path)
+
+    def invalidate(self, path: Optional[str] = None, fields: Optional[Sequence[str]] = None):
+        """
+        Forget the derived data of the path, or of all the paths when it's
+        None. Only the given fields are forgotten when `fields` is set.
+        """
+        if path is None:
+            if fields is None:
+                self._cache = {}
+            else:
+                self.invalidate_paths(list(self._cache), fields)
+            return
+        self.invalidate_paths([path], fields)
+
+    def invalidate_paths(self, paths: Iterable[str], fields: Optional[Sequence[str]] = None):
+        """Forget the derived data of the paths in one pass, O(paths)"""
+        for path in paths:
+            if fields is None:
+                self._cache.pop(path, None)
+                continue
+            values = self._cache.get(path)
+            if values:
+                for field in fields:
+                    values.pop(field, None)
+
+    def _get(self, field: str, path: str):
+        values = self._cache.get(path)
+        if values is not None and field in values:
+            return values[field]
+
+        if self._query and field == MATERIAL:
+            value = self._query.bound_material(path)
+        elif self._query and field == WORLD_RANGE:
+            value = self._query.world_bound(path, self._time)
+        else:
+            prim = self.prim(path)
+            value = _COMPUTE[field](prim, self._time, self._purposes) if prim else None
+        self.compute_counts[field] = self.compute_counts.get(field, 0) + 1
+        self._cache.setdefault(path, {})[field] = value
+        return value
@@ -0,0 +1,254 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+__all__ = ["SelectionAdapter", "SelectionDelta", "get_selection_adapter"]
+
+from typing import Awaitable, Callable, Dict, FrozenSet, List, Sequence, Tuple
+import asyncio
+
+import carb
+import omni.kit.app
+import omni.usd
+
+from .instrumentation import span
+from .notice_hub import SubscriberStats
+from .notice_hub import _Subscription
+from .notice_hub import _call
+from .notice_hub import get_notice_hub
+
+
+class SelectionDelta:
+    """What is changed in the selection since the previous event"""
+
+    def __init__(self, added: Sequence[str], removed: Sequence[str], primary: str, count: int):
+        # The added paths in the order of the selection
+        self.added: Tuple[str, ...] = tuple(added)
+        self.removed: FrozenSet[str] = frozenset(removed)
+        # The first selected path, or an empty string
+        self.primary = primary
+        # The number of the selected paths
+        self.count = count
+
+    def __bool__(self):
+        return bool(self.added or self.removed)
+
+    def __repr__(self):
+        return f"<SelectionDelta +{len(self.added)} -{len(self.removed)} primary={self.primary!r}>"
+
+
+class SelectionAdapter:
+    """
+    Reads the Kit selection once per SELECTION_CHANGED event for all the
+    samples, and tells them what is added and removed.
+
+    The subscribers get a SelectionDelta, so a model that shows a single prim
+    only looks at `primary`, and a model that shows many prims only processes
+    the prims that are added or removed. The full selection is still in
+    `paths` for the models that need it.
+
+    The events are debounced: the selection is read when there was no new
+    event for `debounce_frames` frames, so dragging a marquee or walking the
+    stage tree with the arrows delivers only the final selection. The async
+    subscribers are coroutines that can compute the derived data over a few
+    frames. They are cancelled when the selection changes again.
+    """
+
+    def __init__(self, usd_context_name: str = "", debounce_frames: int = 1):
+        self._usd_context_name = usd_context_name
+        self._debounce_frames = debounce_frames
+        self._paths: Tuple[str, ...] = ()
+        self._path_set: FrozenSet[str] = frozenset()
+        self._next_key = 0
+        self._subscribers: Dict[int, Tuple[Callable[[SelectionDelta], None], SubscriberStats]] = {}
+        self._async_subscribers: Dict[int, Tuple[Callable[[SelectionDelta], Awaitable], SubscriberStats]] = {}
+        # The frames without the selection events
+        self._quiet_frames = 0
+        self._debounce_task = None
+        self._async_tasks: List[asyncio.Future] = []
+        # The models created later, on the first selection, start from what is
+        # selected now
+        usd_context = omni.usd.get_context(usd_context_name)
+        if usd_context and usd_context.get_stage():
+            self._paths = tuple(usd_context.get_selection().get_selected_prim_paths())
+            self._path_set = frozenset(self._paths)
+        self._stage_event_sub = get_notice_hub(usd_context_name).subscribe_stage_event(
+            self._on_stage_event,
+            [omni.usd.StageEventType.SELECTION_CHANGED, omni.usd.StageEventType.CLOSING],
+            name="Selection Adapter",
+        )
+
+    def destroy(self):
+        self._stage_event_sub = None
+        self._cancel_debounce()
+        self._cancel_async_tasks()
+        self._subscribers = {}
+        self._async_subscribers = {}
+
+    @property
+    def paths(self) -> Tuple[str, ...]:
+        """All the selected paths"""
+        return self._paths
+
+    @property
+    def primary(self) -> str:
+        """The first selected path, or an empty string"""
+        return self._paths[0] if self._paths else ""
+
+    def __contains__(self, path: str):
+        return path in self._path_set
+
+    def __len__(self):
+        return len(self._paths)
+
+    def subscribe(self, fn: Callable[[SelectionDelta], None], name: str = "", current: bool = False) -> _Subscription:
+        """
+        Call `fn` with the SelectionDelta when the selection is changed. Keep
+        the returned object, the subscription ends when it's released. When
+        `current` is set and something is selected, `fn` is called right away
+        with all the selected paths as added.
+        """
+        subscription = self._add(self._subscribers, fn, name)
+        if current and self._paths:
+            # Only the new subscriber, the others have seen this selection
+            stats = self._subscribers[subscription._key][1]
+            _call(fn, stats, self._current_delta())
+        return subscription
+
+    def subscribe_async(
+        self, fn: Callable[[SelectionDelta], Awaitable], name: str = "", current: bool = False
+    ) -> _Subscription:
+        """
+        Run the coroutine `fn` with the SelectionDelta on the Kit loop after
+        the regular subscribers. It's cancelled when the selection is changed
+        before it's finished. `current` is the same as in `subscribe`.
+        """
+        subscription = self._add(self._async_subscribers, fn, name)
+        if current and self._paths:
+            stats = self._async_subscribers[subscription._key][1]
+            self._async_tasks.append(asyncio.ensure_future(self._run_async(fn, stats, self._current_delta())))
+        return subscription
+
+    def get_stats(self) -> Dict[str, SubscriberStats]:
+        subscribers = list(self._subscribers.values()) + list(self._async_subscribers.values())
+        return {stats.name: stats for fn, stats in subscribers}
+
+    def flush(self):
+        """Read the selection and deliver it now, without waiting for it to settle"""
+        self._cancel_debounce()
+        # The only copy of the selection, it's shared by all the samples
+        selection = omni.usd.get_context(self._usd_context_name).get_selection()
+        self._update(tuple(selection.get_selected_prim_paths()))
+
+    def _current_delta(self) -> SelectionDelta:
+        """Everything that is selected, as added"""
+        return SelectionDelta(self._paths, (), self.primary, len(self._paths))
+
+    def _add(self, subscribers: Dict, fn: Callable, name: str) -> _Subscription:
+        key = self._next_key
+        self._next_key += 1
+        subscribers[key] = (fn, SubscriberStats(name or repr(fn)))
+        return _Subscription(self, key)
+
+    def _unsubscribe(self, key: int):
+        self._subscribers.pop(key, None)
+        self._async_subscribers.pop(key, None)
+
+    def _on_stage_event(self, event):
+        # The work for the previous selection is not needed anymore
+        self._cancel_async_tasks()
+
+        if event.type == int(omni.usd.StageEventType.CLOSING):
+            self._cancel_debounce()
+            self._update(())
+        elif self._debounce_frames <= 0:
+            self.flush()
+        else:
+            self._quiet_frames = 0
+            if self._debounce_task is None:
+                self._debounce_task = asyncio.ensure_future(self._debounce())
+
+    async def _debounce(self):
+        app = omni.kit.app.get_app()
+        while self._quiet_frames < self._debounce_frames:
+            await app.next_update_async()
+            self._quiet_frames += 1
+        self._debounce_task = None
+        self.flush()
+
+    def _cancel_debounce(self):
+        if self._debounce_task:
+            self._debounce_task.cancel()
+            self._debounce_task = None
+
+    def _cancel_async_tasks(self):
+        for task in self._async_tasks:
+            task.cancel()
+        self._async_tasks = []
+
+    async def _run_async(self, fn: Callable[[SelectionDelta], Awaitable], stats: SubscriberStats, delta):
+        stats.delivered += 1
+        try:
+            await fn(delta)
+        except asyncio.CancelledError:
+            stats.cancelled += 1
+        except Exception as e:
+            carb.log_error(f"{stats.name} failed: {e}")
+
+    def _update(self, paths: Tuple[str, ...]):
+        old_primary = self.primary
+        old_set = self._path_set
+        path_set = frozenset(paths)
+        # O(n) once for all the subscribers
+        delta = SelectionDelta(
+            [path for path in paths if path not in old_set],
+            old_set - path_set,
+            paths[0] if paths else "",
+            len(paths),
+        )
+        self._paths = paths
+        self._path_set = path_set
+        if not delta and delta.primary == old_primary:
+            # The same selection, maybe in a different order
+            return
+
+        with span(
+            "SelectionAdapter.update",
+            primary=delta.primary,
+            added=len(delta.added),
+            removed=len(delta.removed),
+            count=delta.count,
+        ):
+            # The subscribers can unsubscribe in the callback
+            for fn, stats in list(self._subscribers.values()):
+                _call(fn, stats, delta)
+
+        self._cancel_async_tasks()
+        self._async_tasks = [
+            asyncio.ensure_future(self._run_async(fn, stats, delta))
+            for fn, stats in list(self._async_subscribers.values())
+        ]
+
+
+# UsdContext name -> SelectionAdapter
+_adapters: Dict[str, SelectionAdapter] = {}
+
+
+def get_selection_adapter(usd_context_name: str = "") -> SelectionAdapter:
+    """The adapter of the UsdContext, it's shared by all the samples"""
+    adapter = _adapters.get(usd_context_name)
+    if adapter is None:
+        adapter = SelectionAdapter(usd_context_name)
+        _adapters[usd_context_name] = adapter
+    return adapter
+
+
+def _shutdown():
+    """Called when the extension is shutting down"""
+    for adapter in _adapters.values():
+        adapter.destroy()
+    _adapters.clear()
@@ -0,0 +1,133 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+__all__ = ["SelectionTrigger"]
+
+from typing import Callable, Sequence
+import asyncio
+import sys
+
+import carb
+import omni.kit.app
+import omni.usd
+
+
+class SelectionTrigger:
+    """
+    Calls `fn` once, when a prim of one of `type_names` is selected for the
+    first time, or any prim when `type_names` is empty. If such a prim is
+    already selected, `fn` is called right away.
+
+    The samples create their models and scenes in `fn`, so enabling an
+    extension only costs this subscription until the user selects something
+    the extension shows. It doesn't import the modules of the samples or USD.
+
+    When another sample already created the shared SelectionAdapter, the
+    primary path of its debounced selection is checked. Otherwise the
+    selection is read when there was no new SELECTION_CHANGED event for
+    `debounce_frames` frames, so a marquee drag reads it once.
+    """
+
+    def __init__(
+        self,
+        fn: Callable[[], None],
+        type_names: Sequence[str] = (),
+        usd_context_name: str = "",
+        name: str = "",
+        debounce_frames: int = 1,
+    ):
+        self._fn = fn
+        self._type_names = frozenset(type_names)
+        self._usd_context_name = usd_context_name
+        self._debounce_frames = debounce_frames
+        self._triggered = False
+        self._stage_event_sub = None
+        self._selection_sub = None
+        self._quiet_frames = 0
+        self._debounce_task = None
+
+        adapter = self._get_selection_adapter()
+        primary = adapter.primary if adapter else self._read_primary()
+        if self._is_relevant(primary):
+            self._trigger()
+            return
+
+        if adapter:
+            self._selection_sub = adapter.subscribe(
+                lambda delta: self._check(delta.primary), name=name or "SelectionTrigger"
+            )
+        else:
+            self._stage_event_sub = (
+                omni.usd.get_context(usd_context_name)
+                .get_stage_event_stream()
+                .create_subscription_to_pop(self._on_stage_event, name=name or "SelectionTrigger")
+            )
+
+    def destroy(self):
+        self._stage_event_sub = None
+        self._selection_sub = None
+        if self._debounce_task:
+            self._debounce_task.cancel()
+            self._debounce_task = None
+        self._fn = None
+
+    @property
+    def triggered(self) -> bool:
+        return self._triggered
+
+    def _get_selection_adapter(self):
+        """The shared SelectionAdapter if it's already created, it's not imported here"""
+        module = sys.modules.get(f"{__name__.rpartition('.')[0]}.selection_adapter")
+        return module._adapters.get(self._usd_context_name) if module else None
+
+    def _read_primary(self) -> str:
+        usd_context = omni.usd.get_context(self._usd_context_name)
+        if not usd_context or not usd_context.get_stage():
+            return ""
+        paths = usd_context.get_selection().get_selected_prim_paths()
+        return paths[0] if paths else ""
+
+    def _is_relevant(self, primary: str) -> bool:
+        if not primary:
+            return False
+        if not self._type_names:
+            return True
+        stage = omni.usd.get_context(self._usd_context_name).get_stage()
+        prim = stage.GetPrimAtPath(primary) if stage else None
+        return bool(prim) and prim.GetTypeName() in self._type_names
+
+    def _check(self, primary: str):
+        if self._fn and self._is_relevant(primary):
+            self._trigger()
+
+    def _on_stage_event(self, event):
+        if event.type != int(omni.usd.StageEventType.SELECTION_CHANGED):
+            return
+        if self._debounce_frames <= 0:
+            self._check(self._read_primary())
+            return
+        self._quiet_frames = 0
+        if self._debounce_task is None:
+            self._debounce_task = asyncio.ensure_future(self._debounce())
+
+    async def _debounce(self):
+        app = omni.kit.app.get_app()
+        while self._quiet_frames < self._debounce_frames:
+            await app.next_update_async()
+            self._quiet_frames += 1
+        self._debounce_task = None
+        self._check(self._read_primary())
+
+    def _trigger(self):
+        fn = self._fn
+        self.destroy()
+        self._triggered = True
+        try:
+            fn()
+        except Exception as e:
+            carb.log_error(f"Failed to start on the selection: {e}")
@@ -0,0 +1,24 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+from .test_bounds import TestBounds
+from .test_extension import TestExtension
+from .test_gesture_latency import TestGestureLatency
+from .test_gesture_recorder import TestGestureRecorder
+from .test_instancing import TestInstancing
+from .test_instrumentation import TestInstrumentation
+from .test_notice_hub import TestNoticeHub
+from .test_point_instancer import TestPointInstancer
+from .test_prim_handle import TestPrimHandle
+from .test_profiler import TestProfiler
+from .test_scene_query import TestSceneQuery
+from .test_scene_snapshot import TestSceneSnapshot
+from .test_selection import TestSelection
+from .test_selection_adapter import TestSelectionAdapter
+from .test_selection_trigger import TestSelectionTrigger
+from .test_viewport_tracker import TestViewportTracker
@@ -0,0 +1,72 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+__all__ = ["TestBounds"]
+
+from omni.example.ui_scene.common import compute_world_range
+from omni.example.ui_scene.common import get_authored_extent
+from pxr import Gf
+from pxr import Usd
+from pxr import UsdGeom
+import omni.kit.test
+
+
+class TestBounds(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self._stage = Usd.Stage.CreateInMemory()
+        self._time = Usd.TimeCode.Default()
+
+    async def tearDown(self):
+        self._stage = None
+
+    async def test_extents_hint(self):
+        """extentsHint wins over the children"""
+        model = UsdGeom.Xform.Define(self._stage, "/Model")
+        model.AddTranslateOp().Set(Gf.Vec3d(10, 0, 0))
+        cube = UsdGeom.Cube.Define(self._stage, "/Model/Cube")
+        cube.CreateExtentAttr([(-1, -1, -1), (1, 1, 1)])
+        UsdGeom.ModelAPI.Apply(model.GetPrim()).SetExtentsHint([(-2, -2, -2), (2, 2, 2)])
+
+        range = compute_world_range(model.GetPrim(), self._time)
+        self.assertEqual(range.GetMin(), Gf.Vec3d(8, -2, -2))
+        self.assertEqual(range.GetMax(), Gf.Vec3d(12, 2, 2))
+
+    async def test_invalid_extents_hint(self):
+        """Empty extentsHint is ignored and the subtree is traversed"""
+        model = UsdGeom.Xform.Define(self._stage, "/Model")
+        cube = UsdGeom.Cube.Define(self._stage, "/Model/Cube")
+        cube.CreateExtentAttr([(-1, -1, -1), (1, 1, 1)])
+        UsdGeom.ModelAPI.Apply(model.GetPrim()).SetExtentsHint([(1, 1, 1), (-1, -1, -1)])
+
+        self.assertIsNone(get_authored_extent(model.GetPrim(), self._time))
+        range = compute_world_range(model.GetPrim(), self._time)
+        self.assertEqual(range.GetMin(), Gf.Vec3d(-1, -1, -1))
+        self.assertEqual(range.GetMax(), Gf.Vec3d(1, 1, 1))
+
+    async def test_extent(self):
+        """The extent of a Boundable is used without computing it"""
+        cube = UsdGeom.Cube.Define(self._stage, "/Cube")
+        cube.CreateExtentAttr([(0, 0, 0), (3, 3, 3)])
+
+        extent = get_authored_extent(cube.GetPrim(), self._time)
+        self.assertEqual(extent.GetMax(), Gf.Vec3d(3, 3, 3))
+
+    async def test_unloaded_payload(self):
+        """The hint is on the prim with the payload, so the payload is not needed"""
+        asset = Usd.Stage.CreateInMemory()
+        UsdGeom.Cube.Define(asset, "/Asset/Cube").CreateExtentAttr([(-1, -1, -1), (1, 1, 1)])
+        asset.SetDefaultPrim(asset.GetPrimAtPath("/Asset"))
+
+        model = UsdGeom.Xform.Define(self._stage, "/Model")
+        model.GetPrim().GetPayloads().AddPayload(asset.GetRootLayer().identifier)
+        UsdGeom.ModelAPI.Apply(model.GetPrim()).SetExtentsHint([(-1, -1, -1), (1, 1, 1)])
+        self._stage.Unload("/Model")
+
+        range = compute_world_range(model.GetPrim(), self._time)
+        self.assertFalse(model.GetPrim().IsLoaded())
+        self.assertEqual(range.GetMax(), Gf.Vec3d(1, 1, 1))
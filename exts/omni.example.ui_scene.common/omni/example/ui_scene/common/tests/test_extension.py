@@ -0,0 +1,39 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+__all__ = ["TestExtension"]
+
+from omni.example.ui_scene.common import CommonExtension
+from omni.example.ui_scene.common import get_gesture_latency
+from omni.example.ui_scene.common import get_instrumentation
+from omni.example.ui_scene.common import get_notice_hub
+from omni.example.ui_scene.common import get_scene_query
+from omni.example.ui_scene.common import get_selection_adapter
+from omni.example.ui_scene.common import gesture_latency
+from omni.example.ui_scene.common import instrumentation
+import omni.kit.test
+
+
+class TestExtension(omni.kit.test.AsyncTestCase):
+    async def test_shutdown(self):
+        """The shared objects are destroyed and created again on the next use"""
+        hub = get_notice_hub()
+        query = get_scene_query()
+        adapter = get_selection_adapter()
+        get_instrumentation()
+        get_gesture_latency()
+
+        CommonExtension().on_shutdown()
+
+        self.assertIsNone(instrumentation._setting_sub)
+        self.assertIsNone(instrumentation._instrumentation)
+        self.assertIsNone(gesture_latency._setting_sub)
+        self.assertIsNone(gesture_latency._latency)
+        self.assertIsNot(get_notice_hub(), hub)
+        self.assertIsNot(get_scene_query(), query)
+        self.assertIsNot(get_selection_adapter(), adapter)
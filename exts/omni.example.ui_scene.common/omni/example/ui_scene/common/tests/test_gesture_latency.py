@@ -0,0 +1,70 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+__all__ = ["TestGestureLatency"]
+
+from omni.example.ui_scene.common import GestureLatency
+import omni.kit.test
+
+
+class TestGestureLatency(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self._latency = GestureLatency(timeout_frames=2)
+
+    async def tearDown(self):
+        self._latency.destroy()
+
+    def _drag(self, gesture_type="Test.drag"):
+        correlation_id = self._latency.begin(gesture_type)
+        for stage in (GestureLatency.WRITE, GestureLatency.NOTICE, GestureLatency.MODEL_UPDATED, GestureLatency.REDRAW):
+            self._latency.mark(stage)
+        return correlation_id
+
+    async def test_completed(self):
+        for _ in range(3):
+            self._drag()
+            self._latency.end_frame()
+
+        self.assertEqual(self._latency.get_counts()["Test.drag"], {"completed": 3, "coalesced": 0, "incomplete": 0})
+        percentiles = self._latency.get_percentiles((50, 99))["Test.drag"]
+        self.assertEqual(set(percentiles), {"write", "notice", "model_updated", "redraw", "frame", "total"})
+        for stage in percentiles.values():
+            self.assertGreaterEqual(stage[99], stage[50])
+            self.assertGreaterEqual(stage[50], 0.0)
+        # The frame finishes the event
+        self.assertIsNone(self._latency.correlation_id)
+
+    async def test_coalesced(self):
+        # Two input events in the same frame, only the last one is written
+        self._latency.begin("Test.drag")
+        self._drag()
+        self._latency.end_frame()
+
+        self.assertEqual(self._latency.get_counts()["Test.drag"], {"completed": 1, "coalesced": 1, "incomplete": 0})
+
+    async def test_resume(self):
+        # The write is deferred to the next frame, like the scale of the widget
+        correlation_id = self._latency.begin("Test.slider")
+        self.assertEqual(self._latency.correlation_id, correlation_id)
+        self._latency.end_frame()
+        self.assertTrue(self._latency.resume(correlation_id))
+        self._latency.mark(GestureLatency.WRITE)
+        self._latency.mark(GestureLatency.REDRAW)
+        self._latency.end_frame()
+
+        self.assertEqual(self._latency.get_counts()["Test.slider"]["completed"], 1)
+        self.assertFalse(self._latency.resume(correlation_id))
+
+    async def test_incomplete(self):
+        # Nothing is redrawn, like a drag that doesn't change anything
+        self._latency.begin("Test.drag")
+        for _ in range(3):
+            self._latency.end_frame()
+
+        self.assertEqual(self._latency.get_counts()["Test.drag"], {"completed": 0, "coalesced": 0, "incomplete": 1})
+        self.assertEqual(self._latency.get_percentiles(), {})
@@ -0,0 +1,93 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+__all__ = ["TestGestureRecorder"]
+
+from omni.example.ui_scene.common import GestureEvent
+from omni.example.ui_scene.common import GestureRecording
+from omni.example.ui_scene.common import GestureReplayer
+from omni.example.ui_scene.common import instrumented
+from omni.example.ui_scene.common import record_gesture
+from omni.example.ui_scene.common import start_gesture_recording
+from omni.example.ui_scene.common import stop_gesture_recording
+from pxr import UsdGeom
+import os
+import tempfile
+import omni.kit.app
+import omni.kit.test
+import omni.usd
+
+
+class _Target:
+    """Moves the cube like a drag gesture does"""
+
+    def __init__(self, stage):
+        self.cube = UsdGeom.Cube.Define(stage, "/Cube")
+        self.events = []
+
+    @instrumented("Test.replay")
+    def replay_gesture(self, event: GestureEvent):
+        self.events.append((event.state, event.values.get("x")))
+        if event.state == "changed":
+            self.cube.GetSizeAttr().Set(event.values["x"])
+
+
+class TestGestureRecorder(omni.kit.test.AsyncTestCase):
+    async def tearDown(self):
+        stop_gesture_recording()
+
+    async def test_record(self):
+        await omni.usd.get_context().new_stage_async()
+        # Not recording
+        record_gesture("Test.drag", "began", x=0.0)
+
+        recording = start_gesture_recording()
+        record_gesture("Test.drag", "began", x=1.0)
+        await omni.kit.app.get_app().next_update_async()
+        await omni.kit.app.get_app().next_update_async()
+        record_gesture("Test.drag", "changed", x=2.0)
+        self.assertIs(stop_gesture_recording(), recording)
+        record_gesture("Test.drag", "ended")
+
+        self.assertEqual([event.state for event in recording.events], ["began", "changed"])
+        self.assertEqual(recording.frame_count, 3)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "recording.json")
+            recording.save(path)
+            loaded = GestureRecording.load(path)
+        self.assertEqual(loaded.stage_url, recording.stage_url)
+        self.assertEqual([event.to_dict() for event in loaded.events], [event.to_dict() for event in recording.events])
+
+    async def test_replay(self):
+        await omni.usd.get_context().new_stage_async()
+        target = _Target(omni.usd.get_context().get_stage())
+
+        recording = GestureRecording()
+        recording.events = [
+            GestureEvent(5, 0.0, "Test.drag", "began", {"x": 1.0}),
+            GestureEvent(5, 0.0, "Test.drag", "changed", {"x": 2.0}),
+            GestureEvent(7, 0.1, "Test.drag", "changed", {"x": 3.0}),
+            GestureEvent(7, 0.1, "Test.other", "changed", {}),
+            GestureEvent(7, 0.1, "Test.missed", "changed", {}),
+            GestureEvent(8, 0.2, "Test.drag", "ended", {}),
+        ]
+        # The target of Test.missed doesn't find what to replay on
+        targets = {"Test.drag": target.replay_gesture, "Test.missed": lambda event: False}
+        replayer = GestureReplayer(recording, targets, settle_frames=1)
+        report = await replayer.replay()
+
+        self.assertEqual(target.events, [("began", 1.0), ("changed", 2.0), ("changed", 3.0), ("ended", None)])
+        self.assertEqual(target.cube.GetSizeAttr().Get(), 3.0)
+        self.assertEqual(report.events, 4)
+        self.assertEqual(report.skipped, 2)
+        # The frames of the recording, they start from the first event
+        self.assertEqual(report.frames, 4)
+        self.assertEqual(report.usd_writes, 2)
+        self.assertEqual(report.calls, {"Test.replay": 4})
+        self.assertIs(replayer.report, report)
@@ -0,0 +1,55 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+__all__ = ["TestInstancing"]
+
+from omni.example.ui_scene.common import PrototypeBoundCache
+from pxr import Gf
+from pxr import Usd
+from pxr import UsdGeom
+import omni.kit.test
+
+
+class TestInstancing(omni.kit.test.AsyncTestCase):
+    async def test_prototype_bound_reuse(self):
+        """All the instances share one prototype bound"""
+        stage = Usd.Stage.CreateInMemory()
+        UsdGeom.Cube.Define(stage, "/Tree/Trunk").CreateExtentAttr([(-1, 0, -1), (1, 4, 1)])
+
+        trees = []
+        for i in range(10):
+            tree = UsdGeom.Xform.Define(stage, f"/Forest/Tree_{i}")
+            tree.AddTranslateOp().Set(Gf.Vec3d(i * 10, 0, 0))
+            tree.GetPrim().GetReferences().AddInternalReference("/Tree")
+            tree.GetPrim().SetInstanceable(True)
+            trees.append(tree.GetPrim())
+
+        cache = PrototypeBoundCache()
+        ranges = cache.compute_world_ranges(trees)
+
+        self.assertEqual(cache.prototype_count, 1)
+        self.assertEqual(ranges.shape, (10, 2, 3))
+        for i in range(10):
+            self.assertEqual(list(ranges[i][0]), [i * 10 - 1, 0, -1])
+            self.assertEqual(list(ranges[i][1]), [i * 10 + 1, 4, 1])
+
+        # The same result as the full computation
+        bbox_cache = UsdGeom.BBoxCache(Usd.TimeCode.Default(), includedPurposes=[UsdGeom.Tokens.default_])
+        expected = bbox_cache.ComputeWorldBound(trees[3]).ComputeAlignedRange()
+        self.assertEqual(cache.compute_world_range(trees[3]), expected)
+
+    async def test_not_instances(self):
+        """The prims that are not instances are computed one by one"""
+        stage = Usd.Stage.CreateInMemory()
+        cube = UsdGeom.Cube.Define(stage, "/Cube")
+        cube.CreateExtentAttr([(-1, -1, -1), (1, 1, 1)])
+
+        cache = PrototypeBoundCache()
+        ranges = cache.compute_world_ranges([cube.GetPrim()])
+        self.assertEqual(cache.prototype_count, 0)
+        self.assertEqual(list(ranges[0][1]), [1, 1, 1])
@@ -0,0 +1,103 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+__all__ = ["TestInstrumentation"]
+
+from omni.example.ui_scene.common import Instrumentation
+from omni.example.ui_scene.common import get_instrumentation
+from omni.example.ui_scene.common import instrumented
+from omni.example.ui_scene.common import span
+from omni.example.ui_scene.common import trace_args
+import json
+import os
+import tempfile
+import omni.kit.test
+
+
+@instrumented("Test.add")
+def _add(a, b):
+    return a + b
+
+
+@instrumented("Test.traced")
+def _traced(path):
+    trace_args(path=path)
+    with span("Test.inner", size=2):
+        pass
+
+
+class TestInstrumentation(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self._instrumentation = get_instrumentation()
+        self._was_enabled = self._instrumentation.enabled
+        self._was_tracing = self._instrumentation.tracing
+        self._instrumentation.clear()
+
+    async def tearDown(self):
+        self._instrumentation.enabled = self._was_enabled
+        self._instrumentation.tracing = self._was_tracing
+        self._instrumentation.clear()
+
+    async def test_disabled(self):
+        self._instrumentation.enabled = False
+        self.assertEqual(_add(1, 2), 3)
+        self.assertNotIn("Test.add", self._instrumentation.get_stats())
+
+    async def test_enabled(self):
+        self._instrumentation.enabled = True
+        for i in range(3):
+            self.assertEqual(_add(i, 1), i + 1)
+
+        stats = self._instrumentation.get_stats()["Test.add"]
+        self.assertEqual(stats.count, 3)
+        self.assertEqual(sum(stats.histogram), 3)
+        self.assertEqual(len(self._instrumentation.get_records("Test.add")), 3)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "stats.json")
+            self._instrumentation.dump(path)
+            with open(path) as f:
+                data = json.load(f)
+        self.assertEqual(data["stats"]["Test.add"]["count"], 3)
+        self.assertEqual(len(data["records"]), 3)
+
+    async def test_ring_buffer(self):
+        instrumentation = Instrumentation(capacity=2)
+        for duration in (0.001, 0.002, 0.2):
+            instrumentation.record("Test", 0.0, duration)
+
+        # The oldest record is dropped, the stats are kept
+        self.assertEqual([record[2] for record in instrumentation.get_records()], [0.002, 0.2])
+        stats = instrumentation.get_stats()["Test"]
+        self.assertEqual(stats.count, 3)
+        self.assertEqual(stats.histogram[-1], 1)
+        self.assertAlmostEqual(stats.max_time, 0.2)
+
+    async def test_trace(self):
+        self._instrumentation.enabled = False
+        self._instrumentation.tracing = True
+        _traced("/World/Cube")
+        self._instrumentation.tracing = False
+        # Not traced anymore
+        _traced("/World/Sphere")
+
+        spans = {name: args for name, start, end, args, thread in self._instrumentation.get_spans() if end}
+        self.assertEqual(spans, {"Test.traced": {"path": "/World/Cube"}, "Test.inner": {"size": 2}})
+        # Tracing doesn't count the calls
+        self.assertEqual(self._instrumentation.get_stats(), {})
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "trace.json")
+            self._instrumentation.dump_trace(path)
+            with open(path) as f:
+                events = json.load(f)["traceEvents"]
+        complete = [event for event in events if event["ph"] == "X"]
+        self.assertEqual([event["name"] for event in complete], ["Test.traced", "Test.inner"])
+        # The inner span is inside the outer one
+        self.assertLessEqual(complete[0]["ts"], complete[1]["ts"])
+        self.assertGreaterEqual(complete[0]["ts"] + complete[0]["dur"], complete[1]["ts"] + complete[1]["dur"])
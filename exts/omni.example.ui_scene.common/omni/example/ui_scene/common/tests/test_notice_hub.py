@@ -0,0 +1,86 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+__all__ = ["TestNoticeHub"]
+
+from omni.example.ui_scene.common import ChangeSet
+from omni.example.ui_scene.common import NoticeHub
+from omni.example.ui_scene.common import PathSet
+from pxr import Sdf
+from pxr import UsdGeom
+import omni.kit.app
+import omni.kit.test
+import omni.usd
+
+
+class TestNoticeHub(omni.kit.test.AsyncTestCase):
+    async def test_change_set(self):
+        changes = ChangeSet(
+            [Sdf.Path("/World/Added")],
+            {
+                Sdf.Path("/World"): {"xformOp:translate"},
+                Sdf.Path("/World/Cube"): {"extent", "primvars:displayColor"},
+                Sdf.Path("/Other"): {"visibility"},
+            },
+        )
+        self.assertEqual(changes.get_classes(Sdf.Path("/World")), {ChangeSet.XFORM})
+        self.assertEqual(changes.get_classes(Sdf.Path("/World/Cube")), {ChangeSet.EXTENT, ChangeSet.OTHER})
+        self.assertTrue(changes.has_class(ChangeSet.VISIBILITY))
+        self.assertFalse(changes.has_class(ChangeSet.MATERIAL))
+
+        # The parent moves the cube, so it's kept
+        filtered = changes.filter(frozenset([Sdf.Path("/World/Cube")]))
+        self.assertEqual(filtered.paths, {Sdf.Path("/World"), Sdf.Path("/World/Cube")})
+        self.assertFalse(changes.filter(frozenset([Sdf.Path("/Missing")])))
+
+    async def test_path_set(self):
+        """The ancestors and the descendants of many paths are found without walking them"""
+        paths = PathSet(f"/World/Group_{i // 100}/Cube_{i}" for i in range(10000))
+        self.assertEqual(len(paths), 10000)
+        self.assertTrue(paths.is_related(Sdf.Path("/World/Group_3")))
+        self.assertTrue(paths.is_related(Sdf.Path("/World/Group_3/Cube_300/Child")))
+        self.assertFalse(paths.is_related(Sdf.Path("/World/Group_3/Cube_999")))
+        self.assertFalse(paths.is_related(Sdf.Path("/Other")))
+
+        cube = Sdf.Path("/World/Group_3/Cube_300")
+        self.assertEqual(paths.ancestors(cube.AppendChild("Child")), [cube])
+        self.assertEqual(len(paths.descendants(Sdf.Path("/World/Group_3"))), 100)
+        # Group_30 is not under Group_3
+        self.assertNotIn(Sdf.Path("/World/Group_30/Cube_3000"), paths.descendants(Sdf.Path("/World/Group_3")))
+
+        paths.difference_update(f"/World/Group_3/Cube_{i}" for i in range(300, 400))
+        self.assertFalse(paths.is_related(Sdf.Path("/World/Group_3")))
+        self.assertEqual(paths.descendants(Sdf.Path("/World/Group_3")), [])
+        paths.add("/World/Group_3/Cube_350")
+        self.assertEqual(paths.descendants(Sdf.Path("/World/Group_3")), [Sdf.Path("/World/Group_3/Cube_350")])
+
+    async def test_delivery(self):
+        usd_context = omni.usd.get_context()
+        await usd_context.new_stage_async()
+        stage = usd_context.get_stage()
+        cube = UsdGeom.Cube.Define(stage, "/Cube")
+        UsdGeom.Cube.Define(stage, "/Sphere")
+
+        hub = NoticeHub()
+        received = []
+        subscription = hub.subscribe_objects_changed(received.append, ["/Cube"], name="Test")
+
+        cube.CreateSizeAttr(2.0)
+        stage.GetPrimAtPath("/Sphere").CreateAttribute("test", Sdf.ValueTypeNames.Float).Set(1.0)
+        self.assertEqual(len(received), 1)
+        self.assertEqual(received[0].paths, {Sdf.Path("/Cube")})
+
+        stats = hub.get_stats()["Test"]
+        self.assertEqual(stats.delivered, 1)
+        self.assertEqual(stats.filtered, 1)
+
+        # Released subscription is not called
+        del subscription
+        cube.GetSizeAttr().Set(3.0)
+        self.assertEqual(len(received), 1)
+        hub.destroy()
@@ -0,0 +1,79 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+__all__ = ["TestPointInstancer"]
+
+from omni.example.ui_scene.common import PointInstancerBounds
+from omni.example.ui_scene.common import format_instance_path
+from omni.example.ui_scene.common import parse_instance_path
+from pxr import Gf
+from pxr import Usd
+from pxr import UsdGeom
+import omni.kit.test
+
+
+class TestPointInstancer(omni.kit.test.AsyncTestCase):
+    def _create_instancer(self, stage, count):
+        instancer = UsdGeom.PointInstancer.Define(stage, "/Forest")
+        UsdGeom.Cube.Define(stage, "/Forest/Prototypes/Tree").CreateExtentAttr([(-1, 0, -1), (1, 4, 1)])
+        instancer.CreatePrototypesRel().SetTargets(["/Forest/Prototypes/Tree"])
+        instancer.CreateProtoIndicesAttr([0] * count)
+        instancer.CreatePositionsAttr([Gf.Vec3f(i * 10, 0, 0) for i in range(count)])
+        return instancer
+
+    async def test_instance_path(self):
+        self.assertEqual(format_instance_path("/World/Trees", 12), "/World/Trees[12]")
+        self.assertEqual(parse_instance_path("/World/Trees[12]"), ("/World/Trees", 12))
+        self.assertEqual(parse_instance_path("/World/Trees"), ("/World/Trees", None))
+
+    async def test_positions(self):
+        stage = Usd.Stage.CreateInMemory()
+        instancer = self._create_instancer(stage, 100)
+
+        bounds = PointInstancerBounds()
+        self.assertEqual(bounds.compute_instance_count(instancer), 100)
+
+        ranges = bounds.compute_world_ranges(instancer, [3, 42, 1000])
+        # The index out of range is dropped
+        self.assertEqual(ranges.shape, (2, 2, 3))
+        self.assertEqual(list(ranges[0][0]), [29, 0, -1])
+        self.assertEqual(list(ranges[1][1]), [421, 4, 1])
+
+    async def test_orientations_and_scales(self):
+        stage = Usd.Stage.CreateInMemory()
+        instancer = self._create_instancer(stage, 2)
+        # 90 degrees around Z and twice bigger
+        rotation = Gf.Rotation(Gf.Vec3d(0, 0, 1), 90).GetQuat()
+        instancer.CreateOrientationsAttr([Gf.Quath(1), Gf.Quath(rotation)])
+        instancer.CreateScalesAttr([Gf.Vec3f(1), Gf.Vec3f(2)])
+
+        ranges = PointInstancerBounds().compute_world_ranges(instancer)
+
+        # The same as what USD computes
+        xforms = instancer.ComputeInstanceTransformsAtTime(Usd.TimeCode.Default(), Usd.TimeCode.Default())
+        box = Gf.Range3d(Gf.Vec3d(-1, 0, -1), Gf.Vec3d(1, 4, 1))
+        for i in range(2):
+            expected = Gf.BBox3d(box, xforms[i]).ComputeAlignedRange()
+            for j in range(3):
+                self.assertAlmostEqual(ranges[i][0][j], expected.GetMin()[j], places=3)
+                self.assertAlmostEqual(ranges[i][1][j], expected.GetMax()[j], places=3)
+
+    async def test_malformed(self):
+        """The arrays shorter than protoIndices and the missing prototypes give no bounds"""
+        stage = Usd.Stage.CreateInMemory()
+        instancer = self._create_instancer(stage, 4)
+        instancer.GetPositionsAttr().Set([Gf.Vec3f(0, 0, 0)])
+
+        bounds = PointInstancerBounds()
+        self.assertEqual(bounds.compute_world_ranges(instancer).shape, (0, 2, 3))
+        self.assertEqual(bounds.compute_world_ranges(instancer, [1]).shape, (0, 2, 3))
+
+        instancer.GetPositionsAttr().Set([Gf.Vec3f(i, 0, 0) for i in range(4)])
+        instancer.GetPrototypesRel().ClearTargets(True)
+        bounds.clear()
+        self.assertEqual(bounds.compute_world_ranges(instancer).shape, (0, 2, 3))
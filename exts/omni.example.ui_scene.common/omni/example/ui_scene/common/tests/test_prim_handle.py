@@ -0,0 +1,76 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+__all__ = ["TestPrimHandle"]
+
+from omni.example.ui_scene.common import PrimHandle
+from omni.example.ui_scene.common import SelectionSnapshot
+from omni.example.ui_scene.common import resolve_resynced_path
+from pxr import Sdf
+from pxr import Usd
+from pxr import UsdGeom
+import omni.kit.test
+
+
+class TestPrimHandle(omni.kit.test.AsyncTestCase):
+    async def test_general(self):
+        stage = Usd.Stage.CreateInMemory()
+        UsdGeom.Cube.Define(stage, "/World/Cube")
+
+        handle = PrimHandle(stage, "/World/Cube")
+        for _ in range(5):
+            self.assertTrue(handle.get())
+        self.assertEqual(handle.lookups, 1)
+        self.assertEqual(handle.lookups_avoided, 4)
+
+        # The resync of the sibling doesn't matter
+        self.assertFalse(handle.invalidate_resynced([Sdf.Path("/World/Sphere")]))
+        self.assertTrue(handle.invalidate_resynced([Sdf.Path("/World")]))
+        handle.get()
+        self.assertEqual(handle.lookups, 2)
+
+        # The removed prim is not valid anymore
+        stage.RemovePrim("/World/Cube")
+        self.assertFalse(handle.get())
+        self.assertEqual(handle.lookups, 3)
+
+    async def test_snapshot(self):
+        stage = Usd.Stage.CreateInMemory()
+        UsdGeom.Cube.Define(stage, "/Cube")
+
+        snapshot = SelectionSnapshot(stage, ["/Cube"])
+        snapshot.prim("/Cube")
+        snapshot.local_srt("/Cube")
+        self.assertEqual(snapshot.prim_lookups, 1)
+        self.assertEqual(snapshot.prim_lookups_avoided, 1)
+
+        snapshot.invalidate_prims([Sdf.Path("/Cube")])
+        snapshot.local_srt("/Cube")
+        self.assertEqual(snapshot.prim_lookups, 2)
+        self.assertEqual(snapshot.compute_counts[SelectionSnapshot.LOCAL_SRT], 2)
+
+    async def test_resolve_resynced_path(self):
+        stage = Usd.Stage.CreateInMemory()
+        UsdGeom.Xform.Define(stage, "/Old")
+        UsdGeom.Cube.Define(stage, "/Old/Cube")
+        UsdGeom.Xform.Define(stage, "/Other")
+
+        # Not moved
+        self.assertEqual(resolve_resynced_path(stage, "/Old/Cube", [Sdf.Path("/Old")]), "/Old/Cube")
+
+        # The parent is renamed
+        edit = Sdf.BatchNamespaceEdit()
+        edit.Add("/Old", "/New")
+        self.assertTrue(stage.GetRootLayer().Apply(edit))
+        resynced = [Sdf.Path("/Old"), Sdf.Path("/New")]
+        self.assertEqual(resolve_resynced_path(stage, "/Old/Cube", resynced), "/New/Cube")
+        self.assertIsNone(resolve_resynced_path(stage, "/Old/Cube", resynced, "Sphere"))
+
+        # Removed
+        stage.RemovePrim("/New")
+        self.assertIsNone(resolve_resynced_path(stage, "/New/Cube", [Sdf.Path("/New")]))
@@ -0,0 +1,78 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+__all__ = ["TestProfiler"]
+
+from omni.example.ui_scene.common import ProfilerCapture
+from omni.example.ui_scene.common import begin_gesture_event
+from omni.example.ui_scene.common import instrumented
+from omni.example.ui_scene.common import start_profiler_capture
+from omni.example.ui_scene.common import stop_profiler_capture
+import os
+import pstats
+import tempfile
+import omni.kit.app
+import omni.kit.test
+
+
+def _work():
+    return sum(i * i for i in range(20000))
+
+
+@instrumented("Test.profiled")
+def _profiled():
+    return _work()
+
+
+def _not_profiled():
+    return _work()
+
+
+class TestProfiler(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+
+    async def tearDown(self):
+        stop_profiler_capture()
+        self._directory.cleanup()
+
+    async def test_capture(self):
+        capture = ProfilerCapture(self._directory.name, seconds=60.0, interval=0.0005, name="test")
+        capture.start()
+        for _ in range(5):
+            _profiled()
+        _not_profiled()
+        paths = capture.stop()
+
+        self.assertEqual([os.path.basename(path) for path in paths], ["test.pstats", "test.collapsed"])
+        functions = [function for filename, line, function in pstats.Stats(paths[0]).stats]
+        self.assertIn("_profiled", functions)
+        self.assertNotIn("_not_profiled", functions)
+        # Only the stacks under the entry point are sampled
+        with open(paths[1]) as f:
+            for line in f:
+                self.assertTrue(line.startswith("_profiled "), line)
+
+        # Not profiled anymore
+        self.assertFalse(capture.running)
+        _profiled()
+
+    async def test_gestures(self):
+        capture = start_profiler_capture(seconds=60.0, gestures=2, directory=self._directory.name)
+        self.assertTrue(capture.running)
+        begin_gesture_event("Test.drag")
+        _profiled()
+        begin_gesture_event("Test.drag")
+        # It's stopped on the next frame
+        self.assertTrue(capture.running)
+        await omni.kit.app.get_app().next_update_async()
+
+        self.assertFalse(capture.running)
+        self.assertEqual(capture.gesture_count, 2)
+        for path in capture.paths:
+            self.assertTrue(os.path.exists(path))
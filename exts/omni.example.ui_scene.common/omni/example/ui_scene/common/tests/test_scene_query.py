@@ -0,0 +1,91 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+__all__ = ["TestSceneQuery"]
+
+from omni.example.ui_scene.common import SceneQuery
+from pxr import Gf
+from pxr import UsdGeom
+from pxr import UsdShade
+import omni.kit.test
+import omni.usd
+
+
+class TestSceneQuery(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        await omni.usd.get_context().new_stage_async()
+        self._stage = omni.usd.get_context().get_stage()
+
+    async def test_invalidation(self):
+        """The results are computed once and recomputed when they are stale"""
+        parent = UsdGeom.Xform.Define(self._stage, "/Parent")
+        cube = UsdGeom.Cube.Define(self._stage, "/Parent/Cube")
+        cube.CreateExtentAttr([(-1, -1, -1), (1, 1, 1)])
+        material = UsdShade.Material.Define(self._stage, "/Material")
+        UsdShade.MaterialBindingAPI.Apply(cube.GetPrim()).Bind(material)
+
+        query = SceneQuery()
+        for _ in range(3):
+            self.assertEqual(query.world_bound("/Parent/Cube").GetMax()[1], 1)
+            self.assertEqual(query.bound_material("/Parent/Cube"), "/Material")
+        self.assertEqual(query.misses, 2)
+        self.assertEqual(query.hits, 4)
+
+        # Moving the parent moves the cube, the material stays
+        parent.AddTranslateOp().Set(Gf.Vec3d(0, 10, 0))
+        self.assertEqual(query.world_bound("/Parent/Cube").GetMax()[1], 11)
+        self.assertEqual(query.world_xform("/Parent/Cube").ExtractTranslation()[1], 10)
+        query.bound_material("/Parent/Cube")
+        self.assertEqual(query.misses, 4)
+
+        # Removing the prim forgets everything about it
+        self._stage.RemovePrim("/Parent/Cube")
+        self.assertIsNone(query.world_bound("/Parent/Cube"))
+        self.assertFalse(query.prim("/Parent/Cube"))
+        query.destroy()
+
+    async def test_lru(self):
+        for i in range(4):
+            UsdGeom.Cube.Define(self._stage, f"/Cube{i}")
+
+        query = SceneQuery(max_entries=4)
+        for i in range(4):
+            query.world_xform(f"/Cube{i}")
+        # Each path keeps its prim and its transform
+        self.assertEqual(len(query), 4)
+        self.assertEqual(query.evictions, 4)
+
+        # The most recent one is still there
+        hits = query.hits
+        query.world_xform("/Cube3")
+        self.assertEqual(query.hits, hits + 1)
+        # The evicted paths are not indexed anymore
+        self.assertEqual(set(query._paths), set(query._keys_by_path))
+        query.destroy()
+
+    async def test_unrelated_changes(self):
+        """A change only drops the results under the changed prim and the bounds of its ancestors"""
+        for i in range(100):
+            UsdGeom.Cube.Define(self._stage, f"/Group/Cube{i}")
+        query = SceneQuery()
+        for i in range(100):
+            query.world_xform(f"/Group/Cube{i}")
+        query.world_bound("/Group")
+
+        UsdGeom.Xformable(self._stage.GetPrimAtPath("/Group/Cube7")).AddTranslateOp().Set(Gf.Vec3d(1, 0, 0))
+        hits = query.hits
+        # The other cubes are still cached
+        for i in range(100):
+            if i != 7:
+                query.world_xform(f"/Group/Cube{i}")
+        self.assertEqual(query.hits, hits + 99)
+        # The cube and the bound of the group are computed again
+        self.assertEqual(query.world_xform("/Group/Cube7").ExtractTranslation()[0], 1)
+        query.world_bound("/Group")
+        self.assertEqual(query.hits, hits + 99)
+        query.destroy()
@@ -0,0 +1,77 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+__all__ = ["TestSceneSnapshot"]
+
+from omni.example.ui_scene.common import SceneRecorder
+from omni.example.ui_scene.common import SceneSnapshot
+from omni.example.ui_scene.common import snapshot_build
+from omni.ui import color as cl
+from omni.ui import scene as sc
+import os
+import sys
+import tempfile
+import omni.kit.test
+
+
+class _Manipulator(sc.Manipulator):
+    def __init__(self, color=cl.yellow, **kwargs):
+        super().__init__(**kwargs)
+        self._color = color
+        self._line = None
+
+    def on_build(self):
+        with sc.Transform(transform=sc.Matrix44.get_translation_matrix(1, 2, 3)):
+            self._line = sc.Line([0, 0, 0], [1, 0, 0], color=self._color, thickness=2)
+            self._line.gestures = [sc.DragGesture()]
+            with sc.Transform(look_at=sc.Transform.LookAt.CAMERA):
+                sc.Label("Hello")
+
+    def set_thickness(self, thickness):
+        self._line.thickness = thickness
+
+
+class TestSceneSnapshot(omni.kit.test.AsyncTestCase):
+    async def test_build(self):
+        snapshot = snapshot_build(_Manipulator())
+
+        self.assertEqual(snapshot.count(), 4)
+        self.assertEqual([node["type"] for node in snapshot.nodes()], ["Transform", "Line", "Transform", "Label"])
+        transform = snapshot.roots[0]["properties"]["transform"]
+        self.assertEqual(transform[12:15], [1.0, 2.0, 3.0])
+        line = snapshot.find("Line")[0]["properties"]
+        self.assertEqual(line["args"], [[0, 0, 0], [1, 0, 0]])
+        self.assertEqual(line["gestures"], ["<DragGesture>"])
+        self.assertEqual(snapshot.find("Label")[0]["properties"]["args"], ["Hello"])
+        # The module has the real omni.ui.scene again
+        self.assertIs(sys.modules[__name__].sc, sc)
+
+    async def test_diff(self):
+        snapshot = snapshot_build(_Manipulator())
+        self.assertEqual(snapshot.diff(snapshot_build(_Manipulator())), [])
+        self.assertEqual(
+            snapshot.diff(snapshot_build(_Manipulator(color=cl.red))),
+            [f"/Transform[0]/Line[0].color: {cl.yellow} != {cl.red}"],
+        )
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "snapshot.json")
+            snapshot.save(path)
+            self.assertEqual(SceneSnapshot.load(path), snapshot)
+
+    async def test_update(self):
+        """The properties that are set after the build are recorded"""
+        manipulator = _Manipulator()
+        recorder = SceneRecorder()
+        with recorder.install(__name__):
+            manipulator.on_build()
+            before = recorder.snapshot()
+            manipulator.set_thickness(4)
+            after = recorder.snapshot()
+
+        self.assertEqual(before.diff(after), ["/Transform[0]/Line[0].thickness: 2 != 4"])
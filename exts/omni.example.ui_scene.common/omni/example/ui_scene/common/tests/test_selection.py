@@ -0,0 +1,76 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+__all__ = ["TestSelection"]
+
+from omni.example.ui_scene.common import SelectionSnapshot
+from pxr import Usd
+from pxr import UsdGeom
+from pxr import UsdLux
+from pxr import UsdShade
+import omni.kit.test
+
+
+class TestSelection(omni.kit.test.AsyncTestCase):
+    async def test_lazy(self):
+        """Nothing is computed until it's requested, and then it's computed once"""
+        stage = Usd.Stage.CreateInMemory()
+        cube = UsdGeom.Cube.Define(stage, "/Cube")
+        cube.CreateExtentAttr([(-1, -1, -1), (1, 1, 1)])
+        material = UsdShade.Material.Define(stage, "/Material")
+        UsdShade.MaterialBindingAPI.Apply(cube.GetPrim()).Bind(material)
+
+        snapshot = SelectionSnapshot(stage, ["/Cube", "/Missing"])
+        self.assertEqual(snapshot.primary, "/Cube")
+        self.assertEqual(snapshot.compute_counts, {})
+
+        for _ in range(3):
+            self.assertEqual(snapshot.material("/Cube"), "/Material")
+        self.assertEqual(snapshot.compute_counts, {SelectionSnapshot.MATERIAL: 1})
+        self.assertIsNone(snapshot.material("/Missing"))
+
+        self.assertEqual(snapshot.world_range("/Cube").GetMax()[1], 1)
+        cube.CreateExtentAttr([(-1, -1, -1), (1, 2, 1)])
+        # Kept until it's invalidated
+        self.assertEqual(snapshot.world_range("/Cube").GetMax()[1], 1)
+        snapshot.invalidate("/Cube", [SelectionSnapshot.WORLD_RANGE])
+        self.assertEqual(snapshot.world_range("/Cube").GetMax()[1], 2)
+        self.assertEqual(snapshot.compute_counts[SelectionSnapshot.WORLD_RANGE], 2)
+
+        # The material is still there
+        snapshot.material("/Cube")
+        self.assertEqual(snapshot.compute_counts[SelectionSnapshot.MATERIAL], 2)
+
+    async def test_invalidate_paths(self):
+        """Only the data of the given paths is forgotten"""
+        stage = Usd.Stage.CreateInMemory()
+        paths = [f"/Cube_{i}" for i in range(10)]
+        for path in paths:
+            UsdGeom.Cube.Define(stage, path).CreateExtentAttr([(-1, -1, -1), (1, 1, 1)])
+
+        snapshot = SelectionSnapshot(stage, paths)
+        for path in paths:
+            snapshot.world_range(path)
+        snapshot.invalidate_paths(paths[:3])
+        # The removed paths are forgotten with the deselection
+        snapshot.update(removed=paths[8:])
+        self.assertEqual(snapshot.paths, tuple(paths[:8]))
+        for path in paths[:8]:
+            snapshot.world_range(path)
+        self.assertEqual(snapshot.compute_counts[SelectionSnapshot.WORLD_RANGE], 13)
+
+    async def test_light(self):
+        stage = Usd.Stage.CreateInMemory()
+        light = UsdLux.RectLight.Define(stage, "/Light")
+        light.CreateWidthAttr(3.0)
+        light.CreateIntensityAttr(100.0)
+
+        snapshot = SelectionSnapshot(stage, ["/Light"])
+        parameters = snapshot.light_parameters("/Light")
+        self.assertEqual(parameters["width"], 3.0)
+        self.assertEqual(parameters["intensity"], 100.0)
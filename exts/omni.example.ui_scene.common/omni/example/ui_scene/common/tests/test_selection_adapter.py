@@ -0,0 +1,133 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+__all__ = ["TestSelectionAdapter"]
+
+from omni.example.ui_scene.common import SelectionAdapter
+from omni.example.ui_scene.common import SelectionSnapshot
+from pxr import Usd
+from pxr import UsdGeom
+import omni.kit.app
+import omni.kit.test
+import omni.usd
+
+
+class TestSelectionAdapter(omni.kit.test.AsyncTestCase):
+    async def _select(self, paths):
+        omni.usd.get_context().get_selection().set_selected_prim_paths(paths, True)
+        await omni.kit.app.get_app().next_update_async()
+
+    async def test_delta(self):
+        await omni.usd.get_context().new_stage_async()
+        stage = omni.usd.get_context().get_stage()
+        for name in "ABC":
+            UsdGeom.Cube.Define(stage, f"/{name}")
+
+        adapter = SelectionAdapter(debounce_frames=0)
+        deltas = []
+        subscription = adapter.subscribe(deltas.append, name="Test")
+
+        await self._select(["/A", "/B"])
+        self.assertEqual(deltas[-1].added, ("/A", "/B"))
+        self.assertEqual(adapter.primary, "/A")
+
+        await self._select(["/A", "/C"])
+        self.assertEqual(deltas[-1].added, ("/C",))
+        self.assertEqual(deltas[-1].removed, {"/B"})
+        self.assertIn("/C", adapter)
+
+        # The same selection is not delivered
+        count = len(deltas)
+        await self._select(["/A", "/C"])
+        self.assertEqual(len(deltas), count)
+
+        # Only the primary is changed
+        await self._select(["/C", "/A"])
+        self.assertFalse(deltas[-1])
+        self.assertEqual(deltas[-1].primary, "/C")
+
+        del subscription
+        adapter.destroy()
+
+    async def test_debounce(self):
+        """Only the final selection is delivered, and the work for the old one is cancelled"""
+        await omni.usd.get_context().new_stage_async()
+        stage = omni.usd.get_context().get_stage()
+        for name in "ABC":
+            UsdGeom.Cube.Define(stage, f"/{name}")
+
+        adapter = SelectionAdapter(debounce_frames=2)
+        deltas = []
+        finished = []
+
+        async def process(delta):
+            for _ in range(10):
+                await omni.kit.app.get_app().next_update_async()
+            finished.append(delta)
+
+        subscription = adapter.subscribe(deltas.append)
+        async_subscription = adapter.subscribe_async(process, name="Process")
+
+        for name in "ABC":
+            await self._select([f"/{name}"])
+        self.assertEqual(deltas, [])
+
+        for _ in range(3):
+            await omni.kit.app.get_app().next_update_async()
+        self.assertEqual(len(deltas), 1)
+        self.assertEqual(deltas[0].added, ("/C",))
+
+        # The next selection cancels the processing of the previous one
+        await self._select(["/A"])
+        adapter.flush()
+        for _ in range(12):
+            await omni.kit.app.get_app().next_update_async()
+        self.assertEqual([delta.primary for delta in finished], ["/A"])
+        self.assertEqual(adapter.get_stats()["Process"].cancelled, 1)
+
+        del subscription
+        del async_subscription
+        adapter.destroy()
+
+    async def test_current(self):
+        """The subscriber created after the selection gets it right away"""
+        await omni.usd.get_context().new_stage_async()
+        stage = omni.usd.get_context().get_stage()
+        for name in "AB":
+            UsdGeom.Cube.Define(stage, f"/{name}")
+        await self._select(["/B", "/A"])
+
+        adapter = SelectionAdapter(debounce_frames=0)
+        deltas = []
+        subscription = adapter.subscribe(deltas.append, current=True)
+        self.assertEqual(len(deltas), 1)
+        self.assertEqual(deltas[0].added, ("/B", "/A"))
+        self.assertEqual(deltas[0].primary, "/B")
+
+        # The existing subscribers don't get it again
+        other = []
+        other_subscription = adapter.subscribe(other.append)
+        self.assertEqual(other, [])
+
+        del subscription
+        del other_subscription
+        adapter.destroy()
+
+    async def test_snapshot_update(self):
+        stage = Usd.Stage.CreateInMemory()
+        for name in "ABC":
+            UsdGeom.Cube.Define(stage, f"/{name}")
+
+        snapshot = SelectionSnapshot(stage, ["/A", "/B"])
+        snapshot.local_srt("/A")
+        snapshot.update(["/C"], ["/B"], "/C")
+        self.assertEqual(snapshot.paths, ("/C", "/A"))
+
+        # The prim that stays selected keeps its data
+        snapshot.local_srt("/A")
+        self.assertEqual(snapshot.compute_counts[SelectionSnapshot.LOCAL_SRT], 1)
@@ -0,0 +1,83 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+__all__ = ["TestSelectionTrigger"]
+
+from omni.example.ui_scene.common import SelectionTrigger
+from omni.example.ui_scene.common import get_selection_adapter
+from pxr import UsdGeom
+from pxr import UsdLux
+import omni.kit.app
+import omni.kit.test
+import omni.usd
+
+
+class TestSelectionTrigger(omni.kit.test.AsyncTestCase):
+    async def _select(self, paths):
+        omni.usd.get_context().get_selection().set_selected_prim_paths(paths, True)
+        # The selection is read when it's settled
+        for _ in range(3):
+            await omni.kit.app.get_app().next_update_async()
+
+    async def test_type(self):
+        """Only the selection of the given type triggers, and only once"""
+        await omni.usd.get_context().new_stage_async()
+        stage = omni.usd.get_context().get_stage()
+        UsdGeom.Cube.Define(stage, "/Cube")
+        UsdLux.RectLight.Define(stage, "/Light")
+
+        calls = []
+        trigger = SelectionTrigger(lambda: calls.append(1), ["RectLight"])
+
+        await self._select(["/Cube"])
+        self.assertEqual(calls, [])
+        self.assertFalse(trigger.triggered)
+
+        await self._select(["/Light"])
+        self.assertEqual(calls, [1])
+        self.assertTrue(trigger.triggered)
+
+        await self._select([])
+        await self._select(["/Light"])
+        self.assertEqual(calls, [1])
+
+        trigger.destroy()
+
+    async def test_already_selected(self):
+        await omni.usd.get_context().new_stage_async()
+        stage = omni.usd.get_context().get_stage()
+        UsdGeom.Cube.Define(stage, "/Cube")
+        await self._select(["/Cube"])
+
+        calls = []
+        trigger = SelectionTrigger(lambda: calls.append(1))
+        self.assertEqual(calls, [1])
+
+        trigger.destroy()
+
+    async def test_adapter(self):
+        """The primary path of the shared adapter is checked, the selection is not read again"""
+        await omni.usd.get_context().new_stage_async()
+        stage = omni.usd.get_context().get_stage()
+        UsdGeom.Cube.Define(stage, "/Cube")
+        UsdLux.RectLight.Define(stage, "/Light")
+        adapter = get_selection_adapter()
+
+        calls = []
+        trigger = SelectionTrigger(lambda: calls.append(1), ["RectLight"])
+        self.assertIsNotNone(trigger._selection_sub)
+        self.assertIsNone(trigger._stage_event_sub)
+
+        await self._select(["/Cube"])
+        self.assertEqual(calls, [])
+        await self._select(["/Light", "/Cube"])
+        self.assertEqual(adapter.primary, "/Light")
+        self.assertEqual(calls, [1])
+        self.assertIsNone(trigger._selection_sub)
+
+        trigger.destroy()
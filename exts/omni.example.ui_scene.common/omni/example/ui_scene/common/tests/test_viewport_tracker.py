@@ -0,0 +1,51 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+__all__ = ["TestViewportTracker"]
+
+from omni.example.ui_scene.common import ViewportTracker
+from omni.kit.viewport.utility import get_active_viewport_window
+import omni.kit.app
+import omni.kit.test
+
+
+class _Scene:
+    def __init__(self, window, destroyed):
+        self.window = window
+        self._destroyed = destroyed
+
+    def destroy(self):
+        self._destroyed.append(self.window.name)
+
+
+class TestViewportTracker(omni.kit.test.AsyncTestCase):
+    async def test_scenes(self):
+        window = get_active_viewport_window()
+        if not window:
+            self.skipTest("No viewport window")
+
+        created = []
+        destroyed = []
+
+        def create_scene(window):
+            created.append(window.name)
+            return _Scene(window, destroyed)
+
+        tracker = ViewportTracker(create_scene, poll_frames=1)
+        self.assertIn(window.name, created)
+        self.assertEqual(len(tracker.scenes), len(created))
+
+        # The windows that already have a scene don't get a new one
+        count = len(created)
+        for _ in range(3):
+            await omni.kit.app.get_app().next_update_async()
+        self.assertEqual(len(created), count)
+
+        tracker.destroy()
+        self.assertEqual(sorted(destroyed), sorted(created))
+        self.assertEqual(tracker.scenes, [])
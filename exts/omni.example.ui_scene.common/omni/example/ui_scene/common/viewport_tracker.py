@@ -0,0 +1,90 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+__all__ = ["ViewportTracker"]
+
+from typing import Callable, Dict, List
+
+from omni.kit.viewport import utility as viewport_utility
+import carb
+import omni.kit.app
+
+
+def _get_viewport_windows(usd_context_name: str) -> List:
+    """All the viewport windows of the UsdContext"""
+    if hasattr(viewport_utility, "get_viewport_window_instances"):
+        return [window for window in viewport_utility.get_viewport_window_instances(usd_context_name) if window]
+    # The older versions only know the active viewport
+    window = viewport_utility.get_active_viewport_window()
+    return [window] if window else []
+
+
+class ViewportTracker:
+    """
+    Follows the viewport windows as they are created and destroyed.
+    `create_scene_fn` is called with every viewport window, the ones that are
+    open now and the ones that are opened later. It returns the object that
+    draws into the window, it's destroyed when the window is gone.
+
+    The scenes are expected to share one model, so a new viewport only adds
+    the cost of drawing.
+    """
+
+    def __init__(self, create_scene_fn: Callable, usd_context_name: str = "", poll_frames: int = 30):
+        self._create_scene_fn = create_scene_fn
+        self._usd_context_name = usd_context_name
+        self._poll_frames = poll_frames
+        self._frame = 0
+        # Window name -> (window, scene)
+        self._scenes: Dict[str, tuple] = {}
+
+        self.update()
+        # There is no event for a new viewport window, the list is checked
+        # every `poll_frames` frames
+        self._update_sub = (
+            omni.kit.app.get_app()
+            .get_update_event_stream()
+            .create_subscription_to_pop(self._on_update, name="omni.example.ui_scene.common ViewportTracker")
+        )
+
+    def destroy(self):
+        self._update_sub = None
+        for name in list(self._scenes):
+            self._remove(name)
+
+    @property
+    def scenes(self) -> list:
+        return [scene for window, scene in self._scenes.values()]
+
+    def update(self):
+        """Create the scenes of the new windows and destroy the scenes of the closed ones"""
+        windows = {window.name: window for window in _get_viewport_windows(self._usd_context_name)}
+
+        for name in list(self._scenes):
+            if name not in windows:
+                self._remove(name)
+
+        for name, window in windows.items():
+            if name in self._scenes:
+                continue
+            try:
+                scene = self._create_scene_fn(window)
+            except Exception as e:
+                carb.log_error(f"Failed to add the scene to {name}: {e}")
+                continue
+            self._scenes[name] = (window, scene)
+
+    def _remove(self, name: str):
+        window, scene = self._scenes.pop(name)
+        if scene:
+            scene.destroy()
+
+    def _on_update(self, event):
+        self._frame += 1
+        if self._frame % self._poll_frames == 0:
+            self.update()
@@ -7,5 +7,16 @@
 # license agreement from NVIDIA CORPORATION is strictly prohibited.
 #
 from .extension import *
-from .light_manipulator import LightManipulator
-from .light_model import LightModel
+
+
+def __getattr__(name: str):
+    # The model and the manipulator import USD, it's done on the first use
+    if name == "LightManipulator":
+        from .light_manipulator import LightManipulator
+
+        return LightManipulator
+    if name == "LightModel":
+        from .light_model import LightModel
+
+        return LightModel
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -8,6 +8,13 @@
 
 __all__ = ["LightManipulator"]
 
+from omni.example.ui_scene.common import GestureLatency
+from omni.example.ui_scene.common import begin_gesture_event
+from omni.example.ui_scene.common import gesture_stage
+from omni.example.ui_scene.common import instrumented
+from omni.example.ui_scene.common import mark_gesture_stage
+from omni.example.ui_scene.common import record_gesture
+from omni.example.ui_scene.common import trace_item
 from omni.ui import scene as sc
 from omni.ui import color as cl
 import omni.kit
@@ -15,6 +22,9 @@ import omni.kit.commands
 
 INTENSITY_SCALE = 500.0
 
+# The name of the drag in the gesture latency and the recordings
+GESTURE_NAME = "light_manipulator.drag"
+
 ARROW_WIDTH = 0.015
 ARROW_HEIGHT = 0.1
 ARROW_P = [
@@ -87,8 +97,30 @@ class _DragGesture(sc.DragGesture):
         # enlarges the width, and when we move the negative line to the left, it also enlarges the width
         # 1 means positive and -1 means negative. It's a list so that we can reflect list orientation
         self.flag = flag
+        # The replay finds the gesture by its handle
+        manipulator._drag_gestures[self.handle] = self
+
+    @property
+    def handle(self) -> str:
+        """The name of the handle of the gesture in the recordings, like "0,1/1,-1" for a corner"""
+        return f"{','.join(map(str, self.orientations))}/{','.join(map(str, self.flag))}"
 
     def on_began(self):
+        ray_point = list(self.gesture_payload.ray_closest_point)
+        record_gesture(GESTURE_NAME, "began", handle=self.handle, ray_closest_point=ray_point)
+        self.began(ray_point)
+
+    def on_changed(self):
+        ray_point = list(self.gesture_payload.ray_closest_point)
+        record_gesture(GESTURE_NAME, "changed", handle=self.handle, ray_closest_point=ray_point)
+        self.changed(ray_point)
+
+    def on_ended(self):
+        record_gesture(GESTURE_NAME, "ended", handle=self.handle)
+        self.ended()
+
+    def began(self, ray_point):
+        """The drag is started at the point in the world space. Called by the gesture or by the replay."""
         # When the user drags the slider, we don't want to see the selection
         # rect. In Viewport Next, it works well automatically because the
         # selection rect is a manipulator with its gesture, and we add the
@@ -98,7 +130,7 @@ class _DragGesture(sc.DragGesture):
         self.__disable_selection = _ViewportLegacyDisableSelection()
 
         # initialize the self._previous_ray_point
-        self._previous_ray_point = self.gesture_payload.ray_closest_point
+        self._previous_ray_point = ray_point
 
         # record the previous value for the model
         self.model = self._manipulator.model
@@ -112,8 +144,12 @@ class _DragGesture(sc.DragGesture):
             self.intensity_item = self.model.intensity
             self._manipulator.model.set_item_value(self.intensity_item, self.model.get_as_floats(self.intensity_item))
 
-    def on_changed(self):
-        object_ray_point = self.gesture_payload.ray_closest_point
+    @instrumented()
+    def changed(self, ray_point):
+        """The mouse is moved to the point in the world space"""
+        # The input event, the following stages up to the frame get its ID
+        begin_gesture_event(GESTURE_NAME)
+        object_ray_point = ray_point
         # calculate the ray moved vector
         moved = [a - b for a, b in zip(object_ray_point, self._previous_ray_point)]
         # transfer moved from world to object space, [0] to make it a normal, not point
@@ -158,7 +194,7 @@ class _DragGesture(sc.DragGesture):
             self.intensity_new = intensity_new * INTENSITY_SCALE
             self.model.set_floats(self.intensity_item, self.intensity_new)
 
-    def on_ended(self):
+    def ended(self):
         # This re-enables the selection in the Viewport Legacy
         self.__disable_selection = None
 
@@ -180,6 +216,8 @@ class LightManipulator(sc.Manipulator):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._shape_xform = None
+        # The handle -> the drag gesture of the current build
+        self._drag_gestures = {}
 
     def __del__(self):
         self.model = None
@@ -194,8 +232,11 @@ class LightManipulator(sc.Manipulator):
             z = self.model.get_as_floats(self.model.intensity) / INTENSITY_SCALE
             self._shape_xform.transform = [x, 0, 0, 0, 0, y, 0, 0, 0, 0, z, 0, 0, 0, 0, 1]
 
+    @instrumented()
+    @gesture_stage(GestureLatency.REDRAW)
     def on_build(self):
         """Called when the model is changed and rebuilds the whole slider"""
+        self._drag_gestures = {}
         model = self.model
         if not model:
             return
@@ -318,17 +359,40 @@ class LightManipulator(sc.Manipulator):
                     r3.gestures = [_DragGesture(self, [0, 1], [-1, 1]), hight_all_gesture]
                     r4.gestures = [_DragGesture(self, [0, 1], [-1, -1]), hight_all_gesture]
 
+    @instrumented()
     def on_model_updated(self, item):
         # Regenerate the mesh
         if not self.model:
             return
+        trace_item(self.model, item, path=self.model.prim_path.value)
+        mark_gesture_stage(GestureLatency.MODEL_UPDATED)
 
         if item == self.model.transform:
             # If transform changed, update the root transform
             self.__root_xf.transform = self.model.get_as_floats(item)
+            mark_gesture_stage(GestureLatency.REDRAW)
         elif item == self.model.prim_path:
             # If prim_path or width or height or intensity changed, redraw everything
             self.invalidate()
         elif item == self.model.width or item == self.model.height or item == self.model.intensity:
             # Interpret None as changing multiple light shape settings
             self._build_shape()
+            mark_gesture_stage(GestureLatency.REDRAW)
+
+    def replay_gesture(self, event):
+        """
+        Replays the event of a GestureRecording on the handle it was recorded
+        on. Returns False when there is no such handle.
+        """
+        gesture = self._drag_gestures.get(event.values.get("handle"))
+        if gesture is None:
+            return False
+        if event.state == "began":
+            gesture.began(event.values["ray_closest_point"])
+        elif event.state == "changed":
+            gesture.changed(event.values["ray_closest_point"])
+        elif event.state == "ended":
+            gesture.ended()
+        else:
+            return False
+        return True
@@ -9,10 +9,23 @@
 __all__ = ["LightModel"]
 
 import carb
+from omni.example.ui_scene.common import ChangeSet
+from omni.example.ui_scene.common import GestureLatency
+from omni.example.ui_scene.common import SelectionDelta
+from omni.example.ui_scene.common import SelectionSnapshot
+from omni.example.ui_scene.common import get_notice_hub
+from omni.example.ui_scene.common import get_scene_query
+from omni.example.ui_scene.common import get_selection_adapter
+from omni.example.ui_scene.common import instrumented
+from omni.example.ui_scene.common import trace_args
+from omni.example.ui_scene.common import trace_item
+from omni.example.ui_scene.common import is_resynced
+from omni.example.ui_scene.common import mark_gesture_stage
+from omni.example.ui_scene.common import resolve_resynced_path
 from omni.ui import scene as sc
 import omni.usd
 
-from pxr import Usd, UsdGeom, UsdLux, Tf, Gf
+from pxr import Usd, UsdGeom, UsdLux, Gf, Sdf
 
 
 def _flatten_matrix(matrix: Gf.Matrix4d):
@@ -82,16 +95,25 @@ class LightModel(sc.AbstractManipulatorModel):
 
         # Current selection
         self._light = None
+        # The light parameters are read once and kept until they are changed
+        self._selection = SelectionSnapshot(None, [])
         self._stage_listener = None
 
-        # Track selection change
-        self._events = self._usd_context.get_stage_event_stream()
-        self._stage_event_sub = self._events.create_subscription_to_pop(
-            self._on_stage_event, name="Light Manipulator Selection Change"
+        # Track selection change. The hub is shared by all the samples.
+        self._notice_hub = get_notice_hub(self._usd_context_name)
+        # The transforms are shared with the other samples and viewports
+        self._query = get_scene_query(self._usd_context_name)
+        self._selection_adapter = get_selection_adapter(self._usd_context_name)
+        self._selection_sub = self._selection_adapter.subscribe(
+            self._on_kit_selection_changed, name="Light Manipulator Selection Change", current=True
         )
 
-    def __del__(self):
-        self._invalidate_object()
+    def destroy(self):
+        """Release the subscriptions to the shared adapter and hub"""
+        self._selection_sub = None
+        self._stage_listener = None
+        self._light = None
+        self._selection = SelectionSnapshot(None, [])
 
     @property
     def _usd_context(self) -> Usd.Stage:
@@ -106,30 +128,42 @@ class LightModel(sc.AbstractManipulatorModel):
     def _time(self):
         return Usd.TimeCode.Default()
 
-    def _notice_changed(self, notice, stage):
-        """Called by Tf.Notice. When USD data changes, we update the ui"""
+    @instrumented()
+    def _notice_changed(self, changes: ChangeSet):
+        """Called by the NoticeHub with the changes of the light and its parents. We update the ui"""
         light_path = self.prim_path.value
+        trace_args(path=light_path, resynced=len(changes.resynced), changed=len(changes.info_only))
         if not light_path:
             return
 
+        if is_resynced(light_path, changes.resynced):
+            self._on_light_resynced(changes)
+            return
+
+        light_sdf_path = Sdf.Path(light_path)
         changed_items = set()
-        for p in notice.GetChangedInfoOnlyPaths():
-            prim_path = p.GetPrimPath().pathString
-            if prim_path != light_path:
+        for prim_path, names in changes.info_only.items():
+            if prim_path != light_sdf_path:
                 # Update on any parent transformation changes too
-                if light_path.startswith(prim_path):
-                    if UsdGeom.Xformable.IsTransformationAffectedByAttrNamed(p.name):
+                if light_sdf_path.HasPrefix(prim_path):
+                    if ChangeSet.XFORM in changes.get_classes(prim_path):
                         changed_items.add(self.transform)
                 continue
 
-            if UsdGeom.Xformable.IsTransformationAffectedByAttrNamed(p.name):
-                changed_items.add(self.transform)
-            elif self.width and p.name == "width":
-                changed_items.add(self.width)
-            elif self.height and p.name == "height":
-                changed_items.add(self.height)
-            elif self.intensity and p.name == "intensity":
-                changed_items.add(self.intensity)
+            for name in names:
+                # The attributes are "inputs:width" etc. since USD 21.11
+                short_name = name.split(":")[-1]
+                if short_name in ("width", "height", "intensity"):
+                    self._selection.invalidate(light_path, [SelectionSnapshot.LIGHT])
+
+                if UsdGeom.Xformable.IsTransformationAffectedByAttrNamed(name):
+                    changed_items.add(self.transform)
+                elif self.width and short_name == "width":
+                    changed_items.add(self.width)
+                elif self.height and short_name == "height":
+                    changed_items.add(self.height)
+                elif self.intensity and short_name == "intensity":
+                    changed_items.add(self.intensity)
 
         for item in changed_items:
             self._item_changed(item)
@@ -150,14 +184,17 @@ class LightModel(sc.AbstractManipulatorModel):
             return item.value
         return None
 
+    @instrumented()
     def set_floats_commands(self, item, value):
         """set the item value to USD using commands, this is useful because it supports undo/redo"""
+        trace_item(self, item, path=self._current_path)
         if not self._current_path:
             return
 
         if not value or not item:
             return
 
+        mark_gesture_stage(GestureLatency.WRITE)
         # we get the previous value from the model instead of USD
         if item == self.height:
             prev_value = self.height.value
@@ -186,8 +223,10 @@ class LightModel(sc.AbstractManipulatorModel):
             omni.kit.commands """
         item.value = value
 
+    @instrumented()
     def set_floats(self, item, value):
         """set the item value directly to USD. This is useful when we want to update the usd but not record it in commands"""
+        trace_item(self, item, path=self._current_path)
         if not self._current_path:
             return
 
@@ -199,6 +238,8 @@ class LightModel(sc.AbstractManipulatorModel):
         if pre_value == value:
             return
 
+        mark_gesture_stage(GestureLatency.WRITE)
+
         if item == self.height:
             self._set_height(self._time, value)
         elif item == self.width:
@@ -206,28 +247,52 @@ class LightModel(sc.AbstractManipulatorModel):
         elif item == self.intensity:
             self._set_intensity(self._time, value)
 
-    def _on_stage_event(self, event):
-        """Called by stage_event_stream"""
-        if event.type == int(omni.usd.StageEventType.SELECTION_CHANGED):
-            self._on_kit_selection_changed()
+    def _on_light_resynced(self, changes: ChangeSet):
+        """
+        The light or its parent is renamed, reparented or recomposed. Follow
+        the light to its new path without going through the selection.
+        """
+        stage = self._usd_context.get_stage()
+        new_path = resolve_resynced_path(stage, self._current_path, list(changes.resynced), "RectLight")
+        prim = stage.GetPrimAtPath(new_path) if new_path else None
+        if not prim or not prim.IsA(UsdLux.RectLight):
+            # The light is removed
+            return self._invalidate_object(carb.settings.get_settings())
+
+        self._light = UsdLux.RectLight(prim)
+        self._selection = SelectionSnapshot(stage, [new_path], self._time)
+        if new_path != self.prim_path.value:
+            self.prim_path.value = new_path
+            self._stage_listener.set_paths([new_path])
+            self._item_changed(self.prim_path)
+
+        # The old values could be anything now
+        for item in (self.transform, self.width, self.height, self.intensity):
+            self._item_changed(item)
 
     def _invalidate_object(self, settings):
-        # Revoke the Tf.Notice listener, we don't need to update anything
-        if self._stage_listener:
-            self._stage_listener.Revoke()
-            self._stage_listener = None
+        # Stop listening to the changes, we don't need to update anything
+        self._stage_listener = None
 
         # Reset original Viewport gizmo line width
         settings.set("/persistent/app/viewport/gizmo/lineWidth", 0)
 
         # Clear any cached UsdLux.Light object
         self._light = None
+        self._selection = SelectionSnapshot(None, [])
 
         # Set the prim_path to empty
         self.prim_path.value = ""
         self._item_changed(self.prim_path)
 
-    def _on_kit_selection_changed(self):
+    @instrumented()
+    def _on_kit_selection_changed(self, delta: SelectionDelta):
+        """Called by the SelectionAdapter, only the first selected prim is used"""
+        trace_args(path=delta.primary)
+        if self._light and delta.primary == self._current_path:
+            # Other prims are added or removed
+            return
+
         # selection change, reset it for now
         self._light = None
 
@@ -243,11 +308,10 @@ class LightModel(sc.AbstractManipulatorModel):
         if not stage:
             return self._invalidate_object(settings)
 
-        prim_paths = usd_context.get_selection().get_selected_prim_paths() if usd_context else None
-        if not prim_paths:
+        if not delta.primary:
             return self._invalidate_object(settings)
 
-        prim = stage.GetPrimAtPath(prim_paths[0])
+        prim = stage.GetPrimAtPath(delta.primary)
         if prim and prim.IsA(UsdLux.RectLight):
             self._light = UsdLux.RectLight(prim)
 
@@ -255,32 +319,44 @@ class LightModel(sc.AbstractManipulatorModel):
             return self._invalidate_object(settings)
 
         selected_path = self._light.GetPrim().GetPath().pathString
+        self._selection = SelectionSnapshot(stage, [selected_path], self._time)
         if selected_path != self.prim_path.value:
             self.prim_path.value = selected_path
             self._item_changed(self.prim_path)
 
-        # Add a Tf.Notice listener to update the light attributes
+        # Listen to the changes of the light to update the light attributes
         if not self._stage_listener:
-            self._stage_listener = Tf.Notice.Register(Usd.Notice.ObjectsChanged, self._notice_changed, stage)
+            self._stage_listener = self._notice_hub.subscribe_objects_changed(
+                self._notice_changed, [selected_path], name="Light Manipulator"
+            )
+        else:
+            self._stage_listener.set_paths([selected_path])
 
     def _get_transform(self, time: Usd.TimeCode):
         """Returns world transform of currently selected object"""
         if not self._light:
             return LightModel.MatrixItem.identity.copy()
 
-        # Compute matrix from world-transform in USD
-        world_xform = self._light.ComputeLocalToWorldTransform(time)
+        # Compute matrix from world-transform in USD, it's cached until the
+        # light or its parents are moved
+        world_xform = self._query.world_xform(self._current_path, time)
 
         # Flatten Gf.Matrix4d to list
         return _flatten_matrix(world_xform)
 
+    def _get_light_parameter(self, name: str, time: Usd.TimeCode):
+        if time != self._selection.time:
+            return getattr(self._light, f"Get{name.capitalize()}Attr")().Get(time)
+        parameters = self._selection.light_parameters(self._current_path) or {}
+        return parameters.get(name)
+
     def _get_intensity(self, time: Usd.TimeCode):
         """Returns intensity of currently selected light"""
         if not self._light:
             return 0.0
 
         # Get intensity directly from USD
-        return self._light.GetIntensityAttr().Get(time)
+        return self._get_light_parameter("intensity", time)
 
     def _set_intensity(self, time: Usd.TimeCode, value):
         """set intensity of currently selected light"""
@@ -296,7 +372,7 @@ class LightModel(sc.AbstractManipulatorModel):
             return 0.0
 
         # Get radius directly from USD
-        return self._light.GetWidthAttr().Get(time)
+        return self._get_light_parameter("width", time)
 
     def _set_width(self, time: Usd.TimeCode, value):
         """set width of currently selected light"""
@@ -312,7 +388,7 @@ class LightModel(sc.AbstractManipulatorModel):
             return 0.0
 
         # Get height directly from USD
-        return self._light.GetHeightAttr().Get(time)
+        return self._get_light_parameter("height", time)
 
     def _set_height(self, time: Usd.TimeCode, value):
         """set height of currently selected light"""
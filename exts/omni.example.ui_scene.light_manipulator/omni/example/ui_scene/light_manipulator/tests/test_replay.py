@@ -0,0 +1,64 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+__all__ = ["TestLightReplay"]
+
+from omni.example.ui_scene.common import GestureEvent
+from omni.example.ui_scene.common import GestureRecording
+from omni.example.ui_scene.common import GestureReplayer
+from omni.example.ui_scene.light_manipulator import LightManipulator
+from omni.example.ui_scene.light_manipulator import LightModel
+from omni.example.ui_scene.light_manipulator.light_manipulator import GESTURE_NAME
+from omni.ui import scene as sc
+from omni.ui.tests.test_base import OmniUiTest
+from pxr import UsdLux
+import omni.kit.app
+import omni.usd
+
+
+class TestLightReplay(OmniUiTest):
+    async def test_drag(self):
+        """The drag of the right edge is replayed without the mouse"""
+        await omni.usd.get_context().new_stage_async()
+        stage = omni.usd.get_context().get_stage()
+        light = UsdLux.RectLight.Define(stage, "/RectLight")
+        light.GetWidthAttr().Set(200)
+        light.GetHeightAttr().Set(100)
+
+        window = await self.create_test_window(width=256, height=256)
+        with window.frame:
+            scene_view = sc.SceneView()
+            with scene_view.scene:
+                manipulator = LightManipulator(model=LightModel())
+
+        # The right edge is dragged by 10 and 5 units, the width grows twice
+        # as much because the edge is at the half of the width
+        recording = GestureRecording(selection=["/RectLight"])
+        recording.events = [
+            GestureEvent(0, 0.0, GESTURE_NAME, "began", {"handle": "0/1", "ray_closest_point": [100, 0, 0]}),
+            GestureEvent(1, 0.1, GESTURE_NAME, "changed", {"handle": "0/1", "ray_closest_point": [110, 0, 0]}),
+            GestureEvent(2, 0.2, GESTURE_NAME, "changed", {"handle": "0/1", "ray_closest_point": [115, 0, 0]}),
+            GestureEvent(3, 0.3, GESTURE_NAME, "ended", {"handle": "0/1"}),
+            # There is no such handle
+            GestureEvent(4, 0.4, GESTURE_NAME, "began", {"handle": "9/9", "ray_closest_point": [0, 0, 0]}),
+        ]
+        report = await GestureReplayer(recording, {GESTURE_NAME: manipulator.replay_gesture}).replay()
+
+        self.assertEqual(report.events, 4)
+        self.assertEqual(report.skipped, 1)
+        self.assertAlmostEqual(light.GetWidthAttr().Get(), 230.0, places=3)
+        self.assertGreater(report.usd_writes, 0)
+        # Only the shape is updated while dragging, the manipulator is not rebuilt
+        self.assertEqual(report.rebuilds, 0)
+
+        # The destroyed model doesn't follow the selection
+        manipulator.model.destroy()
+        omni.usd.get_context().get_selection().clear_selected_prim_paths()
+        for _ in range(3):
+            await omni.kit.app.get_app().next_update_async()
+        self.assertEqual(manipulator.model.prim_path.value, "/RectLight")
@@ -0,0 +1,68 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+__all__ = ["TestLightSnapshot"]
+
+from omni.example.ui_scene.common import SceneRecorder
+from omni.example.ui_scene.common import snapshot_build
+from omni.example.ui_scene.light_manipulator import LightManipulator
+from omni.example.ui_scene.light_manipulator import LightModel
+from pxr import UsdLux
+import omni.kit.app
+import omni.kit.test
+import omni.usd
+
+MODULE = "omni.example.ui_scene.light_manipulator.light_manipulator"
+
+
+class TestLightSnapshot(omni.kit.test.AsyncTestCase):
+    """The shapes of the manipulator without the viewport and the renderer"""
+
+    async def _create_manipulator(self):
+        await omni.usd.get_context().new_stage_async()
+        stage = omni.usd.get_context().get_stage()
+        light = UsdLux.RectLight.Define(stage, "/RectLight")
+        light.GetWidthAttr().Set(200)
+        light.GetHeightAttr().Set(100)
+        omni.usd.get_context().get_selection().set_selected_prim_paths(["/RectLight"], True)
+        for _ in range(3):
+            await omni.kit.app.get_app().next_update_async()
+        return LightManipulator(model=LightModel())
+
+    async def test_build(self):
+        manipulator = await self._create_manipulator()
+        snapshot = snapshot_build(manipulator)
+
+        # The rectangle, the intensity lines and the lines under the arrows
+        self.assertEqual(snapshot.count("Line"), 12)
+        self.assertEqual(snapshot.count("PolygonMesh"), 4)
+        self.assertEqual(snapshot.count("Rectangle"), 4)
+        # The transform of the shape is the size of the light
+        shape = snapshot.roots[0]["children"][0]["children"][0]
+        self.assertEqual(shape["properties"]["transform"][0], 200)
+        self.assertEqual(shape["properties"]["transform"][5], 100)
+        # The same light builds the same shapes
+        self.assertEqual(snapshot.diff(snapshot_build(manipulator)), [])
+
+    async def test_width(self):
+        """Changing the width only changes the transform of the shape"""
+        manipulator = await self._create_manipulator()
+        model = manipulator.model
+        recorder = SceneRecorder()
+        with recorder.install(MODULE):
+            manipulator.on_build()
+            before = recorder.snapshot()
+            model.set_floats(model.width, 300)
+            # The model gets the change from USD
+            for _ in range(2):
+                await omni.kit.app.get_app().next_update_async()
+            after = recorder.snapshot()
+
+        differences = before.diff(after)
+        self.assertEqual(len(differences), 1)
+        self.assertTrue(differences[0].startswith("/Transform[0]/Transform[0]/Transform[0].transform"))
@@ -15,11 +15,16 @@ from .light_manipulator import LightManipulator
 
 
 class ViewportScene:
-    """The light Manipulator, placed into a Viewport"""
+    """
+    The light Manipulator, placed into a Viewport. The model is shared by the
+    scenes of all the viewports.
+    """
 
-    def __init__(self, viewport_window, ext_id: str):
+    def __init__(self, viewport_window, ext_id: str, model: LightModel = None):
         self._scene_view = None
         self._viewport_window = viewport_window
+        # The model is destroyed with the scene only when it's not shared
+        self._own_model = None if model else LightModel()
 
         # Create a unique frame for our SceneView
         with self._viewport_window.get_frame(ext_id):
@@ -27,7 +32,7 @@ class ViewportScene:
             self._scene_view = sc.SceneView()
             # Add the manipulator into the SceneView's scene
             with self._scene_view.scene:
-                LightManipulator(model=LightModel())
+                LightManipulator(model=model or self._own_model)
 
             # Register the SceneView with the Viewport to get projection and view updates
             self._viewport_window.viewport_api.add_scene_view(self._scene_view)
@@ -42,6 +47,9 @@ class ViewportScene:
             # Be a good citizen, and un-register the SceneView from Viewport updates
             if self._viewport_window:
                 self._viewport_window.viewport_api.remove_scene_view(self._scene_view)
+        if self._own_model:
+            self._own_model.destroy()
+            self._own_model = None
         # Remove our references to these objects
         self._viewport_window = None
         self._scene_view = None
@@ -0,0 +1,125 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+__all__ = ["BoundWorker"]
+
+from typing import Callable, Dict, List, Optional
+import asyncio
+import time
+
+from pxr import Gf
+from pxr import Sdf
+from pxr import Usd
+from pxr import UsdGeom
+import carb
+import omni.kit.app
+
+
+class _BoundJob:
+    """
+    The world bound of a subtree, computed a few prims at a time. The
+    boundable prims and the instances are computed as a whole, the rest are
+    walked down to their children. The paths are kept instead of the prims,
+    so the stage can be edited between the steps.
+    """
+
+    def __init__(self, stage: Usd.Stage, path: str, time_code: Usd.TimeCode):
+        self._stage = stage
+        # One cache for the whole job, the prototypes of the instances are
+        # computed once
+        self._box_cache = UsdGeom.BBoxCache(time_code, includedPurposes=[UsdGeom.Tokens.default_])
+        self._stack: List[Sdf.Path] = [Sdf.Path(path)]
+        self._found = False
+        self.range = Gf.Range3d()
+
+    @property
+    def done(self) -> bool:
+        return not self._stack
+
+    @property
+    def result(self) -> Optional[Gf.Range3d]:
+        """The bound when it's done, None when the prim doesn't exist"""
+        return self.range if self._found else None
+
+    def step(self, budget: float):
+        """Visits the prims until `budget` seconds are spent, at least one"""
+        end = time.perf_counter() + budget
+        while self._stack:
+            prim = self._stage.GetPrimAtPath(self._stack.pop())
+            if prim:
+                self._found = True
+                if prim.IsInstance() or prim.IsA(UsdGeom.Boundable):
+                    self.range.UnionWith(self._box_cache.ComputeWorldBound(prim).ComputeAlignedRange())
+                else:
+                    self._stack.extend(child.GetPath() for child in reversed(prim.GetChildren()))
+            if time.perf_counter() >= end:
+                return
+
+
+class BoundWorker:
+    """
+    Computes the world bounds of the big subtrees on the Kit loop, a part of
+    the subtree per frame, so they don't block the UI.
+
+    Every job spends `budget` seconds per frame. USD is only read from the
+    main thread, so the stage can be edited between the frames. When the prim
+    is edited, the caller requests the bound again, and the previous job is
+    cancelled before its next step.
+
+    The callback is called from the Kit loop.
+    """
+
+    def __init__(self, budget: float = 0.002):
+        self._budget = budget
+        # Path -> asyncio.Task of the job
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def destroy(self):
+        self.cancel_all()
+
+    def is_pending(self, path: str) -> bool:
+        return path in self._tasks
+
+    def request(self, stage: Usd.Stage, path: str, time: Usd.TimeCode, callback: Callable[[str, Gf.Range3d], None]):
+        """Start computing the world bound of the prim, the previous job for the same prim is cancelled"""
+        self.cancel(path)
+        self._tasks[path] = asyncio.ensure_future(self._compute(_BoundJob(stage, path, time), path, callback))
+
+    def cancel(self, path: str):
+        task = self._tasks.pop(path, None)
+        if task:
+            task.cancel()
+
+    def cancel_all(self):
+        for task in self._tasks.values():
+            task.cancel()
+        self._tasks = {}
+
+    async def _compute(self, job: _BoundJob, path: str, callback):
+        app = omni.kit.app.get_app()
+        try:
+            while True:
+                job.step(self._budget)
+                if job.done:
+                    break
+                await app.next_update_async()
+            result = job.result
+        except asyncio.CancelledError:
+            # A newer job replaced this one
+            return
+        except Exception as e:
+            carb.log_warn(f"Can't compute the bound of {path}: {e}")
+            result = None
+
+        if self._tasks.get(path) is asyncio.current_task():
+            del self._tasks[path]
+        else:
+            return
+
+        if result is not None:
+            callback(path, result)
@@ -10,9 +10,7 @@ __all__ = ["ObjectInfoExtension"]
 
 import carb
 import omni.ext
-from omni.kit.viewport.utility import get_active_viewport_window
-
-from .viewport_scene import ViewportScene
+from omni.example.ui_scene.common import SelectionTrigger
 
 
 class ObjectInfoExtension(omni.ext.IExt):
@@ -20,7 +18,10 @@ class ObjectInfoExtension(omni.ext.IExt):
     over any object in a UI Scene.
     """
     def __init__(self):
-        self._viewport_scene = None
+        self._ext_id = None
+        self._trigger = None
+        self._model = None
+        self._viewports = None
 
     def on_startup(self, ext_id: str) -> None:
         """Called when the extension is starting up.
@@ -28,20 +29,39 @@ class ObjectInfoExtension(omni.ext.IExt):
         Args:
             ext_id: Extension ID provided by Kit.
         """
-        # Get the active Viewport (which at startup is the default Viewport)
-        viewport_window = get_active_viewport_window()
+        self._ext_id = ext_id
+        # The info is shown for the selected prims, nothing is created until
+        # the first selection
+        self._trigger = SelectionTrigger(self._create_scenes, name="Object Info Startup")
+
+    def _create_scenes(self) -> None:
+        """Called on the first selection. Creates the model and the scenes."""
+        # USD and the manipulator are only imported when they are needed
+        from omni.example.ui_scene.common import ViewportTracker
+
+        from .object_info_model import ObjectInfoModel
+        from .viewport_scene import ViewportScene
 
-        # Issue an error if there is no Viewport
-        if not viewport_window:
-            carb.log_error(f"No Viewport Window to add {ext_id} scene to")
-            return
+        ext_id = self._ext_id
+        # One model for all the viewports, so a new viewport doesn't query
+        # USD again
+        self._model = ObjectInfoModel()
+        # Build out the scene in every Viewport, including the ones opened later
+        self._viewports = ViewportTracker(lambda window: ViewportScene(window, ext_id, self._model))
 
-        # Build out the scene
-        self._viewport_scene = ViewportScene(viewport_window, ext_id)
+        # Issue a warning if there is no Viewport yet
+        if not self._viewports.scenes:
+            carb.log_warn(f"No Viewport Window to add {ext_id} scene to yet")
 
     def on_shutdown(self) -> None:
         """Called when the extension is shutting down."""
 
-        if self._viewport_scene:
-            self._viewport_scene.destroy()
-            self._viewport_scene = None
+        if self._trigger:
+            self._trigger.destroy()
+            self._trigger = None
+        if self._viewports:
+            self._viewports.destroy()
+            self._viewports = None
+        if self._model:
+            self._model.destroy()
+            self._model = None
@@ -0,0 +1,194 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+__all__ = ["LabelLayout", "LabelPlacement"]
+
+from collections import namedtuple
+from typing import Dict, Hashable, Tuple
+
+# Everything here is in screen points with Y pointing up, relative to the
+# anchor of the label (the projected top of the object's bounding box).
+
+# The elbow of the leader line and the side of the anchor the text is on (1 is
+# right, -1 is left). The knee of the leader line is always straight above the
+# anchor.
+LabelPlacement = namedtuple("LabelPlacement", ["elbow_x", "elbow_y", "side"])
+
+# Size of the grid cell used to look up the labels that are already placed
+LAYOUT_CELL_SIZE = 64
+# Labels are only placed again when the anchor moved further than this
+RELAYOUT_THRESHOLD = 4.0
+# How many rows above the default position we try before giving up
+LAYOUT_LEVELS = 6
+# Vertical distance between the rows
+LAYOUT_LEVEL_STEP = 24
+
+
+class LabelLayout:
+    """
+    Places label rectangles around their screen-space anchors so that they
+    don't overlap.
+
+    The placement is greedy: every label takes the first free candidate
+    position, going from the default position at the right of the anchor to
+    the left and then up row by row. Already placed labels are kept in a
+    uniform grid, so the collision test only looks at the labels in the
+    cells the candidate covers.
+
+    The layout is incremental. `update` only places the labels whose anchor
+    or size changed more than `threshold`, the rest keep their position.
+    """
+
+    def __init__(
+        self,
+        segment_length: float,
+        vertical_mult: float,
+        text_offset: float,
+        cell_size: float = LAYOUT_CELL_SIZE,
+        threshold: float = RELAYOUT_THRESHOLD,
+        levels: int = LAYOUT_LEVELS,
+        level_step: float = LAYOUT_LEVEL_STEP,
+    ):
+        self._text_offset = text_offset
+        self._cell_size = cell_size
+        self._threshold = threshold
+
+        # Candidates in the order of preference. The first one is where the
+        # label is when nothing is around it.
+        self._candidates = []
+        for level in range(levels):
+            elbow_y = segment_length * vertical_mult + level * level_step
+            for side in (1, -1):
+                self._candidates.append(LabelPlacement(side * segment_length, elbow_y, side))
+
+        self.clear()
+
+    def clear(self):
+        """Forget all the placed labels"""
+        # The anchor and size each label was placed with
+        self._anchors: Dict[Hashable, Tuple[float, float]] = {}
+        self._sizes: Dict[Hashable, Tuple[float, float]] = {}
+        # Placement and the absolute screen rectangle of each label
+        self._placements: Dict[Hashable, LabelPlacement] = {}
+        self._rects: Dict[Hashable, Tuple[float, float, float, float]] = {}
+        # (cell x, cell y) -> keys of the labels covering the cell
+        self._grid: Dict[Tuple[int, int], set] = {}
+
+    @property
+    def default_placement(self) -> LabelPlacement:
+        return self._candidates[0]
+
+    def get_placement(self, key: Hashable) -> LabelPlacement:
+        """The placement of the label, or the default one if it's not placed"""
+        return self._placements.get(key, self._candidates[0])
+
+    def update(self, anchors: Dict[Hashable, Tuple[float, float]], sizes: Dict[Hashable, Tuple[float, float]]) -> bool:
+        """
+        Place the labels for the given anchors and sizes. The labels are
+        placed in the order of `anchors`, so the first ones win the default
+        position.
+
+        Returns True if any placement changed. The labels follow their
+        anchors anyway, so there is nothing to rebuild when it's False.
+        """
+        threshold = self._threshold
+        stale = [key for key in self._anchors if key not in anchors]
+        dirty = []
+        for key, anchor in anchors.items():
+            previous = self._anchors.get(key)
+            if (
+                previous is None
+                or self._sizes.get(key) != sizes[key]
+                or abs(previous[0] - anchor[0]) > threshold
+                or abs(previous[1] - anchor[1]) > threshold
+            ):
+                dirty.append(key)
+
+        if not stale and not dirty:
+            return False
+
+        previous = {key: self._placements.get(key) for key in dirty}
+        for key in stale:
+            self._remove(key)
+        for key in dirty:
+            self._remove(key)
+
+        changed = False
+        for key in dirty:
+            if self._place(key, anchors[key], sizes[key]) != previous[key]:
+                changed = True
+
+        return changed
+
+    def _label_rect(self, anchor, size, placement: LabelPlacement):
+        """Screen rectangle (min x, min y, max x, max y) of the label"""
+        width, height = size
+        if placement.side > 0:
+            min_x = anchor[0] + placement.elbow_x + self._text_offset
+        else:
+            min_x = anchor[0] + placement.elbow_x - self._text_offset - width
+        min_y = anchor[1] + placement.elbow_y - height * 0.5
+        return (min_x, min_y, min_x + width, min_y + height)
+
+    def _cells(self, rect):
+        cell_size = self._cell_size
+        x0 = int(rect[0] // cell_size)
+        y0 = int(rect[1] // cell_size)
+        x1 = int(rect[2] // cell_size)
+        y1 = int(rect[3] // cell_size)
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                yield (x, y)
+
+    def _overlaps(self, rect) -> int:
+        """Number of placed labels the rectangle overlaps"""
+        seen = set()
+        for cell in self._cells(rect):
+            keys = self._grid.get(cell)
+            if keys:
+                seen.update(keys)
+
+        count = 0
+        for key in seen:
+            other = self._rects[key]
+            if rect[0] < other[2] and other[0] < rect[2] and rect[1] < other[3] and other[1] < rect[3]:
+                count += 1
+        return count
+
+    def _place(self, key, anchor, size) -> LabelPlacement:
+        best = None
+        best_rect = None
+        best_overlaps = None
+        for candidate in self._candidates:
+            rect = self._label_rect(anchor, size, candidate)
+            overlaps = self._overlaps(rect)
+            if best_overlaps is None or overlaps < best_overlaps:
+                best, best_rect, best_overlaps = candidate, rect, overlaps
+                if not overlaps:
+                    break
+
+        self._anchors[key] = anchor
+        self._sizes[key] = size
+        self._placements[key] = best
+        self._rects[key] = best_rect
+        for cell in self._cells(best_rect):
+            self._grid.setdefault(cell, set()).add(key)
+        return best
+
+    def _remove(self, key):
+        rect = self._rects.pop(key, None)
+        if rect is not None:
+            for cell in self._cells(rect):
+                keys = self._grid.get(cell)
+                if keys:
+                    keys.discard(key)
+                    if not keys:
+                        del self._grid[cell]
+        self._anchors.pop(key, None)
+        self._sizes.pop(key, None)
+        self._placements.pop(key, None)
@@ -8,10 +8,14 @@
 
 __all__ = ["ObjectInfoManipulator"]
 
+from omni.example.ui_scene.common import instrumented
 from omni.ui import color as cl
 from omni.ui import scene as sc
 import omni.ui as ui
 
+from .label_layout import LabelLayout
+
+# All the sizes are in screen points
 LEADER_LINE_CIRCLE_RADIUS = 2
 LEADER_LINE_THICKNESS = 2
 LEADER_LINE_SEGMENT_LENGTH = 20
@@ -20,48 +24,132 @@ HORIZ_TEXT_OFFSET = 5
 LINE1_OFFSET = 3
 LINE2_OFFSET = 0
 
+# Rough size of the label text, it's used to find where the labels overlap
+LABEL_CHAR_WIDTH = 8
+LABEL_HEIGHT = 36
+
 
 class ObjectInfoManipulator(sc.Manipulator):
     """Manipulator that displays the object path and material assignment
     with a leader line to the top of the object's bounding box.
+
+    When several objects are selected, the labels are moved around in screen
+    space so they don't overlap.
     """
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        self._layout = LabelLayout(LEADER_LINE_SEGMENT_LENGTH, VERTICAL_MULT, HORIZ_TEXT_OFFSET)
+        # World positions of the labels from the last build. The camera
+        # changes much more often than the model, so we don't ask the model.
+        self._positions = {}
+        # The camera of the SceneView, we watch it to move the labels
+        self._camera_model = None
+        self._camera_sub = None
+
+    def destroy(self):
+        if self._camera_model and self._camera_sub is not None:
+            self._camera_model.remove_item_changed_fn(self._camera_sub)
+        self._camera_model = None
+        self._camera_sub = None
+
+    def _watch_camera(self):
+        """Subscribe to the camera of the SceneView this manipulator is in"""
+        scene_view = getattr(self, "scene_view", None)
+        camera_model = scene_view.model if scene_view else None
+        if camera_model is self._camera_model:
+            return
+
+        self.destroy()
+        if camera_model:
+            self._camera_model = camera_model
+            self._camera_sub = camera_model.add_item_changed_fn(lambda m, i: self._on_camera_changed())
+
+    def _on_camera_changed(self):
+        # Only rebuild when some label has to jump to another place. When the
+        # anchors moved a little, the labels follow them in the scene graph.
+        if self.model and self._update_layout():
+            self.invalidate()
+
+    def _update_layout(self) -> bool:
+        """Project the anchors to the screen and place the labels"""
+        if not self._positions:
+            self._layout.clear()
+            return False
+
+        scene_view = getattr(self, "scene_view", None)
+        if not scene_view:
+            return False
+        half_width = scene_view.computed_width * 0.5
+        half_height = scene_view.computed_height * 0.5
+
+        anchors = {}
+        sizes = {}
+        for path, position in self._positions.items():
+            ndc = self.transform_space(sc.Space.WORLD, sc.Space.NDC, position)
+            anchors[path] = ((ndc[0] + 1.0) * half_width, (ndc[1] + 1.0) * half_height)
+            text_length = max(len(path), len(self.model.get_material(path))) + len("Material: ")
+            sizes[path] = (text_length * LABEL_CHAR_WIDTH, LABEL_HEIGHT)
+
+        return self._layout.update(anchors, sizes)
+
+    @instrumented()
     def on_build(self):
         """Called when the model is changed and rebuilds the whole manipulator"""
         if not self.model:
             return
 
+        self._positions = {}
+
         # If we don't have a selection then just return
         if self.model.get_item("name") == "":
+            self._layout.clear()
             return
 
-        position = self.model.get_as_floats(self.model.get_item("position"))
+        self._positions = self.model.get_positions(self.model.get_item("paths"))
+
+        self._watch_camera()
+        self._update_layout()
+
+        for path, position in self._positions.items():
+            self._build_label(path, position)
+
+    def _build_label(self, path, position):
+        placement = self._layout.get_placement(path)
+        # The knee of the leader line is straight above the anchor
+        knee_y = placement.elbow_y - LEADER_LINE_SEGMENT_LENGTH * (VERTICAL_MULT - 1.0)
+        if placement.side > 0:
+            text_x = placement.elbow_x + HORIZ_TEXT_OFFSET
+            line1_alignment = ui.Alignment.LEFT_BOTTOM
+            line2_alignment = ui.Alignment.LEFT_TOP
+        else:
+            text_x = placement.elbow_x - HORIZ_TEXT_OFFSET
+            line1_alignment = ui.Alignment.RIGHT_BOTTOM
+            line2_alignment = ui.Alignment.RIGHT_TOP
 
         # Move everything to where the object is
         with sc.Transform(transform=sc.Matrix44.get_translation_matrix(*position)):
             # Rotate everything to face the camera
             with sc.Transform(look_at=sc.Transform.LookAt.CAMERA):
-                # Leader lines with a small circle on the end
-                sc.Arc(LEADER_LINE_CIRCLE_RADIUS, axis=2, color=cl.yellow)
-                sc.Line([0, 0, 0], [0, LEADER_LINE_SEGMENT_LENGTH, 0],
-                        color=cl.yellow, thickness=LEADER_LINE_THICKNESS)
-                sc.Line([0, LEADER_LINE_SEGMENT_LENGTH, 0],
-                        [LEADER_LINE_SEGMENT_LENGTH, LEADER_LINE_SEGMENT_LENGTH * VERTICAL_MULT, 0],
-                        color=cl.yellow, thickness=LEADER_LINE_THICKNESS)
-
-                # Shift text to the end of the leader line with some offset
-                with sc.Transform(transform=sc.Matrix44.get_translation_matrix(
-                        LEADER_LINE_SEGMENT_LENGTH + HORIZ_TEXT_OFFSET,
-                        LEADER_LINE_SEGMENT_LENGTH * VERTICAL_MULT,
-                        0)):
-                    with sc.Transform(scale_to=sc.Space.SCREEN):
+                # Lay out everything in screen space
+                with sc.Transform(scale_to=sc.Space.SCREEN):
+                    # Leader lines with a small circle on the end
+                    sc.Arc(LEADER_LINE_CIRCLE_RADIUS, axis=2, color=cl.yellow)
+                    sc.Line([0, 0, 0], [0, knee_y, 0],
+                            color=cl.yellow, thickness=LEADER_LINE_THICKNESS)
+                    sc.Line([0, knee_y, 0],
+                            [placement.elbow_x, placement.elbow_y, 0],
+                            color=cl.yellow, thickness=LEADER_LINE_THICKNESS)
+
+                    # Shift text to the end of the leader line with some offset
+                    with sc.Transform(transform=sc.Matrix44.get_translation_matrix(text_x, placement.elbow_y, 0)):
                         # Offset each Label vertically in screen space
                         with sc.Transform(transform=sc.Matrix44.get_translation_matrix(0, LINE1_OFFSET, 0)):
-                            sc.Label(f"Path: {self.model.get_item('name')}",
-                                     alignment=ui.Alignment.LEFT_BOTTOM)
+                            sc.Label(f"Path: {path}", alignment=line1_alignment)
                         with sc.Transform(transform=sc.Matrix44.get_translation_matrix(0, LINE2_OFFSET, 0)):
-                            sc.Label(f"Material: {self.model.get_item('material')}",
-                                     alignment=ui.Alignment.LEFT_TOP)
+                            sc.Label(f"Material: {self.model.get_material(path)}", alignment=line2_alignment)
 
+    @instrumented()
     def on_model_updated(self, item):
         # Regenerate the manipulator
         self.invalidate()
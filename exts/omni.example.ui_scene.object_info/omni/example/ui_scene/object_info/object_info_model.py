@@ -8,14 +8,36 @@
 #
 __all__ = ["ObjectInfoModel"]
 
-from pxr import Tf
+from typing import Dict, Iterable, List, Sequence, Set
+
+from omni.example.ui_scene.common import ChangeSet
+from omni.example.ui_scene.common import PathSet
+from omni.example.ui_scene.common import PointInstancerBounds
+from omni.example.ui_scene.common import PrototypeBoundCache
+from omni.example.ui_scene.common import SelectionDelta
+from omni.example.ui_scene.common import SelectionSnapshot
+from omni.example.ui_scene.common import compute_authored_world_range
+from omni.example.ui_scene.common import format_instance_path
+from omni.example.ui_scene.common import get_notice_hub
+from omni.example.ui_scene.common import get_scene_query
+from omni.example.ui_scene.common import get_selection_adapter
+from omni.example.ui_scene.common import get_prototype
+from omni.example.ui_scene.common import instrumented
+from omni.example.ui_scene.common import is_prototype_path
+from omni.example.ui_scene.common import is_resynced
+from omni.example.ui_scene.common import parse_instance_path
+from omni.example.ui_scene.common import resolve_resynced_path
+from omni.example.ui_scene.common import trace_args
+from pxr import Gf
+from pxr import Sdf
 from pxr import Usd
 from pxr import UsdGeom
-from pxr import UsdShade
 
 from omni.ui import scene as sc
 import omni.usd
 
+from .bound_worker import BoundWorker
+
 # The distance to raise above the top of the object's bounding box
 TOP_OFFSET = 5
 
@@ -37,32 +59,151 @@ class ObjectInfoModel(sc.AbstractManipulatorModel):
     def __init__(self):
         super().__init__()
 
-        # Current selected prim and material
+        # Current selected prim
         self._prim = None
         self._current_path = ""
-        self._material_name = ""
+        # All the selected prims, the first one is the current prim
+        self._paths = []
+        # The materials are resolved only when they are shown
+        self._selection = SelectionSnapshot(None, [])
+        # The instances of PointInstancers take the material of their
+        # prototypes: instance path -> prototype path
+        self._instance_prototypes = {}
+        self._prototype_selection = SelectionSnapshot(None, [])
+        # The exact world bounds computed in the background, and the cheap
+        # ones we show while waiting for them
+        self._bounds = {}
+        self._placeholders = {}
+        self._bound_worker = BoundWorker()
+        # The instances of the same prototype share the bound
+        self._prototype_bounds = PrototypeBoundCache()
+        # The instances of PointInstancers are computed in bulk
+        self._instancer_bounds = PointInstancerBounds()
 
+        # The prims the selected paths depend on: the prims, the instancers
+        # and the prototypes -> the selected paths. The hub and the notices
+        # use the PathSet to find them in O(depth).
+        self._dependents: Dict[Sdf.Path, Set[str]] = {}
+        self._interest = PathSet()
+        # The selected path -> the prims it depends on, so a deselected path
+        # is unwatched without looking at the others
+        self._watched: Dict[str, List[Sdf.Path]] = {}
         self._stage_listener = None
         self.position = ObjectInfoModel.PositionItem()
 
-        # Save the UsdContext name (we currently only work with a single Context)
-        usd_context = self._get_context()
-
-        # Track selection changes
-        self._events = usd_context.get_stage_event_stream()
-        self._stage_event_sub = self._events.create_subscription_to_pop(
-            self._on_stage_event, name="Object Info Selection Update"
+        # Track selection changes. The hub is shared by all the samples.
+        self._notice_hub = get_notice_hub()
+        # The materials are shared with the other samples
+        self._query = get_scene_query()
+        self._selection_adapter = get_selection_adapter()
+        self._selection_sub = self._selection_adapter.subscribe(
+            self._on_kit_selection_changed, name="Object Info Selection Update", current=True
         )
+        # The materials of the final selection are resolved over a few frames
+        self._selection_async_sub = self._selection_adapter.subscribe_async(
+            self._process_selection_async, name="Object Info Selection Materials", current=True
+        )
+
+    def destroy(self):
+        self._bound_worker.destroy()
+        self._stage_listener = None
+        self._selection_sub = None
+        self._selection_async_sub = None
 
     def _get_context(self) -> Usd.Stage:
         # Get the UsdContext we are attached to
         return omni.usd.get_context()
 
-    def _notice_changed(self, notice: Usd.Notice, stage: Usd.Stage) -> None:
-        """Called by Tf.Notice.  Used when the current selected object changes in some way."""
-        for p in notice.GetChangedInfoOnlyPaths():
-            if self._current_path in str(p.GetPrimPath()):
-                self._item_changed(self.position)
+    @instrumented()
+    def _notice_changed(self, changes: ChangeSet) -> None:
+        """
+        Called by the NoticeHub with the changes of the selected objects, their
+        ancestors and their prototypes.
+        """
+        trace_args(path=self._current_path, resynced=len(changes.resynced), changed=len(changes.info_only))
+        changed = False
+        if changes.resynced:
+            changed = self._rebind_resynced(list(changes.resynced))
+            # The prototypes are looked up again when they are recomposed
+            self._prototype_selection.invalidate_prims(changes.resynced)
+        # The selected prims whose material binding could be changed as well
+        invalidated = set()
+        for p in changes.paths:
+            if is_prototype_path(p):
+                # All the instances of this prototype have a different bound now
+                self._prototype_bounds.clear_prototypes()
+                self._bounds = {}
+                changed = True
+                continue
+
+            for path in self._get_affected(p):
+                if parse_instance_path(path)[1] is not None:
+                    # The arrays or the prototypes of the instancer are edited
+                    self._instancer_bounds.clear()
+                    self._bounds.pop(path, None)
+                    changed = True
+                else:
+                    invalidated.add(path)
+                    # The old bound is shown until the new one is computed
+                    if path in self._bounds:
+                        self._placeholders[path] = self._bounds.pop(path)
+                    self._bound_worker.cancel(path)
+                    changed = True
+
+        if invalidated:
+            self._selection.invalidate_paths(invalidated)
+        if changed:
+            self._prototype_bounds.clear_transforms()
+            self._item_changed(self.position)
+
+    def _get_affected(self, changed_path: Sdf.Path) -> Set[str]:
+        """The selected paths that depend on the changed prim, its ancestors or its descendants"""
+        affected = set()
+        for path in self._interest.ancestors(changed_path) + self._interest.descendants(changed_path):
+            affected.update(self._dependents.get(path, ()))
+        return affected
+
+    def _rebind_resynced(self, resynced) -> bool:
+        """
+        The selected prims, the instancers or their parents are renamed,
+        reparented or recomposed. Follow them to the new paths without going
+        through the selection. Returns True if any selected prim is affected.
+        """
+        stage = self._get_context().get_stage()
+        moved = {}
+        # Only the selected paths under the resynced prims can be moved
+        candidates = set()
+        for resynced_path in resynced:
+            for path in self._interest.descendants(resynced_path):
+                candidates.update(self._dependents.get(path, ()))
+        for path in candidates:
+            instancer_path, index = parse_instance_path(path)
+            if not is_resynced(instancer_path, resynced):
+                continue
+            new_path = resolve_resynced_path(stage, instancer_path, resynced)
+            if new_path and index is not None:
+                new_path = format_instance_path(new_path, index)
+            moved[path] = new_path
+        if not moved:
+            return False
+
+        # Only the moved prims lose their bounds
+        for old_path, new_path in moved.items():
+            self._bounds.pop(old_path, None)
+            self._placeholders.pop(old_path, None)
+            self._bound_worker.cancel(old_path)
+            if old_path in self._instance_prototypes:
+                prototype_path = self._instance_prototypes.pop(old_path)
+                if new_path:
+                    self._instance_prototypes[new_path] = prototype_path
+        self._selection.rebind({path: new_path for path, new_path in moved.items() if path in self._selection})
+        self._instancer_bounds.clear()
+
+        self._paths = [path for path in (moved.get(path, path) for path in self._paths) if path]
+        self._current_path = self._paths[0] if self._paths else ""
+        self._prim = stage.GetPrimAtPath(parse_instance_path(self._current_path)[0]) if self._paths else None
+        self._watch_stage(stage, [path for path in moved.values() if path], moved)
+        return True
 
     def get_item(self, identifier):
         if identifier == "position":
@@ -70,7 +211,20 @@ class ObjectInfoModel(sc.AbstractManipulatorModel):
         if identifier == "name":
             return self._current_path
         if identifier == "material":
-            return self._material_name
+            return self.get_material(self._current_path)
+        if identifier == "paths":
+            return self._paths
+
+    def get_material(self, path: str) -> str:
+        """Returns the material name of the selected object"""
+        if path in self._instance_prototypes:
+            prototype_path = self._instance_prototypes[path]
+            material = self._prototype_selection.material(prototype_path) if prototype_path else None
+        elif path in self._selection:
+            material = self._selection.material(path)
+        else:
+            return ""
+        return material or "N/A"
 
     def get_as_floats(self, item):
         if item == self.position:
@@ -82,65 +236,318 @@ class ObjectInfoModel(sc.AbstractManipulatorModel):
             return item.value
         return []
 
-    def _on_stage_event(self, event):
-        """Called by stage_event_stream.  We only care about selection changes."""
-        if event.type == int(omni.usd.StageEventType.SELECTION_CHANGED):
-            self._on_kit_selection_changed()
-
-    def _on_kit_selection_changed(self):
-        """Called when a selection has changed."""
-        # selection change, reset it for now
+    def _reset_selection(self):
         self._current_path = ""
-        usd_context = self._get_context()
-        stage = usd_context.get_stage()
+        self._paths = []
+        self._selection = SelectionSnapshot(None, [])
+        self._instance_prototypes = {}
+        self._prototype_selection = SelectionSnapshot(None, [])
+        self._bounds = {}
+        self._placeholders = {}
+        # The bounds of the previous selection are not needed anymore
+        self._bound_worker.cancel_all()
+        self._prototype_bounds.clear_transforms()
+        self._instancer_bounds.clear()
+        self._dependents = {}
+        self._interest = PathSet()
+        self._watched = {}
+
+    def _get_interest(self, stage: Usd.Stage, path: str) -> List[str]:
+        """The prims the selected path depends on"""
+        instancer_path, index = parse_instance_path(path)
+        interest = [instancer_path]
+        if index is None:
+            prim = stage.GetPrimAtPath(instancer_path)
+            if prim and prim.IsInstance():
+                interest.append(get_prototype(prim).GetPath().pathString)
+        elif self._instance_prototypes.get(path):
+            interest.append(self._instance_prototypes[path])
+        return interest
+
+    def _watch_stage(self, stage: Usd.Stage, added: Iterable[str], removed: Iterable[str] = ()):
+        """
+        Listen to the changes of the selected prims and the prototypes of the
+        selected instances. Only the added and the removed paths are looked
+        at, the PathSet is changed in place.
+        """
+        for path in removed:
+            for interest in self._watched.pop(path, ()):
+                dependents = self._dependents[interest]
+                dependents.discard(path)
+                if not dependents:
+                    del self._dependents[interest]
+                    self._interest.discard(interest)
+        for path in added:
+            if path in self._watched:
+                continue
+            interests = [Sdf.Path(interest) for interest in self._get_interest(stage, path)]
+            self._watched[path] = interests
+            for interest in interests:
+                dependents = self._dependents.get(interest)
+                if dependents is None:
+                    self._dependents[interest] = {path}
+                    self._interest.add(interest)
+                else:
+                    dependents.add(path)
+
+        if not self._stage_listener:
+            self._stage_listener = self._notice_hub.subscribe_objects_changed(
+                self._notice_changed, self._interest, name="Object Info"
+            )
+        else:
+            self._stage_listener.set_paths(self._interest)
+
+    @instrumented()
+    def _on_kit_selection_changed(self, delta: SelectionDelta):
+        """
+        Called by the SelectionAdapter when a selection has changed. Only the
+        added and the removed prims are processed, the prims that stay
+        selected keep their bounds.
+        """
+        trace_args(path=delta.primary)
+        stage = self._get_context().get_stage()
         if not stage:
+            self._reset_selection()
             return
 
-        prim_paths = usd_context.get_selection().get_selected_prim_paths()
-        if not prim_paths:
-            # This turns off the manipulator when everything is deselected
+        added = delta.added
+        removed = delta.removed
+        if self._instance_prototypes or self._selection.stage is not stage:
+            # The instances or another stage, start from scratch
+            self._reset_selection()
+            self._selection = SelectionSnapshot(stage, [], query=self._query)
+            added = self._selection_adapter.paths
+            removed = ()
+
+        for path in removed:
+            self._bounds.pop(path, None)
+            self._placeholders.pop(path, None)
+            self._bound_worker.cancel(path)
+
+        supported = []
+        for prim_path in added:
+            prim = stage.GetPrimAtPath(prim_path)
+            if prim and prim.IsA(UsdGeom.Imageable):
+                supported.append(prim_path)
+
+        self._selection.update(supported, removed, delta.primary)
+        self._paths = list(self._selection.paths)
+        if not self._paths:
+            self._prim = None
+            self._current_path = ""
+            # Stop listening to the changes, we don't need to update anything
+            self._stage_listener = None
+            self._dependents = {}
+            self._interest = PathSet()
+            self._watched = {}
+            # This turns off the manipulator
             self._item_changed(self.position)
             return
 
-        prim = stage.GetPrimAtPath(prim_paths[0])
-        if not prim.IsA(UsdGeom.Imageable):
-            self._prim = None
-            # Revoke the Tf.Notice listener, we don't need to update anything
-            if self._stage_listener:
-                self._stage_listener.Revoke()
-                self._stage_listener = None
+        self._watch_stage(stage, supported, removed)
+        self._current_path = self._paths[0]
+        self._prim = self._selection.prim(self._current_path)
+
+    async def _process_selection_async(self, delta: SelectionDelta):
+        """
+        Called by the SelectionAdapter after `_on_kit_selection_changed`. The
+        labels show the materials of all the selected prims, so they are
+        resolved before the manipulator is rebuilt, a chunk per frame. It's
+        cancelled when the selection is changed again.
+        """
+        if not self._paths:
             return
+        await self._selection.prefetch_async([SelectionSnapshot.MATERIAL])
 
-        if not self._stage_listener:
-            # This handles camera movement
-            self._stage_listener = Tf.Notice.Register(Usd.Notice.ObjectsChanged, self._notice_changed, stage)
+        # Position is changed because new selected object has a different position
+        self._item_changed(self.position)
 
-        material, relationship = UsdShade.MaterialBindingAPI(prim).ComputeBoundMaterial()
-        if material:
-            self._material_name = str(material.GetPath())
-        else:
-            self._material_name = "N/A"
+    def select_instances(self, instancer_path: str, indices: Sequence[int]):
+        """
+        Show the info of the individual instances of a PointInstancer. The
+        Kit selection doesn't have the instance indices, so it's the way to
+        select them. The instances are named like `/World/Trees[12]`.
+        """
+        self._reset_selection()
+        stage = self._get_context().get_stage()
+        prim = stage.GetPrimAtPath(instancer_path) if stage else None
+        if not prim or not prim.IsA(UsdGeom.PointInstancer):
+            self._item_changed(self.position)
+            return
 
-        self._prim = prim
-        self._current_path = prim_paths[0]
+        instancer = UsdGeom.PointInstancer(prim)
+        proto_indices = instancer.GetProtoIndicesAttr().Get(Usd.TimeCode.Default()) or []
+        targets = instancer.GetPrototypesRel().GetTargets()
+
+        # The material is resolved once per prototype, not per instance, and
+        # only when it's shown
+        for index in indices:
+            if index < 0 or index >= len(proto_indices):
+                continue
+            proto_index = proto_indices[index]
+            path = format_instance_path(instancer_path, index)
+            self._paths.append(path)
+            self._instance_prototypes[path] = (
+                targets[proto_index].pathString if 0 <= proto_index < len(targets) else None
+            )
+        self._prototype_selection = SelectionSnapshot(
+            stage, [target.pathString for target in targets], query=self._query
+        )
+
+        if self._paths:
+            self._watch_stage(stage, self._paths)
+            self._prim = prim
+            self._current_path = self._paths[0]
 
-        # Position is changed because new selected object has a different position
         self._item_changed(self.position)
 
     def _get_position(self):
         """Returns position of currently selected object"""
+        return self.get_position(self._current_path)
+
+    def get_position(self, path: str):
+        """Returns position of the selected object"""
         stage = self._get_context().get_stage()
-        if not stage or not self._current_path:
+        if not stage or not path:
             return [0, 0, 0]
 
-        # Get position directly from USD
-        prim = stage.GetPrimAtPath(self._current_path)
-        box_cache = UsdGeom.BBoxCache(Usd.TimeCode.Default(), includedPurposes=[UsdGeom.Tokens.default_])
-        bound = box_cache.ComputeWorldBound(prim)
-        range = bound.ComputeAlignedBox()
+        instancer_path, index = parse_instance_path(path)
+        if index is not None:
+            return self.get_positions([path])[path]
+
+        range = self._get_world_range(stage, path)
         bboxMin = range.GetMin()
         bboxMax = range.GetMax()
 
         # Find the top center of the bounding box and add a small offset upward.
         position = [(bboxMin[0] + bboxMax[0]) * 0.5, bboxMax[1] + TOP_OFFSET, (bboxMin[2] + bboxMax[2]) * 0.5]
         return position
+
+    def get_positions(self, paths: Sequence[str]) -> Dict[str, List[float]]:
+        """
+        Returns positions of the selected objects. The bounds of all the
+        instances are computed at once, one time per prototype.
+        """
+        stage = self._get_context().get_stage()
+        if not stage:
+            return {path: [0, 0, 0] for path in paths}
+
+        positions = {}
+        instances = []
+        # Instancer path -> the indices of the selected instances
+        instancers: Dict[str, List[int]] = {}
+        for path in paths:
+            instancer_path, index = parse_instance_path(path)
+            if index is not None:
+                if path not in self._bounds:
+                    instancers.setdefault(instancer_path, []).append(index)
+                    continue
+                range = self._bounds[path]
+                positions[path] = self._get_top([range.GetMin(), range.GetMax()])
+                continue
+
+            prim = self._selection.prim(path)
+            if prim and prim.IsInstance() and path not in self._bounds:
+                instances.append(prim)
+            else:
+                positions[path] = self.get_position(path)
+
+        if instances:
+            ranges = self._prototype_bounds.compute_world_ranges(instances)
+            # Top center of the bounding boxes
+            tops = (ranges[:, 0] + ranges[:, 1]) * 0.5
+            tops[:, 1] = ranges[:, 1, 1] + TOP_OFFSET
+            for prim, range, top in zip(instances, ranges.tolist(), tops.tolist()):
+                path = prim.GetPath().pathString
+                self._bounds[path] = Gf.Range3d(Gf.Vec3d(*range[0]), Gf.Vec3d(*range[1]))
+                positions[path] = top
+
+        for instancer_path, indices in instancers.items():
+            prim = stage.GetPrimAtPath(instancer_path)
+            if not prim or not prim.IsA(UsdGeom.PointInstancer):
+                for index in indices:
+                    positions[format_instance_path(instancer_path, index)] = [0, 0, 0]
+                continue
+            # The indices that are out of range are dropped
+            instancer = UsdGeom.PointInstancer(prim)
+            count = self._instancer_bounds.compute_instance_count(instancer)
+            valid = []
+            for index in indices:
+                if 0 <= index < count:
+                    valid.append(index)
+                else:
+                    positions[format_instance_path(instancer_path, index)] = [0, 0, 0]
+
+            # All the instances of the instancer in one NumPy pass
+            ranges = self._instancer_bounds.compute_world_ranges(instancer, valid)
+            if len(ranges) != len(valid):
+                # No prototypes or the arrays don't match, the instances are
+                # shown at the pivot of the instancer until it's fixed
+                pivot = instancer.ComputeLocalToWorldTransform(Usd.TimeCode.Default()).ExtractTranslation()
+                for index in valid:
+                    positions[format_instance_path(instancer_path, index)] = [pivot[0], pivot[1], pivot[2]]
+                continue
+            tops = (ranges[:, 0] + ranges[:, 1]) * 0.5
+            tops[:, 1] = ranges[:, 1, 1] + TOP_OFFSET
+            for index, range, top in zip(valid, ranges.tolist(), tops.tolist()):
+                path = format_instance_path(instancer_path, index)
+                self._bounds[path] = Gf.Range3d(Gf.Vec3d(*range[0]), Gf.Vec3d(*range[1]))
+                positions[path] = top
+
+        # Keep the order of the selection
+        return {path: positions.get(path, [0, 0, 0]) for path in paths}
+
+    @staticmethod
+    def _get_top(range) -> List[float]:
+        """Top center of the bounding box with a small offset upward"""
+        bboxMin, bboxMax = range
+        return [(bboxMin[0] + bboxMax[0]) * 0.5, bboxMax[1] + TOP_OFFSET, (bboxMin[2] + bboxMax[2]) * 0.5]
+
+    def _get_world_range(self, stage: Usd.Stage, path: str) -> Gf.Range3d:
+        """
+        Returns the world bound of the object. When the bound is not
+        authored, the bound of a big subtree is computed in the background,
+        and until it's ready we return the pivot of the object.
+        """
+        range = self._bounds.get(path)
+        if range is not None:
+            return range
+
+        time = Usd.TimeCode.Default()
+        prim = self._selection.prim(path)
+
+        if prim.IsInstance():
+            # The bound of the prototype is computed only once
+            range = self._prototype_bounds.compute_world_range(prim)
+            self._bounds[path] = range
+            return range
+
+        # The authored extentsHint or extent is cheap and doesn't need the
+        # payloads to be loaded
+        range = compute_authored_world_range(prim, time)
+        if range is None and prim.IsA(UsdGeom.Gprim):
+            # A single gprim is cheap, its bound is its extent
+            box_cache = UsdGeom.BBoxCache(time, includedPurposes=[UsdGeom.Tokens.default_])
+            range = box_cache.ComputeWorldBound(prim).ComputeAlignedRange()
+        if range is not None:
+            self._bounds[path] = range
+            return range
+
+        if not self._bound_worker.is_pending(path):
+            self._bound_worker.request(stage, path, time, self._on_bound_computed)
+
+        range = self._placeholders.get(path)
+        if range is None:
+            pivot = UsdGeom.Imageable(prim).ComputeLocalToWorldTransform(time).ExtractTranslation()
+            range = Gf.Range3d(pivot, pivot)
+            self._placeholders[path] = range
+        return range
+
+    def _on_bound_computed(self, path: str, range: Gf.Range3d):
+        """Called by BoundWorker. Snap the manipulator to the exact bound."""
+        if path not in self._paths:
+            # Not selected anymore
+            return
+        self._bounds[path] = range
+        self._placeholders.pop(path, None)
+        self._item_changed(self.position)
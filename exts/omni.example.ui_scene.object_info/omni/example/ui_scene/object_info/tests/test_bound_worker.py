@@ -0,0 +1,74 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+__all__ = ["TestBoundWorker"]
+
+from omni.example.ui_scene.object_info.bound_worker import BoundWorker
+from pxr import Gf
+from pxr import Usd
+from pxr import UsdGeom
+import omni.kit.app
+import omni.kit.test
+
+
+class TestBoundWorker(omni.kit.test.AsyncTestCase):
+    def _create_stage(self, count):
+        stage = Usd.Stage.CreateInMemory()
+        UsdGeom.Xform.Define(stage, "/Root")
+        for i in range(count):
+            cube = UsdGeom.Cube.Define(stage, f"/Root/Group/Cube_{i}")
+            cube.AddTranslateOp().Set(Gf.Vec3d(i * 10, 0, 0))
+        return stage
+
+    async def _wait(self, worker, path, frames=100):
+        for _ in range(frames):
+            if not worker.is_pending(path):
+                return
+            await omni.kit.app.get_app().next_update_async()
+
+    async def test_bound(self):
+        """The bound is computed over several frames and is the same as BBoxCache computes"""
+        stage = self._create_stage(20)
+        results = {}
+        # A single prim per frame
+        worker = BoundWorker(budget=0.0)
+        worker.request(stage, "/Root", Usd.TimeCode.Default(), results.__setitem__)
+        await omni.kit.app.get_app().next_update_async()
+        self.assertTrue(worker.is_pending("/Root"))
+        await self._wait(worker, "/Root")
+
+        box_cache = UsdGeom.BBoxCache(Usd.TimeCode.Default(), includedPurposes=[UsdGeom.Tokens.default_])
+        expected = box_cache.ComputeWorldBound(stage.GetPrimAtPath("/Root")).ComputeAlignedRange()
+        self.assertEqual(results["/Root"], expected)
+        worker.destroy()
+
+    async def test_cancel(self):
+        stage = self._create_stage(20)
+        results = {}
+        worker = BoundWorker(budget=0.0)
+        worker.request(stage, "/Root", Usd.TimeCode.Default(), results.__setitem__)
+        await omni.kit.app.get_app().next_update_async()
+        worker.cancel("/Root")
+        for _ in range(30):
+            await omni.kit.app.get_app().next_update_async()
+        self.assertEqual(results, {})
+        worker.destroy()
+
+    async def test_edit(self):
+        """The stage is edited while the job runs"""
+        stage = self._create_stage(20)
+        results = {}
+        worker = BoundWorker(budget=0.0)
+        worker.request(stage, "/Root", Usd.TimeCode.Default(), results.__setitem__)
+        await omni.kit.app.get_app().next_update_async()
+        stage.RemovePrim("/Root/Group/Cube_19")
+        await self._wait(worker, "/Root")
+
+        # The removed cube is skipped
+        self.assertEqual(results["/Root"].GetMax()[0], 181)
+        worker.destroy()
@@ -0,0 +1,55 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+__all__ = ["TestLabelLayout"]
+
+from omni.example.ui_scene.object_info.label_layout import LabelLayout
+import omni.kit.test
+
+LABEL_SIZE = (120, 36)
+
+
+class TestLabelLayout(omni.kit.test.AsyncTestCase):
+    def _create_layout(self):
+        return LabelLayout(segment_length=20, vertical_mult=1.5, text_offset=5)
+
+    async def test_single_label_default(self):
+        """A label with nothing around keeps the original position"""
+        layout = self._create_layout()
+        self.assertTrue(layout.update({"/A": (100, 100)}, {"/A": LABEL_SIZE}))
+        self.assertEqual(layout.get_placement("/A"), layout.default_placement)
+
+    async def test_overlapping_labels(self):
+        """Labels of the close anchors don't take the same place"""
+        layout = self._create_layout()
+        anchors = {"/A": (100, 100), "/B": (104, 102), "/C": (108, 98)}
+        layout.update(anchors, {path: LABEL_SIZE for path in anchors})
+
+        placements = {layout.get_placement(path) for path in anchors}
+        self.assertEqual(len(placements), 3)
+        self.assertEqual(layout.get_placement("/A"), layout.default_placement)
+
+    async def test_incremental(self):
+        """Small movements of the anchors don't lay out the labels again"""
+        layout = self._create_layout()
+        anchors = {"/A": (100, 100), "/B": (104, 102)}
+        sizes = {path: LABEL_SIZE for path in anchors}
+        layout.update(anchors, sizes)
+        placement = layout.get_placement("/B")
+
+        # Below the threshold
+        self.assertFalse(layout.update({"/A": (101, 100), "/B": (105, 103)}, sizes))
+        self.assertEqual(layout.get_placement("/B"), placement)
+
+        # /B is far from /A now, so it goes back to the default place
+        self.assertTrue(layout.update({"/A": (100, 100), "/B": (600, 400)}, sizes))
+        self.assertEqual(layout.get_placement("/B"), layout.default_placement)
+
+        # Removing the labels
+        self.assertFalse(layout.update({}, {}))
+        self.assertEqual(layout.get_placement("/A"), layout.default_placement)
@@ -0,0 +1,50 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+__all__ = ["TestObjectInfoModel"]
+
+from omni.example.ui_scene.object_info.object_info_model import ObjectInfoModel
+from pxr import Gf
+from pxr import UsdGeom
+import omni.kit.test
+import omni.usd
+
+
+class TestObjectInfoModel(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        await omni.usd.get_context().new_stage_async()
+        self._stage = omni.usd.get_context().get_stage()
+        self._model = ObjectInfoModel()
+
+    async def tearDown(self):
+        self._model.destroy()
+
+    def _define_instancer(self, path, proto_indices, positions, prototypes=True):
+        instancer = UsdGeom.PointInstancer.Define(self._stage, path)
+        instancer.AddTranslateOp().Set(Gf.Vec3d(5, 0, 0))
+        if prototypes:
+            cube = UsdGeom.Cube.Define(self._stage, f"{path}/Prototypes/Cube")
+            instancer.CreatePrototypesRel().SetTargets([cube.GetPath()])
+        instancer.CreateProtoIndicesAttr(proto_indices)
+        instancer.CreatePositionsAttr([Gf.Vec3f(*position) for position in positions])
+        return instancer
+
+    async def test_malformed_instancer(self):
+        """The instances without a bound are at the pivot of the instancer"""
+        # Two instances and a single position
+        self._define_instancer("/Mismatched", [0, 0], [(1, 0, 0)])
+        # An instance without prototypes
+        self._define_instancer("/Empty", [0], [(1, 0, 0)], prototypes=False)
+
+        for instancer_path in ("/Mismatched", "/Empty"):
+            self._model.select_instances(instancer_path, [0])
+            paths = self._model.get_item("paths")
+            self.assertEqual(len(paths), 1)
+            positions = self._model.get_positions(paths)
+            self.assertEqual(positions[paths[0]], [5, 0, 0])
+            self.assertEqual(self._model.get_position(paths[0]), [5, 0, 0])
@@ -16,10 +16,17 @@ from .object_info_model import ObjectInfoModel
 
 
 class ViewportScene():
-    """The Object Info Manipulator, placed into a Viewport"""
+    """
+    The Object Info Manipulator, placed into a Viewport. When the model is
+    given, it's shared with the other viewports and it's not destroyed with
+    the scene.
+    """
 
-    def __init__(self, viewport_window: ui.Window, ext_id: str) -> None:
+    def __init__(self, viewport_window: ui.Window, ext_id: str, model: ObjectInfoModel = None) -> None:
         self._scene_view = None
+        self._manipulator = None
+        self._model = None
+        self._owns_model = model is None
         self._viewport_window = viewport_window
 
         # Create a unique frame for our SceneView
@@ -28,7 +35,8 @@ class ViewportScene():
             self._scene_view = sc.SceneView()
             # Add the manipulator into the SceneView's scene
             with self._scene_view.scene:
-                ObjectInfoManipulator(model=ObjectInfoModel())
+                self._model = model or ObjectInfoModel()
+                self._manipulator = ObjectInfoManipulator(model=self._model)
 
             # Register the SceneView with the Viewport to get projection and view updates
             self._viewport_window.viewport_api.add_scene_view(self._scene_view)
@@ -37,6 +45,10 @@ class ViewportScene():
         self.destroy()
 
     def destroy(self):
+        if self._manipulator:
+            self._manipulator.destroy()
+        if self._model and self._owns_model:
+            self._model.destroy()
         if self._scene_view:
             # Empty the SceneView of any elements it may have
             self._scene_view.scene.clear()
@@ -46,3 +58,5 @@ class ViewportScene():
         # Remove our references to these objects
         self._viewport_window = None
         self._scene_view = None
+        self._manipulator = None
+        self._model = None
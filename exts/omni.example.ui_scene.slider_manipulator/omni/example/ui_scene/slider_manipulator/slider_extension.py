@@ -8,9 +8,7 @@
 #
 __all__ = ["SliderExtension"]
 
-from .slider_registry import SliderRegistry
-from omni.kit.manipulator.viewport import ManipulatorFactory
-from omni.kit.viewport.registry import RegisterScene
+from omni.example.ui_scene.common import SelectionTrigger
 import omni.ext
 
 
@@ -18,14 +16,35 @@ class SliderExtension(omni.ext.IExt):
     """The entry point to the extension"""
 
     def on_startup(self, ext_id):
+        self._slider_registry = None
+        self._slider_factory = None
+        # The slider is shown for the selected prim, it's registered on the
+        # first selection
+        self._trigger = SelectionTrigger(self._register, name="Slider Startup")
+
+    def _register(self):
+        # The viewports, USD and the manipulator are only imported when they
+        # are needed
+        from .slider_registry import SliderRegistry
+        from omni.kit.manipulator.viewport import ManipulatorFactory
+        from omni.kit.viewport.registry import RegisterScene
+
         # Viewport Next: omni.kit.viewport.window
         self._slider_registry = RegisterScene(SliderRegistry, "omni.example.ui_scene.slider_manipulator")
         # Viewport Legacy: omni.kit.window.viewport
         self._slider_factory = ManipulatorFactory.create_manipulator(SliderRegistry)
 
     def on_shutdown(self):
-        ManipulatorFactory.destroy_manipulator(self._slider_factory)
-        self._slider_factory = None
+        if self._trigger:
+            self._trigger.destroy()
+            self._trigger = None
 
-        self._slider_registry.destroy()
-        self._slider_registry = None
+        if self._slider_factory:
+            from omni.kit.manipulator.viewport import ManipulatorFactory
+
+            ManipulatorFactory.destroy_manipulator(self._slider_factory)
+            self._slider_factory = None
+
+        if self._slider_registry:
+            self._slider_registry.destroy()
+            self._slider_registry = None
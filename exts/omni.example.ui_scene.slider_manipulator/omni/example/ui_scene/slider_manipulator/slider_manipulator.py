@@ -8,10 +8,25 @@
 ##
 __all__ = ["SliderManipulator"]
 
+from omni.example.ui_scene.common import GestureLatency
+from omni.example.ui_scene.common import begin_gesture_event
+from omni.example.ui_scene.common import gesture_stage
+from omni.example.ui_scene.common import instrumented
+from omni.example.ui_scene.common import mark_gesture_stage
+from omni.example.ui_scene.common import record_gesture
 from omni.ui import scene as sc
 from omni.ui import color as cl
 import omni.ui as ui
 
+# The name of the drag in the gesture latency and the recordings
+GESTURE_NAME = "slider_manipulator.arc"
+
+_STATE_NAMES = {
+    sc.GestureState.BEGAN: "began",
+    sc.GestureState.CHANGED: "changed",
+    sc.GestureState.ENDED: "ended",
+}
+
 
 class SliderManipulator(sc.Manipulator):
     class SliderDragGesturePayload(sc.AbstractGesture.GesturePayload):
@@ -80,25 +95,38 @@ class SliderManipulator(sc.Manipulator):
             return f"<_ArcGesture at {hex(id(self))}>"
 
         def process(self):
-            if self.state in [sc.GestureState.BEGAN, sc.GestureState.CHANGED, sc.GestureState.ENDED]:
-                # Form new gesture_payload object
-                new_gesture_payload = SliderManipulator.SliderDragGesturePayload(self.gesture_payload)
-                # Save the new slider position in the gesture_payload object
-                object_ray_point = self._manipulator.transform_space(
-                    sc.Space.WORLD, sc.Space.OBJECT, self.gesture_payload.ray_closest_point
-                )
-                center = self._manipulator.model.get_as_floats(self._manipulator.model.get_item("position"))
-                slider_value = (object_ray_point[0] - center[0]) / self._manipulator.width + 0.5
-                _min = self._manipulator.model.get_as_floats(self._manipulator.model.get_item("min"))[0]
-                _max = self._manipulator.model.get_as_floats(self._manipulator.model.get_item("max"))[0]
-                new_gesture_payload.slider_value = _min + slider_value * (_max - _min)
-                # Call the public gesture
-                self._manipulator._process_gesture(
-                    SliderManipulator.SliderChangedGesture, self.state, new_gesture_payload
+            if self.state in _STATE_NAMES:
+                payload = self.gesture_payload
+                record_gesture(
+                    GESTURE_NAME,
+                    _STATE_NAMES[self.state],
+                    item_closest_point=list(payload.item_closest_point),
+                    ray_closest_point=list(payload.ray_closest_point),
+                    ray_distance=payload.ray_distance,
                 )
+                self.process_payload(self.state, payload)
             # Base process of the gesture
             super().process()
 
+        def process_payload(self, state, payload):
+            """Sets the slider value from the payload. Called by the gesture or by the replay."""
+            if state == sc.GestureState.CHANGED:
+                # The input event, the following stages up to the frame get its ID
+                begin_gesture_event(GESTURE_NAME)
+            # Form new gesture_payload object
+            new_gesture_payload = SliderManipulator.SliderDragGesturePayload(payload)
+            # Save the new slider position in the gesture_payload object
+            object_ray_point = self._manipulator.transform_space(
+                sc.Space.WORLD, sc.Space.OBJECT, payload.ray_closest_point
+            )
+            center = self._manipulator.model.get_as_floats(self._manipulator.model.get_item("position"))
+            slider_value = (object_ray_point[0] - center[0]) / self._manipulator.width + 0.5
+            _min = self._manipulator.model.get_as_floats(self._manipulator.model.get_item("min"))[0]
+            _max = self._manipulator.model.get_as_floats(self._manipulator.model.get_item("max"))[0]
+            new_gesture_payload.slider_value = _min + slider_value * (_max - _min)
+            # Call the public gesture
+            self._manipulator._process_gesture(SliderManipulator.SliderChangedGesture, state, new_gesture_payload)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
@@ -147,6 +175,8 @@ class SliderManipulator(sc.Manipulator):
         # Regenerate the mesh
         self.invalidate()
 
+    @instrumented()
+    @gesture_stage(GestureLatency.REDRAW)
     def on_build(self):
         """Called when the model is chenged and rebuilds the whole slider"""
         if not self.model:
@@ -195,6 +225,23 @@ class SliderManipulator(sc.Manipulator):
                             with sc.Transform(transform=sc.Matrix44.get_translation_matrix(0, 5, 0)):
                                 sc.Label(f"{value:.1f}", alignment=ui.Alignment.CENTER_BOTTOM)
 
+    @instrumented()
     def on_model_updated(self, item):
+        mark_gesture_stage(GestureLatency.MODEL_UPDATED)
         # Regenerate the mesh
         self.invalidate()
+
+    def replay_gesture(self, event):
+        """
+        Replays the event of a GestureRecording as if the arc is dragged.
+        Returns False when there is no model or the state is unknown.
+        """
+        state = getattr(sc.GestureState, event.state.upper(), None)
+        if not self.model or state is None:
+            return False
+        values = event.values
+        payload = sc.AbstractGesture.GesturePayload(
+            values["item_closest_point"], values["ray_closest_point"], values["ray_distance"]
+        )
+        self._arc_gesture.process_payload(state, payload)
+        return True
@@ -8,8 +8,25 @@
 #
 __all__ = ["SliderModel"]
 
+from omni.example.ui_scene.common import ChangeSet
+from omni.example.ui_scene.common import GestureLatency
+from omni.example.ui_scene.common import PointInstancerBounds
+from omni.example.ui_scene.common import PrimHandle
+from omni.example.ui_scene.common import SelectionDelta
+from omni.example.ui_scene.common import PrototypeBoundCache
+from omni.example.ui_scene.common import get_notice_hub
+from omni.example.ui_scene.common import get_scene_query
+from omni.example.ui_scene.common import get_selection_adapter
+from omni.example.ui_scene.common import instrumented
+from omni.example.ui_scene.common import trace_args
+from omni.example.ui_scene.common import trace_item
+from omni.example.ui_scene.common import is_resynced
+from omni.example.ui_scene.common import mark_gesture_stage
+from omni.example.ui_scene.common import resolve_resynced_path
 from omni.ui import scene as sc
 from pxr import Gf
+from pxr import Sdf
+from pxr import Vt
 from pxr import UsdGeom
 from pxr import Usd
 import omni.usd
@@ -51,17 +68,37 @@ class SliderModel(sc.AbstractManipulatorModel):
         self._offset = 10
         # Current selection
         self._current_path = ""
+        # The primary path of the last selection event, it's empty after a
+        # deselect while the slider still shows the previous prim
+        self._primary = ""
+        # The prim of the current path, it's looked up again only when it's
+        # recomposed
+        self._prim_handle = PrimHandle(None, "")
+        # The index of the selected instance when a PointInstancer is selected
+        self._instance_index = None
+        # The instances of the same prototype share the bound
+        self._prototype_bounds = PrototypeBoundCache()
+        self._instancer_bounds = PointInstancerBounds()
+        # The bounds are shared with the other samples and viewports
+        self._query = get_scene_query()
 
-        usd_context = omni.usd.get_context()
         self._stage: Usd.Stage = None
+        self._stage_listener = None
 
-        # Track selection
-        self._selection = usd_context.get_selection()
-        self._events = usd_context.get_stage_event_stream()
-        self._stage_event_sub = self._events.create_subscription_to_pop(
-            self._on_stage_event, name="Slider Selection Update"
+        # Track selection. The adapter and the hub are shared by all the samples.
+        self._notice_hub = get_notice_hub()
+        self._selection_sub = get_selection_adapter().subscribe(
+            self._on_kit_selection_changed, name="Slider Selection Update", current=True
         )
 
+    def destroy(self):
+        """Release the subscriptions to the shared adapter and hub"""
+        self._selection_sub = None
+        self._stage_listener = None
+        self._stage = None
+        self._prim_handle = PrimHandle(None, "")
+        self._current_path = ""
+
     def get_item(self, identifier):
         if identifier == "value":
             return self.scale
@@ -81,18 +118,26 @@ class SliderModel(sc.AbstractManipulatorModel):
             return item.value
         return []
 
+    @instrumented()
     def set_floats(self, item, value):
+        trace_item(self, item, path=self._current_path)
         if not self._current_path:
             return
 
         if not value or not item or item.value == value:
             return
 
+        mark_gesture_stage(GestureLatency.WRITE)
         if item == self.scale:
             # Set the scale when setting the value.
             value[0] = min(max(value[0], self.min.value[0]), self.max.value[0])
+            if self._instance_index is not None:
+                self._set_instance_scale(value[0])
+                item.value = value
+                self._item_changed(item)
+                return
             (old_scale, old_rotation_euler, old_rotation_order, old_translation) = omni.usd.get_local_transform_SRT(
-                self._stage.GetPrimAtPath(self._current_path)
+                self._prim_handle.get()
             )
             omni.kit.commands.execute(
                 "TransformPrimSRTCommand",
@@ -113,21 +158,66 @@ class SliderModel(sc.AbstractManipulatorModel):
             self._stage: Usd.Stage = usd_context.get_stage()
         return self._stage
 
-    def _on_stage_event(self, event):
-        """Called by stage_event_stream"""
-        if event.type == int(omni.usd.StageEventType.SELECTION_CHANGED):
-            self._on_kit_selection_changed()
+    @property
+    def prim_handle(self) -> PrimHandle:
+        """The handle of the selected prim, it has the counters of the lookups"""
+        return self._prim_handle
+
+    def _select_path(self, path: str):
+        self._current_path = path
+        self._prim_handle = PrimHandle(self._get_stage(), path)
+        # Only the resyncs are needed to drop the prim
+        if not self._stage_listener:
+            self._stage_listener = self._notice_hub.subscribe_objects_changed(
+                self._notice_changed, [path], name="Slider"
+            )
+        else:
+            self._stage_listener.set_paths([path])
+
+    @instrumented()
+    def _notice_changed(self, changes: ChangeSet):
+        """Called by the NoticeHub with the changes of the selected prim and its ancestors"""
+        trace_args(path=self._current_path, resynced=len(changes.resynced), changed=len(changes.info_only))
+        resynced = list(changes.resynced)
+        if not is_resynced(self._current_path, resynced):
+            return
+
+        # Follow the prim when it's renamed or reparented
+        new_path = resolve_resynced_path(self._get_stage(), self._current_path, resynced)
+        if not new_path:
+            # The prim is removed
+            self._current_path = ""
+            self._instance_index = None
+            self._prim_handle = PrimHandle(None, "")
+        elif new_path != self._current_path:
+            self._current_path = new_path
+            self._prim_handle.rebind(new_path)
+            self._stage_listener.set_paths([new_path])
+        else:
+            self._prim_handle.invalidate()
+        self._item_changed(self.position)
 
-    def _on_kit_selection_changed(self):
-        prim_paths = self._selection.get_selected_prim_paths()
-        if not prim_paths:
+    @instrumented()
+    def _on_kit_selection_changed(self, delta: SelectionDelta):
+        """Called by the SelectionAdapter, only the first selected prim is used"""
+        trace_args(path=delta.primary)
+        primary = self._primary
+        self._primary = delta.primary
+        if not delta.primary:
+            # The slider stays on the prim, the next selection reads it again
+            return
+        if delta.primary == primary and delta.primary == self._current_path and self._instance_index is None:
+            # Other prims are added or removed
             return
 
-        prim = self._get_stage().GetPrimAtPath(prim_paths[0])
+        prim = self._get_stage().GetPrimAtPath(delta.primary)
         if not prim.IsA(UsdGeom.Imageable):
             return
 
-        self._current_path = prim_paths[0]
+        self._select_path(delta.primary)
+        self._instance_index = None
+        # We don't track the prototypes, so the new selection starts from scratch
+        self._prototype_bounds.clear()
 
         (old_scale, old_rotation_euler, old_rotation_order, old_translation) = omni.usd.get_local_transform_SRT(prim)
 
@@ -141,16 +231,79 @@ class SliderModel(sc.AbstractManipulatorModel):
         # Position is changed
         self._item_changed(self.position)
 
+    def select_instance(self, instancer_path: str, index: int):
+        """
+        Put the slider to a single instance of a PointInstancer. The Kit
+        selection doesn't have the instance indices, so it's the way to select
+        them. The slider changes `scales[index]` of the instancer.
+        """
+        prim = self._get_stage().GetPrimAtPath(instancer_path)
+        if not prim or not prim.IsA(UsdGeom.PointInstancer):
+            return
+
+        instancer = UsdGeom.PointInstancer(prim)
+        if index < 0 or index >= self._instancer_bounds.compute_instance_count(instancer):
+            return
+
+        self._select_path(instancer_path)
+        self._instance_index = index
+        self._instancer_bounds.clear()
+
+        scales = instancer.GetScalesAttr().Get(Usd.TimeCode.Default())
+        scale = scales[index][0] if scales and index < len(scales) else 1.0
+        # The slider shows the scale of the instance, nothing is written to
+        # USD until it's dragged
+        for item, value in ((self.min, scale * 0.1), (self.max, scale * 2.0), (self.scale, scale)):
+            item.value = [value]
+            self._item_changed(item)
+
+        # Position is changed
+        self._item_changed(self.position)
+
+    def _set_instance_scale(self, scale: float):
+        instancer = UsdGeom.PointInstancer(self._prim_handle.get())
+        count = self._instancer_bounds.compute_instance_count(instancer)
+        attr = instancer.GetScalesAttr()
+        old_scales = attr.Get(Usd.TimeCode.Default())
+        if old_scales and len(old_scales) == count:
+            new_scales = Vt.Vec3fArray(old_scales)
+        else:
+            # The instancer without scales, all the instances are 1.0
+            new_scales = Vt.Vec3fArray(count, Gf.Vec3f(1.0))
+        new_scales[self._instance_index] = Gf.Vec3f(scale)
+
+        omni.kit.commands.execute(
+            "ChangePropertyCommand",
+            prop_path=attr.GetPath(),
+            value=new_scales,
+            prev=old_scales,
+            type_to_create_if_not_exist=Sdf.ValueTypeNames.Float3Array,
+        )
+
     def _get_position(self):
         """Returns position of currently selected object"""
         if not self._current_path:
             return [0, 1e38, 0]
 
-        # Get position directly from USD
-        prim = self._get_stage().GetPrimAtPath(self._current_path)
-        box_cache = UsdGeom.BBoxCache(Usd.TimeCode.Default(), includedPurposes=[UsdGeom.Tokens.default_])
-        bound = box_cache.ComputeWorldBound(prim)
-        range = bound.ComputeAlignedBox()
+        if self._instance_index is not None:
+            # Only the selected instance, the prototype bounds are cached
+            prim = self._prim_handle.get()
+            ranges = self._instancer_bounds.compute_world_ranges(UsdGeom.PointInstancer(prim), [self._instance_index])
+            if not len(ranges):
+                return [0, 1e38, 0]
+            bboxMin, bboxMax = ranges[0].tolist()
+            return [(bboxMin[0] + bboxMax[0]) * 0.5, bboxMax[1] + self._offset, (bboxMin[2] + bboxMax[2]) * 0.5]
+
+        # Get position directly from USD. The authored extent is used when
+        # it's available, so it works with unloaded payloads.
+        prim = self._prim_handle.get()
+        if prim.IsInstance():
+            # Only the transform of the instance is computed, the bound of its
+            # prototype is reused
+            self._prototype_bounds.clear_transforms()
+            range = self._prototype_bounds.compute_world_range(prim)
+        else:
+            range = self._query.world_bound(self._current_path)
         bboxMin = range.GetMin()
         bboxMax = range.GetMax()
 
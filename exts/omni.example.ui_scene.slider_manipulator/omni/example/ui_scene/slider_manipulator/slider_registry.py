@@ -10,6 +10,7 @@ __all__ = ["SliderRegistry"]
 
 from .slider_manipulator import SliderManipulator
 from .slider_model import SliderModel
+from omni.example.ui_scene.common import instrumented
 from typing import Any
 from typing import Dict
 from typing import Optional
@@ -57,6 +58,7 @@ class SliderChangedGesture(SliderManipulator.SliderChangedGesture):
         # not disabled automatically, and we need to disable it with the code.
         self.__disable_selection = ViewportLegacyDisableSelection()
 
+    @instrumented()
     def on_changed(self):
         """Called when the user moved the slider"""
         if not hasattr(self.gesture_payload, "slider_value"):
@@ -79,12 +81,16 @@ class SliderRegistry:
     """
 
     def __init__(self, description: Optional[Dict[str, Any]] = None):
-        self.__slider_manipulator = SliderManipulator(model=SliderModel(), gesture=SliderChangedGesture())
+        self.__slider_model = SliderModel()
+        self.__slider_manipulator = SliderManipulator(model=self.__slider_model, gesture=SliderChangedGesture())
 
     def destroy(self):
         if self.__slider_manipulator:
             self.__slider_manipulator.destroy()
             self.__slider_manipulator = None
+        if self.__slider_model:
+            self.__slider_model.destroy()
+            self.__slider_model = None
 
     # PrimTransformManipulator & TransformManipulator don't have their own visibility
     @property
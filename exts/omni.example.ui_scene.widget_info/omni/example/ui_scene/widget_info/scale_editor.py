@@ -0,0 +1,163 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+__all__ = ["ScaleEditor"]
+
+from typing import Dict, Sequence
+
+from omni.example.ui_scene.common import GestureLatency
+from omni.example.ui_scene.common import get_correlation_id
+from omni.example.ui_scene.common import instrumented
+from omni.example.ui_scene.common import mark_gesture_stage
+from omni.example.ui_scene.common import resume_gesture_event
+from omni.example.ui_scene.common import trace_args
+from pxr import Gf
+import omni.kit.app
+import omni.kit.commands
+import omni.kit.undo
+import omni.usd
+
+
+class ScaleEditor:
+    """
+    Applies the uniform scale from a slider to the prims.
+
+    While the slider is dragged, the latest value is written to USD at most
+    once per frame, and it's not recorded in the undo. When the slider is
+    released, the change is committed as one undoable group that goes from the
+    scale before the drag to the final one.
+
+    The value is the scale of the reference prim. When several prims are
+    edited, they are all scaled by the same factor.
+    """
+
+    def __init__(self, usd_context_name: str = ""):
+        self._usd_context_name = usd_context_name
+        # Path -> the local (scale, rotation, rotation order, translation) before the drag
+        self._originals: Dict[str, tuple] = {}
+        self._reference = 1.0
+        # The value that is not written yet and the last written one
+        self._pending = None
+        self._applied = None
+        # The gesture event of the pending value, it's written on the next frame
+        self._correlation_id = None
+        self._update_sub = None
+
+    def destroy(self):
+        self.cancel()
+
+    @property
+    def is_editing(self) -> bool:
+        return bool(self._originals)
+
+    def begin(self, paths: Sequence[str]):
+        """Remember the transforms of the prims, the first prim is the reference"""
+        if self.is_editing:
+            self.end()
+
+        stage = omni.usd.get_context(self._usd_context_name).get_stage()
+        if not stage:
+            return
+
+        for path in paths:
+            prim = stage.GetPrimAtPath(path)
+            if prim:
+                self._originals[path] = omni.usd.get_local_transform_SRT(prim)
+        if not self._originals:
+            return
+
+        self._reference = next(iter(self._originals.values()))[0][0]
+        # The preview is written from the update loop, so many slider events
+        # in the same frame make a single write
+        self._update_sub = (
+            omni.kit.app.get_app()
+            .get_update_event_stream()
+            .create_subscription_to_pop(self._on_update, name="Widget Info Scale Preview")
+        )
+
+    def set_value(self, value: float):
+        """Called on each slider change. Nothing is written until the next frame."""
+        if self.is_editing:
+            self._pending = value
+            self._correlation_id = get_correlation_id()
+
+    @instrumented()
+    def end(self):
+        """Commit the last value as one undoable change"""
+        self._update_sub = None
+        value = self._pending if self._pending is not None else self._applied
+        originals = self._originals
+        self._reset()
+        if value is None:
+            # The slider was clicked but not moved
+            return
+
+        trace_args(paths=len(originals), value=value)
+        omni.kit.undo.begin_group()
+        for path, (scale, rotation, rotation_order, translation) in originals.items():
+            omni.kit.commands.execute(
+                "TransformPrimSRTCommand",
+                path=path,
+                new_translation=translation,
+                new_rotation_euler=rotation,
+                new_rotation_order=rotation_order,
+                new_scale=self._get_scale(scale, value),
+                old_translation=translation,
+                old_rotation_euler=rotation,
+                old_rotation_order=rotation_order,
+                old_scale=scale,
+                usd_context_name=self._usd_context_name,
+            )
+        omni.kit.undo.end_group()
+
+    def cancel(self):
+        """Put back the scale before the drag, nothing is recorded"""
+        self._update_sub = None
+        applied = self._applied
+        originals = self._originals
+        self._reset()
+        if applied is not None:
+            self._preview(originals, None)
+
+    def _reset(self):
+        self._originals = {}
+        self._pending = None
+        self._applied = None
+        self._correlation_id = None
+
+    def _get_scale(self, scale: Gf.Vec3d, value) -> Gf.Vec3d:
+        if value is None:
+            return Gf.Vec3d(scale)
+        if self._reference == 0.0:
+            return Gf.Vec3d(value)
+        return Gf.Vec3d(scale) * (value / self._reference)
+
+    def _on_update(self, event):
+        if self._pending is None:
+            return
+        value = self._pending
+        self._pending = None
+        resume_gesture_event(self._correlation_id)
+        self._preview(self._originals, value)
+        self._applied = value
+
+    @instrumented()
+    def _preview(self, originals: Dict[str, tuple], value):
+        # The command is created and done directly, so it's not in the undo
+        trace_args(paths=len(originals), value=value)
+        mark_gesture_stage(GestureLatency.WRITE)
+        for path, (scale, rotation, rotation_order, translation) in originals.items():
+            omni.kit.commands.create(
+                "TransformPrimSRTCommand",
+                path=path,
+                new_translation=translation,
+                new_rotation_euler=rotation,
+                new_rotation_order=rotation_order,
+                new_scale=self._get_scale(scale, value),
+                usd_context_name=self._usd_context_name,
+            ).do()
@@ -6,4 +6,7 @@
 # distribution of this software and related documentation without an express
 # license agreement from NVIDIA CORPORATION is strictly prohibited.
 #
-from .test_info import TestInfo
\ No newline at end of file
+from .test_info import TestInfo
+from .test_scale_editor import TestScaleEditor
+from .test_update_policy import TestUpdatePolicy
+from .test_widget_info_model import TestWidgetInfoModel
@@ -8,6 +8,7 @@
 #
 __all__ = ["TestInfo"]
 
+from omni.example.ui_scene.common import snapshot_build
 from omni.example.ui_scene.widget_info.widget_info_manipulator import WidgetInfoManipulator
 from omni.ui import scene as sc
 from omni.ui.tests.test_base import OmniUiTest
@@ -43,6 +44,27 @@ class WidgetInfoTestModel(sc.AbstractManipulatorModel):
             return [0, 0, 0]
 
 
+class WidgetInfoTestMultiModel(WidgetInfoTestModel):
+    def __init__(self):
+        super().__init__()
+
+        self._paths = []
+
+    def set_paths(self, paths):
+        self._paths = paths
+        self._item_changed(self.position)
+
+    def get_item(self, identifier):
+        if identifier == "paths":
+            return self._paths
+        if identifier == "name":
+            return self._paths[0] if self._paths else ""
+        return super().get_item(identifier)
+
+    def get_position(self, path):
+        return [0, 0, 0]
+
+
 class TestInfo(OmniUiTest):
     async def test_general(self):
         """Testing general look of the item"""
@@ -69,3 +91,114 @@ class TestInfo(OmniUiTest):
             await omni.kit.app.get_app().next_update_async()
 
         await self.finalize_test(threshold=100, golden_img_dir=TEST_DATA_PATH, golden_img_name="general.png")
+
+    async def test_pool(self):
+        """The widgets are rebound to the new selection and not created again"""
+        window = await self.create_test_window(width=256, height=256)
+
+        with window.frame:
+            scene_view = sc.SceneView()
+            with scene_view.scene:
+                model = WidgetInfoTestMultiModel()
+                manipulator = WidgetInfoManipulator(model=model, max_widgets=3)
+
+        model.set_paths(["/A", "/B"])
+        await omni.kit.app.get_app().next_update_async()
+        widgets = list(manipulator._pool)
+        self.assertEqual(len(widgets), 2)
+
+        # /B keeps its widget, /C takes the widget of /A
+        model.set_paths(["/B", "/C"])
+        await omni.kit.app.get_app().next_update_async()
+        self.assertEqual(manipulator._pool, widgets)
+        self.assertEqual(sorted(widget.path for widget in widgets), ["/B", "/C"])
+        self.assertEqual(widgets[1].path, "/B")
+
+        # The pool doesn't grow over the limit
+        model.set_paths(["/A", "/B", "/C", "/D"])
+        await omni.kit.app.get_app().next_update_async()
+        self.assertEqual(len(manipulator._pool), 3)
+
+        model.set_paths([])
+        await omni.kit.app.get_app().next_update_async()
+        self.assertEqual(len(manipulator._pool), 3)
+        self.assertTrue(all(widget.path is None for widget in manipulator._pool))
+
+        manipulator.destroy()
+
+    async def test_stable_binding(self):
+        """Moving the prim only moves the widget, the slider is not bound again"""
+        window = await self.create_test_window(width=256, height=256)
+
+        with window.frame:
+            scene_view = sc.SceneView()
+            with scene_view.scene:
+                model = WidgetInfoTestMultiModel()
+                manipulator = WidgetInfoManipulator(model=model)
+
+        model.set_paths(["/A"])
+        await omni.kit.app.get_app().next_update_async()
+        widget = manipulator._pool[0]
+        subscriptions = widget._slider_subscriptions
+        widget._slider_model.as_float = 1.5
+
+        # The prim is moving
+        for _ in range(5):
+            model._item_changed(model.position)
+            await omni.kit.app.get_app().next_update_async()
+
+        self.assertIs(widget._slider_subscriptions, subscriptions)
+        self.assertEqual(widget._slider_model.as_float, 1.5)
+
+        # Another prim resets the slider
+        model.set_paths(["/B"])
+        await omni.kit.app.get_app().next_update_async()
+        self.assertIs(widget._slider_subscriptions, subscriptions)
+        self.assertEqual(widget._slider_model.as_float, 1.0)
+
+        manipulator.destroy()
+
+    async def test_no_rebuild(self):
+        """Rendering the widget again doesn't build its omni.ui content again"""
+        window = await self.create_test_window(width=256, height=256)
+
+        with window.frame:
+            scene_view = sc.SceneView()
+            with scene_view.scene:
+                model = WidgetInfoTestMultiModel()
+                manipulator = WidgetInfoManipulator(model=model)
+
+        model.set_paths(["/A"])
+        await omni.kit.app.get_app().next_update_async()
+        widget = manipulator._pool[0]
+        label = widget._name_label
+        self.assertEqual(widget.stats.build_count, 1)
+
+        # The slider and another prim make it dirty, it's rendered again
+        renders = widget.stats.renders
+        widget._slider_model.as_float = 1.5
+        model.set_paths(["/B"])
+        for _ in range(3):
+            await omni.kit.app.get_app().next_update_async()
+        self.assertGreater(widget.stats.renders, renders)
+        self.assertEqual(widget.stats.build_count, 1)
+        self.assertIs(widget._name_label, label)
+        self.assertEqual(label.text, "Prim:/B")
+
+        manipulator.destroy()
+
+    async def test_snapshot(self):
+        """The shapes of the widget without the renderer"""
+        manipulator = WidgetInfoManipulator(model=WidgetInfoTestMultiModel())
+        manipulator.model.set_paths(["/A", "/B"])
+        snapshot = snapshot_build(manipulator)
+
+        # The pool and two widgets
+        self.assertEqual(snapshot.count("Widget"), 2)
+        self.assertEqual(len(snapshot.roots[0]["children"]), 2)
+        widget = snapshot.find("Widget")[0]["properties"]
+        self.assertEqual(widget["args"], [500, 150])
+        self.assertEqual(widget["gestures"][0], "<_DragGesture>")
+        self.assertTrue(all(root["properties"]["visible"] for root in snapshot.roots[0]["children"]))
+
+        manipulator.destroy()
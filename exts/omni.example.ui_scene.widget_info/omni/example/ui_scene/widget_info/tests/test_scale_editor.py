@@ -0,0 +1,68 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+__all__ = ["TestScaleEditor"]
+
+from omni.example.ui_scene.widget_info.scale_editor import ScaleEditor
+from pxr import Gf
+from pxr import UsdGeom
+import omni.kit.app
+import omni.kit.test
+import omni.kit.undo
+import omni.usd
+
+
+class TestScaleEditor(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        await omni.usd.get_context().new_stage_async()
+        self._stage = omni.usd.get_context().get_stage()
+        for path in ["/A", "/B"]:
+            UsdGeom.Xform.Define(self._stage, path).AddScaleOp().Set(Gf.Vec3d(2.0))
+
+    async def tearDown(self):
+        self._stage = None
+
+    def _get_scale(self, path):
+        return omni.usd.get_local_transform_SRT(self._stage.GetPrimAtPath(path))[0]
+
+    async def test_drag(self):
+        """The drag is written once per frame and committed as one undo"""
+        editor = ScaleEditor()
+        editor.begin(["/A", "/B"])
+        for value in [2.5, 3.0, 4.0]:
+            editor.set_value(value)
+
+        # Nothing is written before the next frame
+        self.assertEqual(self._get_scale("/A"), Gf.Vec3d(2.0))
+
+        await omni.kit.app.get_app().next_update_async()
+        # The last value is written, and /B is scaled by the same factor
+        self.assertEqual(self._get_scale("/A"), Gf.Vec3d(4.0))
+        self.assertEqual(self._get_scale("/B"), Gf.Vec3d(4.0))
+
+        editor.end()
+        self.assertEqual(self._get_scale("/A"), Gf.Vec3d(4.0))
+
+        # A single undo goes back to the scale before the drag
+        omni.kit.undo.undo()
+        self.assertEqual(self._get_scale("/A"), Gf.Vec3d(2.0))
+        self.assertEqual(self._get_scale("/B"), Gf.Vec3d(2.0))
+
+        editor.destroy()
+
+    async def test_cancel(self):
+        editor = ScaleEditor()
+        editor.begin(["/A"])
+        editor.set_value(3.0)
+        await omni.kit.app.get_app().next_update_async()
+        self.assertEqual(self._get_scale("/A"), Gf.Vec3d(3.0))
+
+        editor.cancel()
+        self.assertEqual(self._get_scale("/A"), Gf.Vec3d(2.0))
+        self.assertFalse(editor.is_editing)
+        editor.destroy()
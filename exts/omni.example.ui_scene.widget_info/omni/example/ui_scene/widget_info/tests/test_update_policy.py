@@ -0,0 +1,73 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+__all__ = ["TestUpdatePolicy"]
+
+from omni.example.ui_scene.widget_info.update_policy import AdaptiveUpdatePolicy
+from omni.ui import scene as sc
+from omni.ui.tests.test_base import OmniUiTest
+import omni.kit.app
+
+
+class TestUpdatePolicy(OmniUiTest):
+    async def _create_widget(self):
+        window = await self.create_test_window(width=256, height=256)
+        with window.frame:
+            scene_view = sc.SceneView()
+            with scene_view.scene:
+                widget = sc.Widget(100, 50)
+        return widget
+
+    async def test_dirty(self):
+        """The widget is rendered only when it's dirty and on screen"""
+        widget = await self._create_widget()
+        policy = AdaptiveUpdatePolicy()
+        on_screen = [True]
+        stats = policy.register(widget, lambda: on_screen[0])
+        self.assertEqual(widget.update_policy, sc.Widget.UpdatePolicy.ON_DEMAND)
+
+        for _ in range(5):
+            await omni.kit.app.get_app().next_update_async()
+        # Only the first render
+        self.assertEqual(stats.renders, 1)
+
+        on_screen[0] = False
+        policy.mark_dirty(widget)
+        for _ in range(5):
+            await omni.kit.app.get_app().next_update_async()
+        self.assertEqual(stats.renders, 1)
+        self.assertGreater(stats.frozen, 0)
+
+        on_screen[0] = True
+        await omni.kit.app.get_app().next_update_async()
+        self.assertEqual(stats.renders, 2)
+
+        policy.set_hovered(widget, True)
+        self.assertEqual(widget.update_policy, sc.Widget.UpdatePolicy.ON_MOUSE_HOVERED)
+        policy.set_hovered(widget, False)
+        self.assertEqual(widget.update_policy, sc.Widget.UpdatePolicy.ON_DEMAND)
+
+        policy.destroy()
+
+    async def test_frame_budget(self):
+        """The slow frames make the interval longer, the fast ones make it shorter"""
+        policy = AdaptiveUpdatePolicy(frame_budget=0.01, max_interval=4)
+        # Stop the real updates, the frames are simulated
+        policy._update_sub = None
+
+        for frame in range(1, 101):
+            policy._frame = frame
+            policy._update_interval(0.05)
+        self.assertEqual(policy.interval, 4)
+
+        for frame in range(101, 301):
+            policy._frame = frame
+            policy._update_interval(0.001)
+        self.assertEqual(policy.interval, 1)
+
+        policy.destroy()
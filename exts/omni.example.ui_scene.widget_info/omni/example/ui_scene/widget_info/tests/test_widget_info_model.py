@@ -0,0 +1,53 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+__all__ = ["TestWidgetInfoModel"]
+
+from omni.example.ui_scene.widget_info.widget_info_model import WidgetInfoModel
+from pxr import Sdf
+from pxr import UsdGeom
+import omni.kit.app
+import omni.kit.test
+import omni.usd
+
+
+class TestWidgetInfoModel(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        await omni.usd.get_context().new_stage_async()
+        self._stage = omni.usd.get_context().get_stage()
+        UsdGeom.Xform.Define(self._stage, "/Root")
+        UsdGeom.Cube.Define(self._stage, "/Root/Cube")
+        UsdGeom.Cube.Define(self._stage, "/Root/Sphere")
+
+    async def tearDown(self):
+        self._stage = None
+
+    async def _select(self, model, paths):
+        omni.usd.get_context().get_selection().set_selected_prim_paths(paths, True)
+        # The selection is delivered when it settles
+        for _ in range(3):
+            await omni.kit.app.get_app().next_update_async()
+        self.assertEqual(model.get_item("paths"), paths)
+
+    async def test_rename(self):
+        """The model follows the renamed prim without a new selection"""
+        model = WidgetInfoModel()
+        await self._select(model, ["/Root/Cube", "/Root/Sphere"])
+
+        edit = Sdf.BatchNamespaceEdit()
+        edit.Add("/Root/Cube", "/Root/Box")
+        self.assertTrue(self._stage.GetEditTarget().GetLayer().Apply(edit))
+
+        self.assertEqual(model.get_item("paths"), ["/Root/Box", "/Root/Sphere"])
+        self.assertEqual(model.get_item("name"), "/Root/Box")
+        self.assertIsNotNone(model.get_position("/Root/Box"))
+
+        # The removed prim is dropped
+        self._stage.RemovePrim("/Root/Sphere")
+        self.assertEqual(model.get_item("paths"), ["/Root/Box"])
+        model.destroy()
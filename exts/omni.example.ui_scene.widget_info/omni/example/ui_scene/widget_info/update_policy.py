@@ -0,0 +1,168 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+__all__ = ["AdaptiveUpdatePolicy", "WidgetStats"]
+
+from contextlib import contextmanager
+from typing import Callable, Dict
+import time
+
+from omni.ui import scene as sc
+import omni.kit.app
+
+
+class WidgetStats:
+    """The counters of a single widget, they are for tuning the policy"""
+
+    def __init__(self):
+        # The times the widget was asked to render
+        self.renders = 0
+        # The frames the dirty widget waited because of the frame budget
+        self.deferred = 0
+        # The frames the dirty widget waited because it was off-screen
+        self.frozen = 0
+        # The time spent to build the omni.ui content of the widget
+        self.build_count = 0
+        self.build_time = 0.0
+
+    @property
+    def average_build_time(self) -> float:
+        return self.build_time / self.build_count if self.build_count else 0.0
+
+    def __repr__(self):
+        return (
+            f"<WidgetStats renders={self.renders} deferred={self.deferred} frozen={self.frozen} "
+            f"build={self.average_build_time * 1000:.2f}ms>"
+        )
+
+
+class _Entry:
+    def __init__(self, widget: sc.Widget, is_on_screen_fn: Callable[[], bool]):
+        self.widget = widget
+        self.is_on_screen_fn = is_on_screen_fn
+        # The first render is always needed
+        self.dirty = True
+        self.hovered = False
+        self.last_render = -1
+        self.stats = WidgetStats()
+
+
+class AdaptiveUpdatePolicy:
+    """
+    Decides when the sc.Widget instances are rendered to their textures.
+
+    The widgets are ON_DEMAND and they are rendered only when their content is
+    dirty. When the mouse is over a widget, it's ON_MOUSE_HOVERED, so the
+    slider works as usual. When the frames take longer than `frame_budget`
+    seconds, the dirty widgets are rendered every few frames instead of every
+    frame, up to `max_interval`. The widgets that are off-screen are not
+    rendered until they come back.
+    """
+
+    def __init__(self, frame_budget: float = 1.0 / 60.0, max_interval: int = 8):
+        self._frame_budget = frame_budget
+        self._max_interval = max_interval
+        # Render the dirty widgets every `interval` frames
+        self._interval = 1
+        self._frame = 0
+        self._frame_time = frame_budget
+        self._entries: Dict[int, _Entry] = {}
+        self._update_sub = (
+            omni.kit.app.get_app()
+            .get_update_event_stream()
+            .create_subscription_to_pop(self._on_update, name="Widget Info Update Policy")
+        )
+
+    def destroy(self):
+        self._update_sub = None
+        self._entries = {}
+
+    @property
+    def interval(self) -> int:
+        """The number of frames between the renders of a dirty widget"""
+        return self._interval
+
+    @property
+    def frame_time(self) -> float:
+        """The smoothed duration of the frame in seconds"""
+        return self._frame_time
+
+    def register(self, widget: sc.Widget, is_on_screen_fn: Callable[[], bool]) -> WidgetStats:
+        """Start managing the widget. `is_on_screen_fn` tells if the widget can be seen now."""
+        widget.update_policy = sc.Widget.UpdatePolicy.ON_DEMAND
+        entry = _Entry(widget, is_on_screen_fn)
+        self._entries[id(widget)] = entry
+        return entry.stats
+
+    def unregister(self, widget: sc.Widget):
+        self._entries.pop(id(widget), None)
+
+    def get_stats(self, widget: sc.Widget) -> WidgetStats:
+        entry = self._entries.get(id(widget))
+        return entry.stats if entry else None
+
+    def mark_dirty(self, widget: sc.Widget):
+        """The content of the widget is changed, it will be rendered when the policy allows"""
+        entry = self._entries.get(id(widget))
+        if entry:
+            entry.dirty = True
+
+    def set_hovered(self, widget: sc.Widget, hovered: bool):
+        entry = self._entries.get(id(widget))
+        if not entry or entry.hovered == hovered:
+            return
+        entry.hovered = hovered
+        if hovered:
+            widget.update_policy = sc.Widget.UpdatePolicy.ON_MOUSE_HOVERED
+        else:
+            widget.update_policy = sc.Widget.UpdatePolicy.ON_DEMAND
+            # The last hovered state should be in the texture
+            entry.dirty = True
+
+    @contextmanager
+    def measure_build(self, widget: sc.Widget):
+        """Counts the time of building the content of the widget"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            entry = self._entries.get(id(widget))
+            if entry:
+                entry.stats.build_count += 1
+                entry.stats.build_time += time.perf_counter() - start
+
+    def _update_interval(self, dt: float):
+        # Exponential moving average, so a single slow frame doesn't change
+        # the interval
+        self._frame_time += (dt - self._frame_time) * 0.1
+        if self._frame % 10:
+            return
+        if self._frame_time > self._frame_budget:
+            self._interval = min(self._interval * 2, self._max_interval)
+        elif self._frame_time < self._frame_budget * 0.8:
+            self._interval = max(self._interval // 2, 1)
+
+    def _on_update(self, event):
+        self._frame += 1
+        self._update_interval(event.payload["dt"])
+
+        for entry in self._entries.values():
+            if not entry.dirty or entry.hovered:
+                # The hovered widget is rendered by its own policy
+                continue
+            if not entry.is_on_screen_fn():
+                entry.stats.frozen += 1
+                continue
+            if self._frame - entry.last_render < self._interval:
+                entry.stats.deferred += 1
+                continue
+
+            entry.widget.invalidate()
+            entry.dirty = False
+            entry.last_render = self._frame
+            entry.stats.renders += 1
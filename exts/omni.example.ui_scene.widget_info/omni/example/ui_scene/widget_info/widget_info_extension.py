@@ -8,8 +8,7 @@
 #
 __all__ = ["WidgetInfoExtension"]
 
-from .widget_info_scene import WidgetInfoScene
-from omni.kit.viewport.utility import get_active_viewport_window
+from omni.example.ui_scene.common import SelectionTrigger
 import carb
 import omni.ext
 
@@ -18,19 +17,39 @@ class WidgetInfoExtension(omni.ext.IExt):
     """The entry point to the extension"""
 
     def on_startup(self, ext_id):
-        # Get the active (which at startup is the default Viewport)
-        viewport_window = get_active_viewport_window()
+        self._ext_id = ext_id
+        self._model = None
+        self._widget_info_viewports = None
+        # The widget is shown for the selected prim, nothing is created until
+        # the first selection
+        self._trigger = SelectionTrigger(self._create_scenes, name="Widget Info Startup")
 
-        # Issue an error if there is no Viewport
-        if not viewport_window:
-            carb.log_warn(f"No Viewport Window to add {ext_id} scene to")
-            self._widget_info_viewport = None
-            return
+    def _create_scenes(self):
+        # USD and the manipulator are only imported when they are needed
+        from .widget_info_model import WidgetInfoModel
+        from .widget_info_scene import WidgetInfoScene
+        from omni.example.ui_scene.common import ViewportTracker
 
-        # Build out the scene
-        self._widget_info_viewport = WidgetInfoScene(viewport_window, ext_id)
+        ext_id = self._ext_id
+        # One model for all the viewports, so a new viewport doesn't query
+        # USD again
+        self._model = WidgetInfoModel()
+        # Build out the scene in every Viewport, including the ones opened later
+        self._widget_info_viewports = ViewportTracker(
+            lambda window: WidgetInfoScene(window, ext_id, self._model)
+        )
+
+        # Issue a warning if there is no Viewport yet
+        if not self._widget_info_viewports.scenes:
+            carb.log_warn(f"No Viewport Window to add {ext_id} scene to yet")
 
     def on_shutdown(self):
-        if self._widget_info_viewport:
-            self._widget_info_viewport.destroy()
-            self._widget_info_viewport = None
+        if self._trigger:
+            self._trigger.destroy()
+            self._trigger = None
+        if self._widget_info_viewports:
+            self._widget_info_viewports.destroy()
+            self._widget_info_viewports = None
+        if self._model:
+            self._model.destroy()
+            self._model = None
@@ -8,10 +8,21 @@
 ##
 __all__ = ["WidgetInfoManipulator"]
 
+from omni.example.ui_scene.common import GestureLatency
+from omni.example.ui_scene.common import begin_gesture_event
+from omni.example.ui_scene.common import gesture_stage
+from omni.example.ui_scene.common import instrumented
+from omni.example.ui_scene.common import mark_gesture_stage
+from omni.example.ui_scene.common import record_gesture
 from omni.ui import color as cl
 from omni.ui import scene as sc
 import omni.ui as ui
 
+from .update_policy import AdaptiveUpdatePolicy
+
+# The name of the slider in the gesture latency and the recordings
+GESTURE_NAME = "widget_info.slider"
+
 
 class _ViewportLegacyDisableSelection:
     """Disables selection in the Viewport Legacy"""
@@ -72,24 +83,78 @@ class _DragGesture(sc.DragGesture):
         self.__disable_selection = None
 
 
-class WidgetInfoManipulator(sc.Manipulator):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
+class _InfoWidget:
+    """
+    One widget of the pool. The sc.Widget and its omni.ui tree are built only
+    once, and then the widget is bound to the selected prims by changing the
+    text of the label and the value of the slider.
+    """
 
-        self.destroy()
+    def __init__(self, manipulator, policy: AdaptiveUpdatePolicy):
+        self.path = None
+        self._policy = policy
+        self._position = None
+        self._manipulator = manipulator
+        self._name_label = None
+        self._slider = None
+        self._slider_range = (0.0, 1.0)
+        # The slider model is subscribed once, the callbacks look at the
+        # prim the widget is bound to now
+        self._binding = False
+        self._slider_model = ui.SimpleFloatModel(1.0)
+        self._slider_subscriptions = [
+            self._slider_model.subscribe_begin_edit_fn(self._on_slider_begin),
+            self._slider_model.subscribe_value_changed_fn(self._on_slider_changed),
+            self._slider_model.subscribe_end_edit_fn(self._on_slider_end),
+        ]
 
-        self._radius = 2
-        self._distance_to_top = 5
-        self._thickness = 2
-        self._radius_hovered = 20
+        self.root = sc.Transform(visible=False)
+        with self.root:
+            with sc.Transform(scale_to=sc.Space.SCREEN):
+                with sc.Transform(transform=sc.Matrix44.get_translation_matrix(0, 100, 0)):
+                    # Label
+                    with sc.Transform(look_at=sc.Transform.LookAt.CAMERA):
+                        self._widget = sc.Widget(500, 150, update_policy=sc.Widget.UpdatePolicy.ON_DEMAND)
+                        # Additional gesture that prevents Viewport Legacy selection
+                        self._widget.gestures += [_DragGesture()]
+                        # The texture is only rendered continuously under the mouse
+                        if hasattr(sc, "HoverGesture"):
+                            self._widget.gestures += [
+                                sc.HoverGesture(
+                                    on_began_fn=lambda sender: self._policy.set_hovered(self._widget, True),
+                                    on_ended_fn=lambda sender: self._policy.set_hovered(self._widget, False),
+                                )
+                            ]
+
+        self.stats = self._policy.register(self._widget, self._is_on_screen)
+        # The omni.ui content is built here and not by a build function of
+        # the frame, so `invalidate()` only renders the texture again. The
+        # label and the slider are changed in place when the widget is bound.
+        with self._policy.measure_build(self._widget):
+            with self._widget.frame:
+                self._build_widgets()
 
     def destroy(self):
-        self._root = None
-        self._slider_subscription = None
+        if self._policy:
+            self._policy.unregister(self._widget)
+        self._policy = None
+        self._slider_subscriptions = None
         self._slider_model = None
+        self._slider = None
         self._name_label = None
+        self._manipulator = None
+        self._widget = None
+        self.root = None
+
+    def _is_on_screen(self) -> bool:
+        """True if the anchor of the widget is in the viewport or close to its border"""
+        if not self.path or self._position is None:
+            return False
+        ndc = self._manipulator.transform_space(sc.Space.WORLD, sc.Space.NDC, self._position)
+        # The widget is much bigger than its anchor, so there is a margin
+        return -1.5 <= ndc[0] <= 1.5 and -1.5 <= ndc[1] <= 1.5
 
-    def _on_build_widgets(self):
+    def _build_widgets(self):
         with ui.ZStack():
             ui.Rectangle(
                 style={
@@ -111,59 +176,211 @@ class WidgetInfoManipulator(sc.Manipulator):
                     ui.Label("Hello world, I am a scene.Widget!", height=0, alignment=ui.Alignment.CENTER)
 
                 ui.Spacer(height=4)
-                self._name_label = ui.Label("", height=0, alignment=ui.Alignment.CENTER)
-
-                # setup some model, just for simple demonstration here
-                self._slider_model = ui.SimpleFloatModel()
+                self._name_label = ui.Label(self._get_name_text(), height=0, alignment=ui.Alignment.CENTER)
 
                 ui.Spacer(height=10)
                 with ui.HStack():
                     ui.Spacer(width=10)
                     ui.Label("scale", height=0, width=0)
                     ui.Spacer(width=5)
-                    ui.FloatSlider(self._slider_model)
+                    self._slider = ui.FloatSlider(
+                        self._slider_model, min=self._slider_range[0], max=self._slider_range[1]
+                    )
                     ui.Spacer(width=10)
                 ui.Spacer(height=4)
                 ui.Spacer()
 
-        self.on_model_updated(None)
+    def _get_name_text(self):
+        return f"Prim:{self.path}" if self.path else ""
+
+    def _on_slider_begin(self, model):
+        if not self._binding and self.path:
+            record_gesture(GESTURE_NAME, "began", path=self.path)
+            self._manipulator._on_scale_began(self.path)
+
+    @instrumented()
+    def _on_slider_changed(self, model):
+        # The input event, the following stages up to the frame get its ID
+        begin_gesture_event(GESTURE_NAME)
+        self._policy.mark_dirty(self._widget)
+        if not self._binding and self.path:
+            record_gesture(GESTURE_NAME, "changed", path=self.path, value=model.as_float)
+            self._manipulator._on_scale_changed(self.path, model.as_float)
+
+    def _on_slider_end(self, model):
+        if not self._binding and self.path:
+            record_gesture(GESTURE_NAME, "ended", path=self.path)
+            self._manipulator._on_scale_ended(self.path)
+
+    def replay(self, state: str, value=None):
+        """Edits the slider like the user does, it's called by the replay"""
+        if state == "began":
+            self._slider_model.begin_edit()
+        elif state == "changed":
+            self._slider_model.as_float = value
+        elif state == "ended":
+            self._slider_model.end_edit()
+
+    def bind(self, path, position):
+        """
+        Show the widget for the prim. When the prim is the same, only the
+        transform is changed, the slider and its subscriptions stay as they
+        are. It's what happens on every frame while the prim is moving.
+        """
+        position = list(position)
+        if position != self._position:
+            self._position = position
+            self.root.transform = sc.Matrix44.get_translation_matrix(*position)
+        if not self.root.visible:
+            self.root.visible = True
+
+        if path != self.path:
+            self._retarget(path)
+
+    def _retarget(self, path):
+        """Point the label and the slider to another prim"""
+        self.path = path
+        scale = self._manipulator._get_scale(path)
+        # Set the slider without reporting it as the user's change
+        self._slider_range = (scale * 0.1, scale * 2.0)
+        self._slider.min, self._slider.max = self._slider_range
+        self._binding = True
+        self._slider_model.as_float = scale
+        self._binding = False
+
+        # Update the shape name
+        self._name_label.text = self._get_name_text()
+        self._policy.mark_dirty(self._widget)
+
+    def unbind(self):
+        """Hide the widget and keep it in the pool for another prim"""
+        self.path = None
+        self._position = None
+        self.root.visible = False
+
+
+class WidgetInfoManipulator(sc.Manipulator):
+    """
+    Shows a widget for each selected prim. The widgets are kept in a pool, so
+    when the selection changes, they are rebound to the new prims and not
+    rebuilt. At most `max_widgets` widgets are created.
+
+    The slider scales the prim of its widget, or all the selected prims when
+    `scale_selection` is True.
+
+    The widgets are rendered to their textures only when they change, see
+    `AdaptiveUpdatePolicy`. `frame_budget` is the frame time in seconds
+    above which they are rendered less often.
+    """
+
+    def __init__(self, max_widgets=8, scale_selection=False, frame_budget=1.0 / 60.0, **kwargs):
+        super().__init__(**kwargs)
+        self._policy = AdaptiveUpdatePolicy(frame_budget)
+
+        self._max_widgets = max_widgets
+        self._scale_selection = scale_selection
+        self._pool_root = None
+        self._pool = []
+
+        self._radius = 2
+        self._distance_to_top = 5
+        self._thickness = 2
+        self._radius_hovered = 20
+
+    def destroy(self):
+        self._clear_pool()
+        if self._policy:
+            self._policy.destroy()
+            self._policy = None
+
+    def _clear_pool(self):
+        for widget in self._pool:
+            widget.destroy()
+        self._pool = []
+        self._pool_root = None
+
+    @property
+    def policy(self) -> AdaptiveUpdatePolicy:
+        """The policy that renders the widgets, it has the counters of each widget"""
+        return self._policy
 
-        # Additional gesture that prevents Viewport Legacy selection
-        self._widget.gestures += [_DragGesture()]
+    def _get_positions(self):
+        """Selected paths to the positions"""
+        paths = self.model.get_item("paths")
+        if paths is None:
+            # The model that only knows a single prim
+            name = self.model.get_item("name")
+            return {name: self.model.get_as_floats(self.model.get_item("position"))} if name else {}
+        return {path: self.model.get_position(path) for path in paths[: self._max_widgets]}
 
+    def _get_widgets(self, count):
+        """Returns the pool, it grows up to `count` widgets"""
+        while len(self._pool) < min(count, self._max_widgets):
+            with self._pool_root:
+                self._pool.append(_InfoWidget(self, self._policy))
+        return self._pool
+
+    @instrumented()
     def on_build(self):
         """Called when the model is chenged and rebuilds the whole slider"""
-        self._root = sc.Transform(visible=False)
-        with self._root:
-            with sc.Transform(scale_to=sc.Space.SCREEN):
-                with sc.Transform(transform=sc.Matrix44.get_translation_matrix(0, 100, 0)):
-                    # Label
-                    with sc.Transform(look_at=sc.Transform.LookAt.CAMERA):
-                        self._widget = sc.Widget(500, 150, update_policy=sc.Widget.UpdatePolicy.ON_MOUSE_HOVERED)
-                        self._widget.frame.set_build_fn(self._on_build_widgets)
+        # The previous scene graph is gone, so the pool is created again
+        self._clear_pool()
+        self._pool_root = sc.Transform()
+        self.on_model_updated(None)
 
+    @instrumented()
+    @gesture_stage(GestureLatency.REDRAW)
     def on_model_updated(self, _):
-        # if we don't have selection then show nothing
-        if not self.model or not self.model.get_item("name"):
-            self._root.visible = False
+        mark_gesture_stage(GestureLatency.MODEL_UPDATED)
+        if not self._pool_root:
             return
 
-        # Update the shapes
-        position = self.model.get_as_floats(self.model.get_item("position"))
-        self._root.transform = sc.Matrix44.get_translation_matrix(*position)
-        self._root.visible = True
+        # if we don't have selection then show nothing
+        positions = self._get_positions() if self.model else {}
+        widgets = self._get_widgets(len(positions))
 
-        # Update the slider
-        def update_scale(prim_name, value):
-            print(f"changing scale of {prim_name}, {value}")
+        # The widgets that already show the selected prims keep them, so
+        # only the new prims need a widget rebound
+        bound = {widget.path: widget for widget in widgets if widget.path in positions}
+        free = [widget for widget in widgets if widget.path not in positions]
+        for path, position in positions.items():
+            widget = bound.get(path)
+            if widget is None:
+                if not free:
+                    break
+                widget = free.pop(0)
+            widget.bind(path, position)
 
-        if self._slider_model:
-            self._slider_subscription = None
-            self._slider_model.as_float = 1.0
-            self._slider_subscription = self._slider_model.subscribe_value_changed_fn(
-                lambda m, p=self.model.get_item("name"): update_scale(p, m.as_float)
-            )
+        for widget in free:
+            widget.unbind()
 
-        # Update the shape name
-        if self._name_label:
-            self._name_label.text = f"Prim:{self.model.get_item('name')}"
+    def _get_scale(self, path):
+        get_scale = getattr(self.model, "get_scale", None)
+        return get_scale(path) if get_scale else 1.0
+
+    def _on_scale_began(self, path):
+        if not hasattr(self.model, "begin_scale"):
+            return
+        paths = [path]
+        if self._scale_selection:
+            paths += [p for p in self.model.get_item("paths") or [] if p != path]
+        self.model.begin_scale(paths)
+
+    def _on_scale_changed(self, path, value):
+        if hasattr(self.model, "set_scale"):
+            self.model.set_scale(value)
+
+    def _on_scale_ended(self, path):
+        if hasattr(self.model, "end_scale"):
+            self.model.end_scale()
+
+    def replay_gesture(self, event):
+        """
+        Replays the event of a GestureRecording on the widget of the prim.
+        Returns False when the prim has no widget.
+        """
+        for widget in self._pool:
+            if widget.path == event.values["path"]:
+                widget.replay(event.state, event.values.get("value"))
+                return True
+        return False
@@ -8,17 +8,29 @@
 #
 __all__ = ["WidgetInfoModel"]
 
+from omni.example.ui_scene.common import ChangeSet
+from omni.example.ui_scene.common import PathSet
+from omni.example.ui_scene.common import SelectionDelta
+from omni.example.ui_scene.common import SelectionSnapshot
+from omni.example.ui_scene.common import get_notice_hub
+from omni.example.ui_scene.common import get_scene_query
+from omni.example.ui_scene.common import get_selection_adapter
+from omni.example.ui_scene.common import instrumented
+from omni.example.ui_scene.common import is_resynced
+from omni.example.ui_scene.common import resolve_resynced_path
+from omni.example.ui_scene.common import trace_args
+from omni.example.ui_scene.common import trace_item
 from omni.ui import scene as sc
 from pxr import Gf
 from pxr import UsdGeom
 from pxr import Usd
-from pxr import UsdShade
-from pxr import Tf
 from pxr import UsdLux
 
 import omni.usd
 import omni.kit.commands
 
+from .scale_editor import ScaleEditor
+
 
 class WidgetInfoModel(sc.AbstractManipulatorModel):
     """
@@ -45,7 +57,6 @@ class WidgetInfoModel(sc.AbstractManipulatorModel):
     def __init__(self):
         super().__init__()
 
-        self.material_name = ""
         self.position = WidgetInfoModel.PositionItem()
 
         # The distance from the bounding box to the position the model returns
@@ -53,27 +64,91 @@ class WidgetInfoModel(sc.AbstractManipulatorModel):
         # Current selection
         self._prim = None
         self._current_path = ""
+        # All the selected prims with their materials, the first one is the
+        # current prim
+        self._paths = []
+        # The materials, the bounds and the transforms are computed only when
+        # they are shown
+        self._selection = SelectionSnapshot(None, [])
+        # The selected paths for the hub and the notices, the changes are
+        # matched against them in O(depth)
+        self._interest = PathSet()
         self._stage_listener = None
 
         # Save the UsdContext name (we currently only work with single Context)
         self._usd_context_name = ''
-        usd_context = self._get_context()
 
-        # Track selection
-        self._events = usd_context.get_stage_event_stream()
-        self._stage_event_sub = self._events.create_subscription_to_pop(
-            self._on_stage_event, name="Object Info Selection Update"
+        # Writes the scale from the slider of the widget
+        self._scale_editor = ScaleEditor(self._usd_context_name)
+
+        # Track selection. The hub is shared by all the samples.
+        self._notice_hub = get_notice_hub(self._usd_context_name)
+        # The bounds and the materials are shared with the other samples
+        self._query = get_scene_query(self._usd_context_name)
+        self._selection_adapter = get_selection_adapter(self._usd_context_name)
+        self._selection_sub = self._selection_adapter.subscribe(
+            self._on_kit_selection_changed, name="Widget Info Selection Update", current=True
         )
 
+    def destroy(self):
+        self._scale_editor.destroy()
+        self._stage_listener = None
+        self._selection_sub = None
+
     def _get_context(self) -> Usd.Stage:
         # Get the UsdContext we are attached to
         return omni.usd.get_context(self._usd_context_name)
 
-    def _notice_changed(self, notice, stage):
-        """Called by Tf.Notice"""
-        for p in notice.GetChangedInfoOnlyPaths():
-            if self._current_path in str(p.GetPrimPath()):
-                self._item_changed(self.position)
+    @instrumented()
+    def _notice_changed(self, changes: ChangeSet):
+        """Called by the NoticeHub with the changes of the selected prims and their ancestors"""
+        trace_args(path=self._current_path, resynced=len(changes.resynced), changed=len(changes.info_only))
+        changed = self._rebind_resynced(list(changes.resynced)) if changes.resynced else False
+        invalidated = set()
+        for p in changes.paths:
+            # The selected prims that are the changed prim, its ancestors or its descendants
+            for path in self._interest.ancestors(p) + self._interest.descendants(p):
+                invalidated.add(path.pathString)
+        if invalidated:
+            self._selection.invalidate_paths(invalidated)
+            changed = True
+
+        if changed:
+            self._item_changed(self.position)
+
+    def _rebind_resynced(self, resynced) -> bool:
+        """
+        The selected prims or their parents are renamed, reparented or
+        recomposed. Follow them to the new paths without going through the
+        selection. Returns True if any selected prim is affected.
+        """
+        stage = self._selection.stage
+        # Only the selected paths under the resynced prims can be moved
+        candidates = set()
+        for resynced_path in resynced:
+            candidates.update(path.pathString for path in self._interest.descendants(resynced_path))
+        moved = {
+            path: resolve_resynced_path(stage, path, resynced) for path in candidates if is_resynced(path, resynced)
+        }
+        if not moved:
+            return False
+
+        self._selection.rebind(moved)
+        self._paths = list(self._selection.paths)
+        self._current_path = self._selection.primary
+        self._prim = self._selection.prim(self._current_path) if self._current_path else None
+        # The hub has the same PathSet
+        for old_path, new_path in moved.items():
+            if new_path != old_path:
+                self._interest.discard(old_path)
+                if new_path:
+                    self._interest.add(new_path)
+        return True
+
+    @property
+    def material_name(self) -> str:
+        """The material name of the current prim"""
+        return self.get_material(self._current_path)
 
     def get_item(self, identifier):
         if identifier == "position":
@@ -82,6 +157,16 @@ class WidgetInfoModel(sc.AbstractManipulatorModel):
             return self._current_path
         if identifier == "material":
             return self.material_name
+        if identifier == "paths":
+            return self._paths
+
+    def get_material(self, path: str) -> str:
+        """Returns the material name of the selected object"""
+        if path not in self._selection:
+            return ""
+        if self._selection.prim(path).IsA(UsdLux.Light):
+            return "I am a Light"
+        return self._selection.material(path) or "N/A"
 
     def get_as_floats(self, item):
         if item == self.position:
@@ -93,7 +178,9 @@ class WidgetInfoModel(sc.AbstractManipulatorModel):
             return item.value
         return []
 
+    @instrumented()
     def set_floats(self, item, value):
+        trace_item(self, item, path=self._current_path)
         if not self._current_path:
             return
 
@@ -105,66 +192,102 @@ class WidgetInfoModel(sc.AbstractManipulatorModel):
         # This makes the manipulator updated
         self._item_changed(item)
 
-    def _on_stage_event(self, event):
-        """Called by stage_event_stream"""
-        if event.type == int(omni.usd.StageEventType.SELECTION_CHANGED):
-            self._on_kit_selection_changed()
+    def get_scale(self, path: str) -> float:
+        """Returns the uniform scale of the selected object"""
+        srt = self._selection.local_srt(path) if path in self._selection else None
+        if not srt:
+            return 1.0
+        (scale, rotation_euler, rotation_order, translation) = srt
+        return scale[0]
 
-    def _on_kit_selection_changed(self):
-        # selection change, reset it for now
-        self._current_path = ""
-        usd_context = self._get_context()
-        stage = usd_context.get_stage()
-        if not stage:
-            return
+    def begin_scale(self, paths):
+        """The slider is pressed. The first path is the prim of the slider."""
+        self._scale_editor.begin(paths)
 
-        prim_paths = usd_context.get_selection().get_selected_prim_paths()
-        if not prim_paths:
-            self._item_changed(self.position)
-            # Revoke the Tf.Notice listener, we don't need to update anything
-            if self._stage_listener:
-                self._stage_listener.Revoke()
-                self._stage_listener = None
+    def set_scale(self, value: float):
+        """The slider is dragged, the scale is written on the next frame"""
+        self._scale_editor.set_value(value)
+
+    def end_scale(self):
+        """The slider is released, the scale is committed to the undo"""
+        self._scale_editor.end()
+
+    @instrumented()
+    def _on_kit_selection_changed(self, delta: SelectionDelta):
+        """
+        Called by the SelectionAdapter. Only the added and the removed prims
+        are processed, the prims that stay selected keep their data.
+        """
+        trace_args(path=delta.primary)
+        if self._scale_editor.is_editing:
+            self._scale_editor.end()
+        stage = self._get_context().get_stage()
+        if not stage:
+            self._current_path = ""
+            self._paths = []
+            self._selection = SelectionSnapshot(None, [])
+            self._interest = PathSet()
             return
 
-        prim = stage.GetPrimAtPath(prim_paths[0])
-
-        if prim.IsA(UsdLux.Light):
-            print("Light")
-            self.material_name = "I am a Light"
-        elif prim.IsA(UsdGeom.Imageable):
-            material, relationship = UsdShade.MaterialBindingAPI(prim).ComputeBoundMaterial()
-            if material:
-                self.material_name = str(material.GetPath())
-            else:
-                self.material_name = "N/A"
-        else:
+        added = delta.added
+        removed = delta.removed
+        if self._selection.stage is not stage:
+            # Another stage, start from scratch
+            self._selection = SelectionSnapshot(stage, [], query=self._query)
+            self._interest = PathSet()
+            added = self._selection_adapter.paths
+            removed = ()
+
+        # Only the type is checked here, everything else is computed when
+        # the widget asks for it
+        supported = []
+        for prim_path in added:
+            prim = stage.GetPrimAtPath(prim_path)
+            if prim and (prim.IsA(UsdLux.Light) or prim.IsA(UsdGeom.Imageable)):
+                supported.append(prim_path)
+
+        self._selection.update(supported, removed, delta.primary)
+        self._paths = list(self._selection.paths)
+        self._current_path = self._selection.primary
+        if not self._paths:
             self._prim = None
+            self._interest = PathSet()
+            self._item_changed(self.position)
+            # Stop listening to the changes, we don't need to update anything
+            self._stage_listener = None
             return
 
-        self._prim = prim
-        self._current_path = prim_paths[0]
+        self._prim = self._selection.prim(self._current_path)
 
-        # Add a Tf.Notice listener to update the position
+        # Listen to the changes of the selected prims to update the position.
+        # Only the delta is applied to the PathSet.
+        self._interest.difference_update(removed)
+        self._interest.update(supported)
         if not self._stage_listener:
-            self._stage_listener = Tf.Notice.Register(Usd.Notice.ObjectsChanged, self._notice_changed, stage)
-
-        (old_scale, old_rotation_euler, old_rotation_order, old_translation) = omni.usd.get_local_transform_SRT(prim)
+            self._stage_listener = self._notice_hub.subscribe_objects_changed(
+                self._notice_changed, self._interest, name="Widget Info"
+            )
+        else:
+            self._stage_listener.set_paths(self._interest)
 
         # Position is changed
         self._item_changed(self.position)
 
     def _get_position(self):
         """Returns position of currently selected object"""
-        stage = self._get_context().get_stage()
-        if not stage or not self._current_path:
+        return self.get_position(self._current_path)
+
+    def get_position(self, path: str):
+        """Returns position of the selected object"""
+        if path not in self._selection:
             return [0, 0, 0]
 
-        # Get position directly from USD
-        prim = stage.GetPrimAtPath(self._current_path)
-        box_cache = UsdGeom.BBoxCache(Usd.TimeCode.Default(), includedPurposes=[UsdGeom.Tokens.default_])
-        bound = box_cache.ComputeWorldBound(prim)
-        range = bound.ComputeAlignedBox()
+        # Get position directly from USD. The authored extent is used when
+        # it's available, so it works with unloaded payloads. It's kept
+        # until the prim is changed.
+        range = self._selection.world_range(path)
+        if range is None:
+            return [0, 0, 0]
         bboxMin = range.GetMin()
         bboxMax = range.GetMax()
 
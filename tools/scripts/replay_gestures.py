@@ -0,0 +1,91 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+"""
+Replays a gesture recording of the samples without the mouse and the
+viewport, and prints what it did. Record it in Kit with:
+
+    from omni.example.ui_scene.common import start_gesture_recording, stop_gesture_recording
+    start_gesture_recording()
+    # drag the light, the slider or the widget
+    stop_gesture_recording().save("drag.json")
+
+The stage has to be saved before recording, it's opened from its URL. Then
+replay it with the samples that are recorded:
+
+    app/kit/kit --ext-folder exts --enable omni.example.ui_scene.light_manipulator --no-window
+        --exec "tools/scripts/replay_gestures.py drag.json report.json"
+
+The report is written to the second file when it's given. The replay sends
+the events on the frames they were recorded, so the numbers of the writes
+and the rebuilds are the same on every run, and the time can be compared.
+"""
+import asyncio
+import json
+import sys
+
+from omni.example.ui_scene.common import GestureRecording
+from omni.example.ui_scene.common import GestureReplayer
+from omni.ui import scene as sc
+import omni.kit.app
+import omni.ui as ui
+
+
+def _create_manipulators(gestures):
+    """Creates the manipulators of the recorded gestures, returns the replay targets"""
+    targets = {}
+    if "light_manipulator.drag" in gestures:
+        from omni.example.ui_scene.light_manipulator import LightManipulator
+        from omni.example.ui_scene.light_manipulator import LightModel
+
+        targets["light_manipulator.drag"] = LightManipulator(model=LightModel()).replay_gesture
+    if "slider_manipulator.arc" in gestures:
+        from omni.example.ui_scene.slider_manipulator.slider_manipulator import SliderManipulator
+        from omni.example.ui_scene.slider_manipulator.slider_model import SliderModel
+        from omni.example.ui_scene.slider_manipulator.slider_registry import SliderChangedGesture
+
+        manipulator = SliderManipulator(model=SliderModel(), gesture=SliderChangedGesture())
+        targets["slider_manipulator.arc"] = manipulator.replay_gesture
+    if "widget_info.slider" in gestures:
+        from omni.example.ui_scene.widget_info.widget_info_manipulator import WidgetInfoManipulator
+        from omni.example.ui_scene.widget_info.widget_info_model import WidgetInfoModel
+
+        targets["widget_info.slider"] = WidgetInfoManipulator(model=WidgetInfoModel()).replay_gesture
+    return targets
+
+
+async def main(recording_path, report_path=None):
+    recording = GestureRecording.load(recording_path)
+    gestures = {event.gesture for event in recording.events}
+
+    # The manipulators only need a SceneView, the rays of the recording are
+    # in the world space
+    window = ui.Window("Gesture Replay", width=512, height=512)
+    with window.frame:
+        scene_view = sc.SceneView()
+        with scene_view.scene:
+            targets = _create_manipulators(gestures)
+
+    report = await GestureReplayer(recording, targets).replay()
+    data = report.to_dict()
+    for name, value in data.items():
+        if name != "calls":
+            print(f"{name:<20}{value:>12.2f}" if isinstance(value, float) else f"{name:<20}{value:>12}")
+    if report_path:
+        with open(report_path, "w") as f:
+            json.dump(data, f, indent=2)
+
+    window.destroy()
+    omni.kit.app.get_app().post_quit()
+
+
+if len(sys.argv) < 2:
+    print("Usage: replay_gestures.py <recording.json> [report.json]")
+    omni.kit.app.get_app().post_quit()
+else:
+    asyncio.ensure_future(main(*sys.argv[1:3]))
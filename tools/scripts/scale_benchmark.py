@@ -0,0 +1,573 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+"""
+Measures the models of the samples on synthetic stages of increasing size.
+Every stage has a hierarchy of Xforms, meshes with the bound materials,
+RectLights, instanceable references and a PointInstancer. Run it in Kit with
+all the samples:
+
+    app/kit/kit --ext-folder exts --no-window
+        --enable omni.example.ui_scene.object_info --enable omni.example.ui_scene.widget_info
+        --enable omni.example.ui_scene.light_manipulator --enable omni.example.ui_scene.slider_manipulator
+        --exec "tools/scripts/scale_benchmark.py --output scale.json"
+
+The stages have 10k, 100k and 1M prims by default, `--sizes 10000,50000`
+makes it shorter. For every stage it measures the time from setting the
+selection to the models getting it, the cost of the selection and the notices
+in every model, the bounds of the scene query, the position the manipulators
+ask for, and `on_build` of the manipulators. The result is written as JSON.
+
+The models are timed on their own instances, the models the samples create
+when a prim is selected are not counted, and the instrumentation stays as it's
+set.
+
+With `--baseline scale.json` the result is compared with a previous one. The
+times that are slower by more than `--threshold` are printed, and Kit quits
+with 1, so it can run before a release:
+
+    --exec "tools/scripts/scale_benchmark.py --output new.json --baseline scale.json --threshold 0.2"
+"""
+import argparse
+import asyncio
+import json
+import math
+import sys
+import time
+import traceback
+
+from omni.example.ui_scene.common import get_scene_query
+from omni.example.ui_scene.common import snapshot_build
+from pxr import Gf
+from pxr import Sdf
+from pxr import Vt
+import carb
+import omni.kit.app
+import omni.usd
+
+# The version of the JSON file
+FORMAT_VERSION = 1
+
+ROOT = "/Bench"
+PROTOTYPE = "/Prototypes/Cube"
+INSTANCER = f"{ROOT}/Instancer"
+TRANSLATE = "xformOp:translate"
+
+# Every LIGHT_EVERY leaf is a RectLight, every INSTANCE_EVERY leaf is an
+# instance of PROTOTYPE, the rest are meshes
+LIGHT_EVERY = 100
+INSTANCE_EVERY = 10
+MATERIAL_COUNT = 16
+LEAF_TYPES = {"Light": "RectLight", "Instance": "Xform", "Mesh": "Mesh"}
+
+# The times below it are noise and are not compared
+NOISE_MS = 0.05
+
+# The entry points of the models that are timed
+SELECTION = "_on_kit_selection_changed"
+NOTICE = "_notice_changed"
+
+_CUBE_POINTS = Vt.Vec3fArray([Gf.Vec3f(x, y, z) for x in (-1, 1) for y in (-1, 1) for z in (-1, 1)])
+_CUBE_COUNTS = Vt.IntArray([4] * 6)
+_CUBE_INDICES = Vt.IntArray([0, 1, 3, 2, 4, 6, 7, 5, 0, 4, 5, 1, 2, 3, 7, 6, 0, 2, 6, 4, 1, 5, 7, 3])
+_CUBE_EXTENT = Vt.Vec3fArray([Gf.Vec3f(-1), Gf.Vec3f(1)])
+
+
+def _leaf_kind(index):
+    if index % LIGHT_EVERY == 0:
+        return "Light"
+    if index % INSTANCE_EVERY == 1:
+        return "Instance"
+    return "Mesh"
+
+
+def _group_path(index, depth, fanout):
+    """The Xform the leaf is in, `fanout` leaves per group and `fanout` groups per parent"""
+    parts = []
+    group = index // fanout
+    for _ in range(depth):
+        parts.append(group % fanout)
+        group //= fanout
+    return ROOT + "".join(f"/Group_{part}" for part in reversed(parts))
+
+
+def _leaf_path(index, depth, fanout):
+    return f"{_group_path(index, depth, fanout)}/{_leaf_kind(index)}_{index}"
+
+
+def _find_leaf(start, kind, count):
+    """The index of the first leaf of the kind from `start`"""
+    for index in range(start, count):
+        if _leaf_kind(index) == kind:
+            return index
+    return None
+
+
+def _define(parent, name, type_name, specifier=Sdf.SpecifierDef):
+    return Sdf.PrimSpec(parent, name, specifier, type_name)
+
+
+def _attribute(spec, name, type_name, value, variability=Sdf.VariabilityVarying):
+    attribute = Sdf.AttributeSpec(spec, name, type_name, variability)
+    attribute.default = value
+    return attribute
+
+
+def _translate(spec, position):
+    _attribute(spec, TRANSLATE, Sdf.ValueTypeNames.Double3, Gf.Vec3d(*position))
+    _attribute(spec, "xformOpOrder", Sdf.ValueTypeNames.TokenArray, Vt.TokenArray([TRANSLATE]), Sdf.VariabilityUniform)
+
+
+def _cube(spec):
+    _attribute(spec, "points", Sdf.ValueTypeNames.Point3fArray, _CUBE_POINTS)
+    _attribute(spec, "faceVertexCounts", Sdf.ValueTypeNames.IntArray, _CUBE_COUNTS)
+    _attribute(spec, "faceVertexIndices", Sdf.ValueTypeNames.IntArray, _CUBE_INDICES)
+    _attribute(spec, "extent", Sdf.ValueTypeNames.Float3Array, _CUBE_EXTENT)
+
+
+def _bind_material(spec, material):
+    spec.SetInfo("apiSchemas", Sdf.TokenListOp.Create(prependedItems=["MaterialBindingAPI"]))
+    relationship = Sdf.RelationshipSpec(spec, "material:binding", False)
+    relationship.targetPathList.explicitItems = [material]
+
+
+def generate_stage(layer, count, depth, instances):
+    """
+    Writes the synthetic stage to the layer in a single change block. Returns
+    the number of the prims and the number of the leaves per group.
+    """
+    fanout = max(2, math.ceil(count ** (1.0 / (depth + 1))))
+    prims = 0
+    with Sdf.ChangeBlock():
+        root = _define(layer.pseudoRoot, ROOT[1:], "Xform")
+        looks = _define(root, "Looks", "Scope")
+        materials = [_define(looks, f"Material_{i}", "Material").path for i in range(MATERIAL_COUNT)]
+        prims += 2 + MATERIAL_COUNT
+
+        # The prototype of the instanceable leaves is a class, it's not drawn
+        prototypes = _define(layer.pseudoRoot, "Prototypes", "", Sdf.SpecifierClass)
+        prototype = _define(prototypes, "Cube", "Xform")
+        mesh = _define(prototype, "Mesh", "Mesh")
+        _cube(mesh)
+        _bind_material(mesh, materials[0])
+        prims += 3
+
+        groups = {ROOT: root}
+        for index in range(count):
+            group_path = _group_path(index, depth, fanout)
+            parent = groups.get(group_path)
+            if parent is None:
+                # The groups are created in order, only the missing ancestors
+                path = ROOT
+                parent = root
+                for name in group_path[len(ROOT) + 1:].split("/"):
+                    path = f"{path}/{name}"
+                    if path not in groups:
+                        groups[path] = _define(parent, name, "Xform")
+                        prims += 1
+                    parent = groups[path]
+
+            kind = _leaf_kind(index)
+            leaf = _define(parent, f"{kind}_{index}", LEAF_TYPES[kind])
+            _translate(leaf, ((index % fanout) * 3.0, (index // fanout % fanout) * 3.0, 0.0))
+            if kind == "Light":
+                _attribute(leaf, "inputs:width", Sdf.ValueTypeNames.Float, 2.0)
+                _attribute(leaf, "inputs:height", Sdf.ValueTypeNames.Float, 1.0)
+                _attribute(leaf, "inputs:intensity", Sdf.ValueTypeNames.Float, 1000.0)
+            elif kind == "Instance":
+                leaf.referenceList.Prepend(Sdf.Reference(primPath=PROTOTYPE))
+                leaf.SetInfo("instanceable", True)
+            else:
+                _cube(leaf)
+                _bind_material(leaf, materials[index % MATERIAL_COUNT])
+            prims += 1
+
+        instancer = _define(root, INSTANCER.split("/")[-1], "PointInstancer")
+        instancer_prototypes = _define(instancer, "Prototypes", "Xform")
+        _cube(_define(instancer_prototypes, "Cube", "Mesh"))
+        relationship = Sdf.RelationshipSpec(instancer, "prototypes", False)
+        relationship.targetPathList.explicitItems = [instancer_prototypes.path.AppendChild("Cube")]
+        _attribute(instancer, "protoIndices", Sdf.ValueTypeNames.IntArray, Vt.IntArray(instances))
+        positions = [Gf.Vec3f(i % 100 * 3.0, i // 100 * 3.0, -10.0) for i in range(instances)]
+        _attribute(instancer, "positions", Sdf.ValueTypeNames.Point3fArray, Vt.Vec3fArray(positions))
+        prims += 3
+
+    return prims, fanout
+
+
+def _timed(cls):
+    """
+    A subclass of the model that times its own SELECTION and NOTICE in
+    `bench_calls`: the entry point -> (count, seconds). The subscriptions of
+    the model are made in `__init__`, so they call the timed methods.
+    """
+
+    def wrap(name):
+        method = getattr(cls, name)
+
+        def timed(self, *args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                count, total = self.bench_calls.get(name, (0, 0.0))
+                self.bench_calls[name] = (count + 1, total + time.perf_counter() - start)
+
+        return timed
+
+    def __init__(self, *args, **kwargs):
+        # The models can be called from __init__ with the current selection
+        self.bench_calls = {}
+        cls.__init__(self, *args, **kwargs)
+
+    namespace = {name: wrap(name) for name in (SELECTION, NOTICE)}
+    namespace["__init__"] = __init__
+    return type(f"Timed{cls.__name__}", (cls,), namespace)
+
+
+def _create_models():
+    """The name of the model, the function that creates it and the one that creates its manipulator"""
+    from omni.example.ui_scene.light_manipulator import LightManipulator
+    from omni.example.ui_scene.light_manipulator import LightModel
+    from omni.example.ui_scene.object_info.object_info_manipulator import ObjectInfoManipulator
+    from omni.example.ui_scene.object_info.object_info_model import ObjectInfoModel
+    from omni.example.ui_scene.slider_manipulator.slider_manipulator import SliderManipulator
+    from omni.example.ui_scene.slider_manipulator.slider_model import SliderModel
+    from omni.example.ui_scene.slider_manipulator.slider_registry import SliderChangedGesture
+    from omni.example.ui_scene.widget_info.widget_info_manipulator import WidgetInfoManipulator
+    from omni.example.ui_scene.widget_info.widget_info_model import WidgetInfoModel
+
+    return [
+        (
+            "SliderModel",
+            _timed(SliderModel),
+            lambda m: SliderManipulator(model=m, gesture=SliderChangedGesture()),
+            "position",
+        ),
+        ("LightModel", _timed(LightModel), lambda m: LightManipulator(model=m), "transform"),
+        ("ObjectInfoModel", _timed(ObjectInfoModel), lambda m: ObjectInfoManipulator(model=m), "position"),
+        ("WidgetInfoModel", _timed(WidgetInfoModel), lambda m: WidgetInfoManipulator(model=m), "position"),
+    ]
+
+
+def _destroy(value):
+    destroy = getattr(value, "destroy", None)
+    if destroy:
+        destroy()
+
+
+def _read_stats(models):
+    return {name: dict(model.bench_calls) for name, model, _, _ in models}
+
+
+def _calls(before, after, name, entry_point):
+    """The number of the calls of the entry point of the model and their time in ms between two `_read_stats`"""
+    count, total = after[name].get(entry_point, (0, 0.0))
+    count_before, total_before = before[name].get(entry_point, (0, 0.0))
+    return count - count_before, (total - total_before) * 1000.0
+
+
+def _average(values):
+    return sum(values) / len(values) if values else 0.0
+
+
+class _Stage:
+    """The measurements of a single stage"""
+
+    def __init__(self, count, depth, samples, writes, batch):
+        self.count = count
+        self.depth = depth
+        self._samples = samples
+        self._writes = writes
+        self._batch = batch
+        self.metrics = {}
+        self.models = {}
+        self._fanout = 2
+
+    @property
+    def name(self):
+        return f"{self.count}x{self.depth}"
+
+    def _sample_paths(self):
+        """The lights, the meshes and the instances all over the hierarchy"""
+        paths = []
+        kinds = ("Light", "Mesh", "Instance")
+        for i in range(self._samples):
+            kind = kinds[i % len(kinds)]
+            index = _find_leaf(i * self.count // self._samples, kind, self.count)
+            if index is not None:
+                paths.append((kind, _leaf_path(index, self.depth, self._fanout)))
+        paths.append(("Instancer", INSTANCER))
+        return paths
+
+    async def run(self, instances):
+        app = omni.kit.app.get_app()
+        context = omni.usd.get_context()
+        await context.new_stage_async()
+        stage = context.get_stage()
+        layer = stage.GetRootLayer()
+
+        start = time.perf_counter()
+        prims, self._fanout = generate_stage(layer, self.count, self.depth, instances)
+        self.metrics["generate_ms"] = (time.perf_counter() - start) * 1000.0
+        self.metrics["prims"] = prims
+        for _ in range(3):
+            await app.next_update_async()
+
+        query = get_scene_query()
+        query.clear()
+        models = []
+        for name, create_model, create_manipulator, item in _create_models():
+            start = time.perf_counter()
+            model = create_model()
+            self.models[name] = {"create_ms": (time.perf_counter() - start) * 1000.0}
+            models.append((name, model, create_manipulator, getattr(model, item)))
+        await app.next_update_async()
+
+        try:
+            await self._measure_selection(models)
+            self._measure_bounds(query)
+            await self._measure_notices(models, layer)
+        finally:
+            context.get_selection().clear_selected_prim_paths()
+            for _, model, _, _ in models:
+                _destroy(model)
+            query.clear()
+        return self
+
+    async def _measure_selection(self, models):
+        app = omni.kit.app.get_app()
+        selection = omni.usd.get_context().get_selection()
+        latencies = []
+        frames = []
+        positions = {name: [] for name, _, _, _ in models}
+        rebuilds = {name: [] for name, _, _, _ in models}
+        before = _read_stats(models)
+
+        for kind, path in self._sample_paths():
+            stats = _read_stats(models)
+            start = time.perf_counter()
+            selection.set_selected_prim_paths([path], True)
+            # The adapter delivers the selection on the next frames
+            for frame in range(1, 11):
+                await app.next_update_async()
+                after = _read_stats(models)
+                if all(_calls(stats, after, name, SELECTION)[0] for name, _, _, _ in models):
+                    break
+            latencies.append((time.perf_counter() - start) * 1000.0)
+            frames.append(frame)
+
+            for name, model, create_manipulator, item in models:
+                if name == "LightModel" and kind != "Light":
+                    # It only shows the lights
+                    continue
+                # The cold position, the bounds are computed again
+                get_scene_query().clear()
+                start = time.perf_counter()
+                model.get_as_floats(item)
+                positions[name].append((time.perf_counter() - start) * 1000.0)
+
+                # The manipulator only lives for the build, it's not in a scene
+                manipulator = create_manipulator(model)
+                rebuilds[name].append(snapshot_build(manipulator).build_time * 1000.0)
+                _destroy(manipulator)
+
+        after = _read_stats(models)
+        self.metrics["selection_latency_ms"] = _average(latencies)
+        self.metrics["selection_frames"] = _average(frames)
+        for name, _, _, _ in models:
+            count, total = _calls(before, after, name, SELECTION)
+            self.models[name]["selection_ms"] = total / count if count else 0.0
+            self.models[name]["position_ms"] = _average(positions[name])
+            self.models[name]["rebuild_ms"] = _average(rebuilds[name])
+
+    def _measure_bounds(self, query):
+        paths = [path for _, path in self._sample_paths()]
+        query.clear()
+        start = time.perf_counter()
+        for path in paths:
+            query.world_bound(path)
+        self.metrics["bound_cold_ms"] = (time.perf_counter() - start) * 1000.0 / len(paths)
+
+        start = time.perf_counter()
+        for path in paths:
+            query.world_bound(path)
+        self.metrics["bound_warm_ms"] = (time.perf_counter() - start) * 1000.0 / len(paths)
+
+        # The bound of the whole hierarchy
+        start = time.perf_counter()
+        query.world_bound(ROOT)
+        self.metrics["bound_stage_ms"] = (time.perf_counter() - start) * 1000.0
+
+    async def _measure_notices(self, models, layer):
+        """
+        All the models track a light. Every write moves the light, and every
+        batch moves the prims no model tracks, so the hub filters them.
+        """
+        app = omni.kit.app.get_app()
+        light = _leaf_path(0, self.depth, self._fanout)
+        omni.usd.get_context().get_selection().set_selected_prim_paths([light], True)
+        for _ in range(3):
+            await app.next_update_async()
+
+        attribute = layer.GetAttributeAtPath(Sdf.Path(light).AppendProperty(TRANSLATE))
+        step = max(1, self.count // max(1, self._batch))
+        others = [
+            layer.GetAttributeAtPath(Sdf.Path(_leaf_path(index, self.depth, self._fanout)).AppendProperty(TRANSLATE))
+            for index in range(1, self.count, step)
+        ][: self._batch]
+
+        write_time = 0.0
+        batch_time = 0.0
+        changed_paths = 0
+        before = _read_stats(models)
+        for i in range(self._writes):
+            start = time.perf_counter()
+            attribute.default = Gf.Vec3d(i * 0.1, 0.0, 0.0)
+            write_time += time.perf_counter() - start
+            changed_paths += 1
+
+            start = time.perf_counter()
+            with Sdf.ChangeBlock():
+                for other in others:
+                    other.default = Gf.Vec3d(i * 0.1, 1.0, 0.0)
+            batch_time += time.perf_counter() - start
+            changed_paths += len(others)
+
+            # The models update the manipulators between the frames
+            await app.next_update_async()
+        after = _read_stats(models)
+
+        self.metrics["notice_write_ms"] = write_time * 1000.0 / self._writes if self._writes else 0.0
+        self.metrics["notice_batch_ms"] = batch_time * 1000.0 / self._writes if self._writes else 0.0
+        total = write_time + batch_time
+        self.metrics["changed_paths_per_second"] = changed_paths / total if total else 0.0
+        for name, _, _, _ in models:
+            count, total = _calls(before, after, name, NOTICE)
+            self.models[name]["notice_ms"] = total / count if count else 0.0
+            self.models[name]["notices"] = count
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "count": self.count,
+            "depth": self.depth,
+            "metrics": self.metrics,
+            "models": self.models,
+        }
+
+
+def _flatten(result):
+    """The stage/model/metric name to the value"""
+    values = {}
+    for stage in result["stages"]:
+        for metric, value in stage["metrics"].items():
+            values[f"{stage['name']}/{metric}"] = value
+        for model, metrics in stage["models"].items():
+            for metric, value in metrics.items():
+                values[f"{stage['name']}/{model}/{metric}"] = value
+    return values
+
+
+def compare(result, baseline, threshold):
+    """
+    The regressions as (name, baseline, current). The times are regressed
+    when they are slower by more than `threshold`, the throughput when it's
+    lower. The counts are not compared.
+    """
+    current = _flatten(result)
+    regressions = []
+    for name, old in sorted(_flatten(baseline).items()):
+        new = current.get(name)
+        if new is None:
+            continue
+        if name.endswith("_ms"):
+            if new > old * (1.0 + threshold) and new - old > NOISE_MS:
+                regressions.append((name, old, new))
+        elif name.endswith("_per_second"):
+            if new * (1.0 + threshold) < old:
+                regressions.append((name, old, new))
+    return regressions
+
+
+def _print(result):
+    for stage in result["stages"]:
+        print(f"{stage['name']}: {stage['metrics']['prims']} prims")
+        for metric, value in stage["metrics"].items():
+            print(f"    {metric:<30}{value:>14.3f}")
+        print(f"    {'':<20}" + "".join(f"{name:>18}" for name in stage["models"]))
+        models = list(stage["models"].values())
+        for metric in models[0] if models else {}:
+            print(f"    {metric:<20}" + "".join(f"{values.get(metric, 0):>18.3f}" for values in models))
+
+
+async def _run(args) -> int:
+    """Measures the stages and returns the exit code"""
+    stages = []
+    for count in args.sizes:
+        stage = _Stage(count, args.depth, args.samples, args.writes, args.batch)
+        await stage.run(args.instances if args.instances >= 0 else count // 10)
+        stages.append(stage.to_dict())
+        print(f"{stage.name} is measured")
+
+    result = {
+        "version": FORMAT_VERSION,
+        "settings": {"depth": args.depth, "samples": args.samples, "writes": args.writes, "batch": args.batch},
+        "stages": stages,
+    }
+    _print(result)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(result, f, indent=1)
+
+    return_code = 0
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline.get("version") != FORMAT_VERSION:
+            raise ValueError(f"{args.baseline} has the version {baseline.get('version')}, {FORMAT_VERSION} is expected")
+        regressions = compare(result, baseline, args.threshold)
+        for name, old, new in regressions:
+            print(f"Regression: {name:<50}{old:>12.3f} -> {new:>12.3f}")
+        print(f"{len(regressions)} regressions over {args.threshold * 100:.0f}% from {args.baseline}")
+        return_code = 1 if regressions else 0
+    return return_code
+
+
+async def main(args):
+    try:
+        return_code = await _run(args)
+    except Exception:
+        # Kit quits with 1, so a failed run is not taken for a clean one
+        carb.log_error(f"scale_benchmark.py failed:\n{traceback.format_exc()}")
+        return_code = 1
+    omni.kit.app.get_app().post_quit(return_code)
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(prog="scale_benchmark.py")
+    parser.add_argument(
+        "--sizes",
+        type=lambda value: [int(size) for size in value.split(",")],
+        default=[10000, 100000, 1000000],
+        help="the number of the leaf prims of the stages, separated by commas",
+    )
+    parser.add_argument("--depth", type=int, default=4, help="the levels of the Xforms above the leaves")
+    parser.add_argument(
+        "--instances", type=int, default=-1, help="the instances of the PointInstancer, 10%% of the leaves by default"
+    )
+    parser.add_argument("--samples", type=int, default=12, help="the prims that are selected one by one")
+    parser.add_argument("--writes", type=int, default=30, help="the writes to the selected light")
+    parser.add_argument("--batch", type=int, default=1000, help="the prims that are moved with every write")
+    parser.add_argument("--output", help="the JSON file of the result")
+    parser.add_argument("--baseline", help="the JSON file of a previous result to compare with")
+    parser.add_argument("--threshold", type=float, default=0.2, help="the slowdown that is a regression")
+    return parser.parse_args(argv)
+
+
+asyncio.ensure_future(main(_parse_args(sys.argv[1:])))
@@ -0,0 +1,100 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+#
+"""
+Measures the import and the `on_startup` time of the sample extensions. Run it
+in Kit with the samples registered but not enabled:
+
+    app/kit/kit --ext-folder exts --enable omni.kit.viewport.window --exec tools/scripts/startup_benchmark.py
+
+The dependencies of the samples are enabled first, so only the samples are
+measured. Python caches the modules, so every run measures one import. Run it
+a few times before and after a change and compare the tables.
+"""
+import importlib
+import sys
+import time
+
+import omni.ext
+import omni.kit.app
+
+EXTENSIONS = [
+    "omni.example.ui_scene.common",
+    "omni.example.ui_scene.object_info",
+    "omni.example.ui_scene.widget_info",
+    "omni.example.ui_scene.light_manipulator",
+    "omni.example.ui_scene.slider_manipulator",
+]
+
+
+def _find_ext_id(manager, name):
+    for ext in manager.get_extensions():
+        if ext["name"] == name:
+            return ext["id"]
+    return None
+
+
+def _enable_dependencies(manager, ext_id):
+    """Enables what the sample depends on, but not the sample or the other samples"""
+    dependencies = manager.get_extension_dict(ext_id).get("dependencies", {})
+    for name in dependencies:
+        if not name.startswith("omni.example.ui_scene."):
+            manager.set_extension_enabled_immediate(name, True)
+
+
+def _find_ext_class(module):
+    for value in vars(module).values():
+        if isinstance(value, type) and issubclass(value, omni.ext.IExt) and value is not omni.ext.IExt:
+            return value
+    return None
+
+
+def measure(name):
+    """Returns the import time, the `on_startup` time in ms and the number of the imported modules"""
+    manager = omni.kit.app.get_app().get_extension_manager()
+    ext_id = _find_ext_id(manager, name)
+    if not ext_id:
+        raise RuntimeError(f"{name} is not found, run Kit with --ext-folder exts")
+    _enable_dependencies(manager, ext_id)
+    path = manager.get_extension_path(ext_id)
+    if path not in sys.path:
+        sys.path.append(path)
+
+    modules = len(sys.modules)
+    start = time.perf_counter()
+    module = importlib.import_module(name)
+    import_time = (time.perf_counter() - start) * 1000.0
+    modules = len(sys.modules) - modules
+
+    startup_time = 0.0
+    ext_class = _find_ext_class(module)
+    if ext_class:
+        ext = ext_class()
+        start = time.perf_counter()
+        ext.on_startup(ext_id)
+        startup_time = (time.perf_counter() - start) * 1000.0
+        ext.on_shutdown()
+
+    return import_time, startup_time, modules
+
+
+def main():
+    rows = []
+    for name in EXTENSIONS:
+        if name in sys.modules:
+            print(f"{name} is already imported, it's skipped. Don't enable the samples.")
+            continue
+        rows.append((name,) + measure(name))
+
+    print(f"{'Extension':<45}{'import, ms':>12}{'on_startup, ms':>16}{'modules':>10}")
+    for name, import_time, startup_time, modules in rows:
+        print(f"{name:<45}{import_time:>12.2f}{startup_time:>16.2f}{modules:>10}")
+
+
+main()
+omni.kit.app.get_app().post_quit()